@@ -7,10 +7,9 @@
 from openvino.frontend.pytorch.py_pytorch_frontend import _FrontEndPytorchDecoder as Decoder
 from openvino.frontend.pytorch.py_pytorch_frontend import _Type as DecoderType
 from openvino.runtime import op, PartialShape, Type as OVType, OVAny, Shape
-from openvino.frontend.pytorch.utils import maybe_convert_max_int, make_constant, fetch_attr, pt_to_ov_type_map, ov_to_c_type_map
+from openvino.frontend.pytorch.utils import maybe_convert_max_int, make_constant, fetch_attr, pt_to_ov_type_map, torch_tensor_to_ov_const
 
 import torch
-import ctypes
 
 class TorchFXPythonDecoder (Decoder):
 
@@ -243,12 +242,7 @@ class TorchFXPythonDecoder (Decoder):
         if self.pt_module.op == 'get_attr':
             # Extract Constant from FX module field
             ret = fetch_attr(self.fx_gm, self.pt_module.target)
-            ovshape = PartialShape(ret.size())
-            ovtype = pt_to_ov_type_map[str(ret.type())]
-            c_type = ctypes.POINTER(ov_to_c_type_map[ovtype])
-            data_c_ptr = ctypes.cast(ret.data_ptr(), c_type)
-            ov_const = op.Constant(ovtype, ovshape.get_shape(), data_c_ptr[:ret.nelement()])
-            return ov_const.outputs()
+            return torch_tensor_to_ov_const(ret, shared_memory=True).outputs()
 
 
         if not self.get_op_type() == 'prim::Constant':
@@ -281,29 +275,11 @@ class TorchFXPythonDecoder (Decoder):
     def as_constant_tensor(self, pt_value):
         ivalue = pt_value.toIValue()
         if pt_value.isCompleteTensor():
-            try:
-                ivalue = ivalue.to(memory_format=torch.contiguous_format).detach().cpu()
-            except:
-                print("[ WARNING ] Tensor couldn't detach")
-            if str(pt_value.type().dtype()) in pt_to_py_type_map:
+            if str(pt_value.type().dtype()) in pt_to_ov_type_map:
                 # Constant interpretation doesn't respect new-full type of PT
                 # It recognizes only tensors, and give lists as 1D tensors, and scalars as Tensor scalars
                 # So only tensor-type constants are supported
-                ovshape = PartialShape(pt_value.type().sizes())
-                ovtype = pt_to_ov_type_map[str(pt_value.type().dtype())]
-
-                # TODO: try-except here is a temporary WA for issues with data_ptr that we currently cannot predict; provide better solution
-                try:
-                    # this is only possible with adding a new ctor for Constant Python binding
-                    # TODO Check strides and pass them somehow
-                    values = ivalue.data_ptr()
-                    ov_const = make_constant(ovtype, ovshape.get_shape(), values)
-                except:
-                    # old variant that makes a slow data copying
-                    print(f"[ WARNING ] Constant wasn't able to convert from data_ptr.")
-                    values = ivalue.flatten().tolist()
-                    ov_const = make_constant(ovtype, ovshape.get_shape(), values)
-                return ov_const.outputs()
+                return torch_tensor_to_ov_const(ivalue, shared_memory=True).outputs()
         else:
             # Incomplete tensor can be scalar
             if isinstance(ivalue, float):
@@ -315,18 +291,7 @@ class TorchFXPythonDecoder (Decoder):
 
             # TODO: verify that it correctly reads incomplete consts
             if str(ivalue.type()) in pt_to_ov_type_map:
-                try:
-                    ovshape = PartialShape(ivalue.size())
-                    ovtype = pt_to_ov_type_map[str(ivalue.type())]
-                    ov_const = make_constant(ovtype, ovshape.get_shape(), ivalue.data_ptr())
-                except:
-                    # old variant that makes a slow data copying
-                    print(f"[ WARNING ] Constant wasn't able to convert from data_ptr.")
-                    nvalues = ivalue.numpy()
-                    ovtype = np_to_ov_type_map[str(nvalues.dtype)]
-                    ovshape = PartialShape(nvalues.shape)
-                    ov_const = make_constant(ovtype, ovshape.get_shape(), nvalues.flatten().tolist())
-                return ov_const.outputs()
+                return torch_tensor_to_ov_const(ivalue, shared_memory=True).outputs()
         return None
 
     def as_constant_list(self, pt_value):
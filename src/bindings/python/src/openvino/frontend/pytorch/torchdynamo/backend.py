@@ -19,7 +19,10 @@ from openvino.frontend import FrontEndManager
 from openvino.runtime import Core, Type, PartialShape
 from openvino.frontend.pytorch.ts_decoder import TorchScriptPythonDecoder
 from openvino.frontend.pytorch.torchdynamo.partition import Partitioner
-from openvino.frontend.pytorch.torchdynamo.execute import execute
+from openvino.frontend.pytorch.torchdynamo.compile import get_core, get_frontend
+from openvino.frontend.pytorch.torchdynamo.execute import (execute, infer_on_ov, clear_caches, cache_stats,
+                                                            configure_cache, partition_timings, disk_cache_stats,
+                                                            clear_disk_cache)
 
 log = logging.getLogger(__name__)
 
@@ -54,9 +57,8 @@ def ts_openvino(subgraph, example_inputs):
         model.eval()
         fr_model = torch.jit.freeze(model)
 
-        core = Core()
-        fe_manager = FrontEndManager()
-        fe = fe_manager.load_by_framework('pytorch')
+        core = get_core()
+        fe = get_frontend()
         dtype_mapping = {
             torch.float64: Type.f64,
             torch.float32: Type.f32,
@@ -90,14 +92,12 @@ def ts_openvino(subgraph, example_inputs):
                 _call.execute_on_ov = True
             execute_on_ov = getattr(_call, "execute_on_ov")
             if execute_on_ov:
-                ov_inputs = [a.detach().cpu().numpy() for a in args]
                 try:
-                    res = compiled_model(ov_inputs)
+                    result = infer_on_ov(compiled_model, args)
                 except Exception as e:
                     log.debug(f"Failed in OpenVINO execution: {e}")
                     _call.execute_on_ov = False
                     return subgraph.forward(*args)
-                result = [torch.from_numpy(res[out]) for out in compiled_model.outputs]
                 return result
             else:
                 return subgraph.forward(*args)
@@ -109,10 +109,12 @@ def ts_openvino(subgraph, example_inputs):
 
 def fx_openvino(subgraph, example_inputs):
     try:
-        executor_parameters = None
+        executor_parameters = {}
         if os.getenv("OPENVINO_TORCH_MODEL_CACHING") is not None:
             model_hash_str = sha256(subgraph.code.encode('utf-8')).hexdigest()
-            executor_parameters = {"model_hash_str": model_hash_str}
+            executor_parameters["model_hash_str"] = model_hash_str
+        if os.getenv("OPENVINO_TORCH_PARALLEL_COMPILE") is not None:
+            executor_parameters["parallel_compile"] = int(os.getenv("OPENVINO_TORCH_PARALLEL_COMPILE"))
         model = make_fx(subgraph)(*example_inputs)
         with torch.no_grad():
             model.eval()
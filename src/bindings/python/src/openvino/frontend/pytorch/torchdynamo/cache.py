@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+# mypy: ignore-errors
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from hashlib import sha256
+from warnings import warn
+
+import torch
+
+from openvino.runtime import get_version, serialize
+
+
+def _get_env_int(name, default):
+    value = os.getenv(name)
+    return int(value) if value is not None else default
+
+
+def get_cache_root() -> str:
+    cache_root = "./cache/"
+    if os.getenv("OPENVINO_TORCH_CACHE_DIR") is not None:
+        cache_root = os.getenv("OPENVINO_TORCH_CACHE_DIR")
+    return cache_root
+
+
+def graph_hash(gm) -> str:
+    """Hash of the generated code of a torch.fx graph, identifies graph structure."""
+    return sha256(gm.code.encode("utf-8")).hexdigest()
+
+
+def bucket(dim: int):
+    """Map a dimension to the range of powers of two it falls into: 3 -> (3, 4), 100 -> (65, 128)."""
+    if dim <= 2:
+        return (dim, dim)
+    upper = 1 << (dim - 1).bit_length()
+    return (upper // 2 + 1, upper)
+
+
+def model_byte_size(model) -> int:
+    """Approximate memory footprint of a partition as the size of constants of its converted model.
+
+    Must be called before compilation, runtime model of a compiled model has no Constant nodes.
+    """
+    size = 0
+    for node in model.get_ops():
+        if node.get_type_name() == "Constant":
+            element_type = node.get_output_element_type(0)
+            num_elements = 1
+            for dim in node.get_output_shape(0):
+                num_elements *= dim
+            size += num_elements * element_type.bitwidth // 8
+    return size
+
+
+class CompiledModelCache:
+    """LRU cache of compiled partitions bounded by number of entries and by size in bytes.
+
+    Key of an entry consists of graph hash, partition id and input signature.
+    Signature keeps dtype and shape of every input. When dynamic shapes are enabled,
+    dimensions which changed between calls of a partition are replaced in the signature
+    by the bucket they fall into, so one compiled model serves the whole bucket.
+    """
+
+    def __init__(self, max_entries: int = 0, max_bytes: int = 0, dynamic_shapes: bool = False):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.dynamic_shapes = dynamic_shapes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._first_shapes = {}
+        self._dynamic_dims = {}
+        self._lock = threading.RLock()
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compilations = 0
+        self.compile_time = 0.0
+
+    def signature(self, partition_key, args) -> tuple:
+        """Return input signature of a partition call.
+
+        Dimensions are given as ints or as (lower, upper) bucket bounds for dynamic dimensions,
+        the signature can be used directly to set partial shapes of the model inputs.
+        """
+        shapes = tuple(tuple(arg.shape) if isinstance(arg, torch.Tensor) else () for arg in args)
+        dtypes = tuple(arg.dtype if isinstance(arg, torch.Tensor) else type(arg) for arg in args)
+        if not self.dynamic_shapes:
+            return tuple(zip(dtypes, shapes))
+        with self._lock:
+            ranks_key = (partition_key, dtypes, tuple(len(shape) for shape in shapes))
+            first_shapes = self._first_shapes.setdefault(ranks_key, shapes)
+            dynamic_dims = self._dynamic_dims.setdefault(ranks_key, set())
+            for input_idx, (first_shape, shape) in enumerate(zip(first_shapes, shapes)):
+                for dim_idx, (first_dim, dim) in enumerate(zip(first_shape, shape)):
+                    if first_dim != dim:
+                        dynamic_dims.add((input_idx, dim_idx))
+        bucketed = tuple(
+            tuple(bucket(dim) if (input_idx, dim_idx) in dynamic_dims else dim for dim_idx, dim in enumerate(shape))
+            for input_idx, shape in enumerate(shapes)
+        )
+        return tuple(zip(dtypes, bucketed))
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, compiled, nbytes: int = 0, compile_time: float = 0.0):
+        with self._lock:
+            self.compilations += 1
+            self.compile_time += compile_time
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (compiled, nbytes)
+            self._bytes += nbytes
+            self._evict()
+
+    def _evict(self):
+        # The most recently added entry is always kept, even if it alone exceeds the budget
+        while len(self._entries) > 1 and (
+            (self.max_entries and len(self._entries) > self.max_entries) or (self.max_bytes and self._bytes > self.max_bytes)
+        ):
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._bytes -= nbytes
+            self.evictions += 1
+
+    def configure(self, max_entries: int = None, max_bytes: int = None, dynamic_shapes: bool = None):
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            if dynamic_shapes is not None:
+                self.dynamic_shapes = dynamic_shapes
+            self._evict()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "compilations": self.compilations,
+                "compile_time": self.compile_time,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._first_shapes.clear()
+            self._dynamic_dims.clear()
+            self._reset_counters()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+
+compiled_cache = CompiledModelCache(
+    max_entries=_get_env_int("OPENVINO_TORCH_CACHE_MAX_ENTRIES", 0),
+    max_bytes=_get_env_int("OPENVINO_TORCH_CACHE_MAX_BYTES", 0),
+    dynamic_shapes=os.getenv("OPENVINO_TORCH_DYNAMIC_SHAPES") is not None,
+)
+
+
+def _update_with_weights(hasher, gm):
+    for node in gm.graph.nodes:
+        if node.op != "get_attr":
+            continue
+        value = gm
+        for atom in node.target.split("."):
+            value = getattr(value, atom)
+        if not isinstance(value, torch.Tensor):
+            hasher.update(f"{node.target}:{value!r}".encode("utf-8"))
+            continue
+        tensor = value.detach().cpu().contiguous()
+        hasher.update(f"{node.target}:{tensor.dtype}:{tuple(tensor.shape)}".encode("utf-8"))
+        hasher.update(tensor.reshape(-1).view(torch.uint8).numpy())
+
+
+def model_cache_key(gm, args, partial_shapes, device: str, prefix: str = "") -> str:
+    """Key of a converted partition in the on-disk cache.
+
+    Key covers generated code and weights of the graph, types and shapes of inputs,
+    target device and OpenVINO version, so a stale model is never picked up.
+    """
+    hasher = sha256()
+    hasher.update(prefix.encode("utf-8"))
+    hasher.update(gm.code.encode("utf-8"))
+    _update_with_weights(hasher, gm)
+    for idx, arg in enumerate(args):
+        shape = partial_shapes[idx] if partial_shapes is not None else tuple(arg.shape)
+        hasher.update(f"{arg.dtype}:{shape};".encode("utf-8"))
+    hasher.update(device.encode("utf-8"))
+    hasher.update(get_version().encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class ModelDiskCache:
+    """Cache of converted partitions in IR format shared between processes.
+
+    Entries are written to temporary files and renamed, so concurrent readers
+    never see a partially written model. Modification time of an entry is updated
+    on every hit, and when the total size exceeds `max_bytes`, least recently used
+    entries are removed. Counters are kept per process.
+    """
+
+    # Temporary files left by killed processes are removed after this many seconds
+    STALE_TMP_SECONDS = 3600
+
+    def __init__(self, max_bytes: int = 0):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @property
+    def directory(self) -> str:
+        return os.path.join(get_cache_root(), "model")
+
+    def _paths(self, key: str):
+        base = os.path.join(self.directory, key)
+        return base + ".xml", base + ".bin"
+
+    def load(self, key: str, core):
+        """Read a cached model, return None if there is no valid entry for the key."""
+        xml_path, bin_path = self._paths(key)
+        try:
+            model = core.read_model(xml_path, bin_path)
+            now = time.time()
+            os.utime(xml_path, (now, now))
+            os.utime(bin_path, (now, now))
+        except Exception:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return model
+
+    def store(self, key: str, model):
+        xml_path, bin_path = self._paths(key)
+        tmp_base = os.path.join(self.directory, f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            serialize(model, tmp_base + ".xml", tmp_base + ".bin")
+            # Weights are renamed first, a reader which sees the xml file always finds the matching bin file
+            os.replace(tmp_base + ".bin", bin_path)
+            os.replace(tmp_base + ".xml", xml_path)
+        except (OSError, RuntimeError) as error:
+            # Caching is optional, the model is compiled even if it cannot be stored
+            warn(f"Model cannot be stored in cache directory {self.directory}: {error}")
+            return
+        finally:
+            for path in (tmp_base + ".xml", tmp_base + ".bin"):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+        with self._lock:
+            self.writes += 1
+        self.evict()
+
+    def _scan(self):
+        entries = []
+        stale_tmp = []
+        now = time.time()
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return entries, stale_tmp
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if ".tmp." in name:
+                if now - stat.st_mtime > self.STALE_TMP_SECONDS:
+                    stale_tmp.append(path)
+            elif name.endswith(".xml"):
+                bin_path = path[:-len(".xml")] + ".bin"
+                try:
+                    size = stat.st_size + os.stat(bin_path).st_size
+                except FileNotFoundError:
+                    size = stat.st_size
+                entries.append((stat.st_mtime, path, bin_path, size))
+        return entries, stale_tmp
+
+    @staticmethod
+    def _remove(*paths):
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def evict(self):
+        entries, stale_tmp = self._scan()
+        self._remove(*stale_tmp)
+        total = sum(entry[3] for entry in entries)
+        if not self.max_bytes or total <= self.max_bytes:
+            return
+        entries.sort()
+        # The most recently used entry is always kept
+        for _, xml_path, bin_path, size in entries[:-1]:
+            if total <= self.max_bytes:
+                break
+            self._remove(xml_path, bin_path)
+            total -= size
+            with self._lock:
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        entries, _ = self._scan()
+        with self._lock:
+            return {
+                "directory": self.directory,
+                "entries": len(entries),
+                "bytes": sum(entry[3] for entry in entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+            }
+
+    def clear(self):
+        entries, _ = self._scan()
+        for _, xml_path, bin_path, _ in entries:
+            self._remove(xml_path, bin_path)
+        with self._lock:
+            self._reset_counters()
+
+
+model_disk_cache = ModelDiskCache(max_bytes=_get_env_int("OPENVINO_TORCH_MODEL_CACHE_MAX_BYTES", 0))
@@ -6,6 +6,7 @@
 # mypy: ignore-errors
 
 import os
+import threading
 import torch
 import torch.overrides
 
@@ -13,47 +14,59 @@ from torch.fx import GraphModule
 
 from openvino.frontend import FrontEndManager
 from openvino.frontend.pytorch.fx_decoder import TorchFXPythonDecoder
-from openvino.runtime import Core, Type, PartialShape, serialize
+from openvino.frontend.pytorch.torchdynamo.cache import get_cache_root, model_cache_key, model_disk_cache
+from openvino.runtime import Core, Type, PartialShape
 
 from typing import Callable, Optional
 
 
-def openvino_compile(gm: GraphModule, *args, model_hash_str: str = None):
-    core = Core()
+_core = None
+_frontend = None
+_shared_lock = threading.Lock()
+
+
+def get_core() -> Core:
+    """Return Core shared by all partitions compiled in the process."""
+    global _core
+    with _shared_lock:
+        if _core is None:
+            _core = Core()
+        return _core
+
+
+def get_frontend():
+    """Return PyTorch frontend shared by all partitions converted in the process."""
+    global _frontend
+    with _shared_lock:
+        if _frontend is None:
+            _frontend = FrontEndManager().load_by_framework("pytorch")
+        return _frontend
 
-    device = "CPU"
 
+def get_device() -> str:
+    device = "CPU"
     if os.getenv("OPENVINO_TORCH_BACKEND_DEVICE") is not None:
         device = os.getenv("OPENVINO_TORCH_BACKEND_DEVICE")
-        assert device in core.available_devices, "Specified device " + device + " is not in the list of OpenVINO Available Devices"
+        assert device in get_core().available_devices, "Specified device " + device + " is not in the list of OpenVINO Available Devices"
+    return device
+
 
-    file_name = None
-    cache_root = "./cache/"
-    if os.getenv("OPENVINO_TORCH_CACHE_DIR") is not None:
-        cache_root = os.getenv("OPENVINO_TORCH_CACHE_DIR")
+def openvino_convert(gm: GraphModule, *args, model_hash_str: str = None, partial_shapes=None):
+    """Convert a partition to OpenVINO model with element types and shapes of inputs set from args."""
+    om = None
+    cache_key = None
     if model_hash_str is not None:
-        model_cache_dir = cache_root + "/model/"
-        try:
-            os.makedirs(model_cache_dir, exist_ok=True)
-            file_name = model_cache_dir + model_hash_str + "_" + device
-        except OSError as error:
-            print("Cache directory ", cache_root, " cannot be created. Model caching is disabled. Error: ", error)
-            file_name = None
-            model_hash_str = None
-
-    if file_name is not None and os.path.isfile(file_name + ".xml") and os.path.isfile(file_name + ".bin"):
-        om = core.read_model(file_name + ".xml")
-    else:
-        fe_manager = FrontEndManager()
-        fe = fe_manager.load_by_framework("pytorch")
+        cache_key = model_cache_key(gm, args, partial_shapes, get_device(), model_hash_str)
+        om = model_disk_cache.load(cache_key, get_core())
+
+    if om is None:
+        fe = get_frontend()
 
         input_shapes = []
         input_types = []
         for idx, input_data in enumerate(args):  # subgraph.example_inputs):
             input_types.append(input_data.type())
             input_shapes.append(input_data.size())
-            if file_name is not None:
-                file_name += "_" + str(input_data.type()) + str(input_data.size())[11:-1].replace(" ", "")
 
         decoder = TorchFXPythonDecoder(gm, gm, input_shapes=input_shapes, input_types=input_types)
 
@@ -61,8 +74,8 @@ def openvino_compile(gm: GraphModule, *args, model_hash_str: str = None):
 
         om = fe.convert(im)
 
-        if file_name is not None:
-            serialize(om, file_name + ".xml", file_name + ".bin")
+        if cache_key is not None:
+            model_disk_cache.store(cache_key, om)
 
     dtype_mapping = {
         torch.float32: Type.f32,
@@ -77,11 +90,17 @@ def openvino_compile(gm: GraphModule, *args, model_hash_str: str = None):
 
     for idx, input_data in enumerate(args):
         om.inputs[idx].get_node().set_element_type(dtype_mapping[input_data.dtype])
-        om.inputs[idx].get_node().set_partial_shape(PartialShape(list(input_data.shape)))
+        if partial_shapes is not None:
+            om.inputs[idx].get_node().set_partial_shape(partial_shapes[idx])
+        else:
+            om.inputs[idx].get_node().set_partial_shape(PartialShape(list(input_data.shape)))
     om.validate_nodes_and_infer_types()
+    return om
 
-    if model_hash_str is not None:
-        core.set_property({'CACHE_DIR': cache_root + '/blob'})
 
-    compiled = core.compile_model(om, device)
-    return compiled
+def openvino_compile_model(om, model_hash_str: str = None):
+    """Compile converted partition on the configured device, safe to call from several threads."""
+    config = {}
+    if model_hash_str is not None:
+        config["CACHE_DIR"] = get_cache_root() + "/blob"
+    return get_core().compile_model(om, get_device(), config)
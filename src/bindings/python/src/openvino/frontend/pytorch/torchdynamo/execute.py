@@ -4,11 +4,14 @@
 
 # mypy: ignore-errors
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass
 from functools import lru_cache
 from types import MappingProxyType
 from warnings import warn
+from weakref import WeakKeyDictionary
 
 import torch
 import torch.overrides
@@ -19,8 +22,9 @@ from torch.utils._pytree import tree_flatten, tree_map, tree_unflatten
 from openvino.frontend import FrontEndManager
 from openvino.frontend.pytorch.fx_decoder import TorchFXPythonDecoder
 from openvino.frontend.pytorch.torchdynamo.partition import Partitioner
-from openvino.frontend.pytorch.torchdynamo.compile import openvino_compile
-from openvino.runtime import Core, Type, PartialShape
+from openvino.frontend.pytorch.torchdynamo.compile import openvino_convert, openvino_compile_model
+from openvino.frontend.pytorch.torchdynamo.cache import compiled_cache, graph_hash, model_byte_size, model_disk_cache
+from openvino.runtime import Core, Type, PartialShape, Tensor
 
 from typing import Callable, Optional
 
@@ -31,12 +35,13 @@ DEFAULT_OPENVINO_PYTHON_CONFIG = MappingProxyType(
     {
         "use_python_fusion_cache": True,
         "allow_single_op_fusion": True,
+        "parallel_compile": 0,
     },
 )
 
-compiled_cache = {}
 max_openvino_partitions = 0
 partitioned_modules = {}
+compile_timings = {}
 
 
 def execute(
@@ -57,7 +62,79 @@ def execute(
 import numpy as np
 
 
-def openvino_execute(gm: GraphModule, *args, executor_parameters=None, partition_id):
+class _PartitionRunner:
+    """Infer request of a compiled model reused between calls together with its output layout.
+
+    Outputs with static shapes are written by the plugin directly into memory of new numpy arrays,
+    which are returned to PyTorch without a copy. Other outputs are copied from the request.
+    """
+
+    def __init__(self, compiled):
+        self.request = compiled.create_infer_request()
+        self.outputs = []
+        for port in compiled.outputs:
+            if port.get_partial_shape().is_static:
+                self.outputs.append((tuple(port.get_shape()), port.get_element_type().to_dtype()))
+            else:
+                self.outputs.append(None)
+        self.all_static = all(output is not None for output in self.outputs)
+
+
+_partition_runners = WeakKeyDictionary()
+
+
+def _to_ov_input(arg):
+    if isinstance(arg, torch.Tensor):
+        # A view of the tensor memory, for CPU tensors no data is copied
+        return arg.detach().cpu().numpy()
+    return arg
+
+
+def infer_on_ov(compiled, flat_args) -> list:
+    """Run compiled model on torch tensors without copying inputs and static shaped outputs.
+
+    Inputs are shared with the infer request, so the plugin reads memory of torch tensors.
+    Buffers for static shaped outputs are allocated before inference and bound to the request,
+    the returned torch tensors own this memory. A new buffer is allocated on every call,
+    so results of previous calls stay valid.
+
+    :param compiled: Compiled model to run.
+    :type compiled: openvino.runtime.CompiledModel
+    :param flat_args: Flattened inputs of the model.
+    :type flat_args: list
+    :return: List of torch tensors with results.
+    :rtype: list
+    """
+    runner = _partition_runners.get(compiled)
+    if runner is None:
+        runner = _PartitionRunner(compiled)
+        _partition_runners[compiled] = runner
+    request = runner.request
+
+    buffers = [None if output is None else np.empty(*output) for output in runner.outputs]
+    for idx, buffer in enumerate(buffers):
+        if buffer is not None:
+            request.set_output_tensor(idx, Tensor(buffer, shared_memory=True))
+
+    ov_inputs = [_to_ov_input(a) for a in flat_args]
+    if runner.all_static:
+        request.infer(ov_inputs, share_inputs=True, share_outputs=True)
+        return [torch.from_numpy(buffer) for buffer in buffers]
+
+    res = request.infer(ov_inputs, share_inputs=True)
+    return [torch.from_numpy(res[idx] if buffer is None else buffer) for idx, buffer in enumerate(buffers)]
+
+
+def _partition_cache_key(flat_args, partition_id, graph_hash_str):
+    partition_key = (graph_hash_str, partition_id)
+    signature = compiled_cache.signature(partition_key, flat_args)
+    partial_shapes = None
+    if compiled_cache.dynamic_shapes:
+        partial_shapes = [PartialShape(list(shape)) for _, shape in signature]
+    return partition_key + (signature,), partial_shapes
+
+
+def openvino_execute(gm: GraphModule, *args, executor_parameters=None, partition_id, graph_hash_str=None):
 
     executor_parameters = executor_parameters or DEFAULT_OPENVINO_PYTHON_CONFIG
 
@@ -65,24 +142,30 @@ def openvino_execute(gm: GraphModule, *args, executor_parameters=None, partition
         "use_python_fusion_cache",
         DEFAULT_OPENVINO_PYTHON_CONFIG["use_python_fusion_cache"],
     )
-    global compiled_cache
 
     model_hash_str = executor_parameters.get("model_hash_str", None)
     if model_hash_str is not None:
         model_hash_str = model_hash_str + str(partition_id)
 
-    if use_cache and (partition_id in compiled_cache):
-        compiled = compiled_cache[partition_id]
-    else:
-        compiled = openvino_compile(gm, *args, model_hash_str=model_hash_str)
-        compiled_cache[partition_id] = compiled
-
     flat_args, _ = tree_flatten(args)
-    ov_inputs = [a.detach().cpu().numpy() for a in flat_args]
 
-    res = compiled(ov_inputs)
-
-    results1 = [torch.from_numpy(res[out]) for out in compiled.outputs]
+    cache_key, partial_shapes = _partition_cache_key(flat_args, partition_id, graph_hash_str)
+
+    compiled = compiled_cache.get(cache_key) if use_cache else None
+    if compiled is None:
+        timings = compile_timings.setdefault(partition_id, {})
+        start = time.perf_counter()
+        om = openvino_convert(gm, *args, model_hash_str=model_hash_str, partial_shapes=partial_shapes)
+        # Runtime model of a compiled partition has no Constant nodes, size is taken from the converted one
+        nbytes = model_byte_size(om)
+        converted = time.perf_counter()
+        compiled = openvino_compile_model(om, model_hash_str)
+        timings["convert"] = converted - start
+        timings["compile"] = time.perf_counter() - converted
+        if use_cache:
+            compiled_cache.put(cache_key, compiled, nbytes, timings["convert"] + timings["compile"])
+
+    results1 = infer_on_ov(compiled, flat_args)
     if len(results1) == 1:
         return results1[0]
     return results1
@@ -95,6 +178,7 @@ class OpenVINOGraphModule(torch.nn.Module):
         self.partition_id = partition_id
         self.executor_parameters = {"use_python_fusion_cache": use_python_fusion_cache,
                                     "model_hash_str": model_hash_str}
+        self.graph_hash_str = graph_hash(gm)
         self.perm_fallback = False
 
     def __call__(self, *args):
@@ -102,7 +186,8 @@ class OpenVINOGraphModule(torch.nn.Module):
             return self.gm(*args)
 
         try:
-            result = openvino_execute(self.gm, *args, executor_parameters=self.executor_parameters, partition_id=self.partition_id)
+            result = openvino_execute(self.gm, *args, executor_parameters=self.executor_parameters,
+                                      partition_id=self.partition_id, graph_hash_str=self.graph_hash_str)
         except Exception:
             self.perm_fallback = True
             return self.gm(*args)
@@ -130,6 +215,72 @@ def partition_graph(gm: GraphModule, use_python_fusion_cache: bool, model_hash_s
     return gm
 
 
+class _PartitionInputsRecorder(torch.fx.Interpreter):
+    """Runs partitioned graph with PyTorch and records inputs of every OpenVINO partition."""
+
+    def __init__(self, gm):
+        super().__init__(gm)
+        self.partition_inputs = []
+
+    def call_module(self, target, args, kwargs):
+        submodule = self.fetch_attr(target)
+        if isinstance(submodule, OpenVINOGraphModule):
+            self.partition_inputs.append((submodule, args))
+            return submodule.gm(*args, **kwargs)
+        return super().call_module(target, args, kwargs)
+
+
+def compile_partitions(gm: GraphModule, *args, max_workers: int = None):
+    """Convert and compile all OpenVINO partitions of a partitioned graph at once.
+
+    Inputs of partitions are obtained by running the graph with PyTorch once. Partitions are
+    converted one by one, as conversion needs the GIL, and then compiled in a thread pool,
+    as compilation releases it. Compiled models are put to the compiled partitions cache,
+    partitions which fail to convert or compile are left to be compiled on their first call.
+
+    :param gm: Graph with fused submodules replaced by OpenVINOGraphModule.
+    :param args: Inputs of the graph.
+    :param max_workers: Number of compilation threads, by default chosen by ThreadPoolExecutor.
+    """
+    recorder = _PartitionInputsRecorder(gm)
+    with torch.no_grad():
+        recorder.run(*args)
+
+    jobs = []
+    for submodule, partition_args in recorder.partition_inputs:
+        flat_args, _ = tree_flatten(partition_args)
+        cache_key, partial_shapes = _partition_cache_key(flat_args, submodule.partition_id, submodule.graph_hash_str)
+        if cache_key in compiled_cache or any(job[1] == cache_key for job in jobs):
+            continue
+        model_hash_str = submodule.executor_parameters.get("model_hash_str", None)
+        if model_hash_str is not None:
+            model_hash_str = model_hash_str + str(submodule.partition_id)
+        timings = compile_timings.setdefault(submodule.partition_id, {})
+        start = time.perf_counter()
+        try:
+            om = openvino_convert(submodule.gm, *partition_args, model_hash_str=model_hash_str, partial_shapes=partial_shapes)
+        except Exception:
+            continue
+        timings["convert"] = time.perf_counter() - start
+        jobs.append((om, cache_key, model_hash_str, timings, model_byte_size(om)))
+
+    def compile_job(job):
+        om, _, model_hash_str, timings, _ = job
+        start = time.perf_counter()
+        compiled = openvino_compile_model(om, model_hash_str)
+        timings["compile"] = time.perf_counter() - start
+        return compiled
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(compile_job, job) for job in jobs]
+        for (_, cache_key, _, timings, nbytes), future in zip(jobs, futures):
+            try:
+                compiled = future.result()
+            except Exception:
+                continue
+            compiled_cache.put(cache_key, compiled, nbytes, timings["convert"] + timings["compile"])
+
+
 def openvino_execute_partitioned(gm: GraphModule, *args, executor_parameters=None):
     executor_parameters = executor_parameters or DEFAULT_OPENVINO_PYTHON_CONFIG
 
@@ -141,22 +292,74 @@ def openvino_execute_partitioned(gm: GraphModule, *args, executor_parameters=Non
     )
     model_hash_str = executor_parameters.get("model_hash_str", None)
 
-    signature = str(id(gm))
-    for idx, input_data in enumerate(args):
-        if isinstance(input_data, torch.Tensor):
-            signature = signature + "_" + str(idx) + ":" + str(input_data.type())[6:] + ":" + str(input_data.size())[11:-1].replace(" ", "")
-        else:
-            signature = signature + "_" + str(idx) + ":" + type(input_data).__name__ + ":val(" + str(input_data) + ")"
+    # Partitioning does not depend on inputs, fused submodules are replaced in place
+    # only once per graph. Input shapes and dtypes are handled by the compiled cache.
+    parallel_compile = executor_parameters.get("parallel_compile", DEFAULT_OPENVINO_PYTHON_CONFIG["parallel_compile"])
 
+    signature = id(gm)
     if signature not in partitioned_modules:
         partitioned_modules[signature] = partition_graph(gm, use_python_fusion_cache=use_python_fusion_cache,
                                                          model_hash_str=model_hash_str)
+        if parallel_compile and use_python_fusion_cache:
+            compile_partitions(partitioned_modules[signature], *args, max_workers=parallel_compile)
     return partitioned_modules[signature](*args)
 
 
+def cache_stats() -> dict:
+    """Return counters of the compiled partitions cache.
+
+    :return: Number of entries and their approximate size in bytes, numbers of hits, misses,
+             evictions and compilations, and total compilation time in seconds.
+    :rtype: dict
+    """
+    return compiled_cache.stats()
+
+
+def configure_cache(max_entries: int = None, max_bytes: int = None, dynamic_shapes: bool = None):
+    """Set limits of the compiled partitions cache, 0 means no limit.
+
+    Defaults are taken from OPENVINO_TORCH_CACHE_MAX_ENTRIES, OPENVINO_TORCH_CACHE_MAX_BYTES
+    and OPENVINO_TORCH_DYNAMIC_SHAPES environment variables.
+    """
+    compiled_cache.configure(max_entries=max_entries, max_bytes=max_bytes, dynamic_shapes=dynamic_shapes)
+
+
+def disk_cache_stats() -> dict:
+    """Return state of the on-disk cache of converted partitions.
+
+    The cache is enabled by OPENVINO_TORCH_MODEL_CACHING environment variable, it is located
+    in OPENVINO_TORCH_CACHE_DIR and its size is limited by OPENVINO_TORCH_MODEL_CACHE_MAX_BYTES.
+
+    :return: Cache directory, number of entries and their size in bytes, and numbers of hits,
+             misses, writes and evictions made by this process.
+    :rtype: dict
+    """
+    return model_disk_cache.stats()
+
+
+def clear_disk_cache():
+    """Remove all entries of the on-disk cache of converted partitions.
+
+    Unlike clear_caches, which drops in-memory state together with torch._dynamo.reset(),
+    this removes models shared with other processes using the same cache directory.
+    """
+    model_disk_cache.clear()
+
+
+def partition_timings() -> dict:
+    """Return durations of the last conversion and compilation of every partition.
+
+    :return: Dictionary mapping partition id to a dictionary with "convert" and "compile"
+             durations in seconds.
+    :rtype: dict
+    """
+    return {partition_id: dict(timings) for partition_id, timings in compile_timings.items()}
+
+
 def clear_caches():
     global partitioned_modules
-    global compiled_cache
 
     compiled_cache.clear()
     partitioned_modules.clear()
+    _partition_runners.clear()
+    compile_timings.clear()
@@ -7,7 +7,7 @@
 from openvino.frontend.pytorch.py_pytorch_frontend import _FrontEndPytorchDecoder as Decoder
 from openvino.frontend.pytorch.py_pytorch_frontend import _Type as DecoderType
 from openvino.runtime import op, PartialShape, Type as OVType, OVAny
-from openvino.frontend.pytorch.utils import ivalue_to_constant, get_value_from_getattr, pt_to_ov_type_map
+from openvino.frontend.pytorch.utils import ivalue_to_constant, get_value_from_getattr, pt_to_ov_type_map, MMapWeights
 from openvino.runtime import opset11 as ops
 
 import typing
@@ -29,11 +29,22 @@ class ModelWrapper(torch.nn.Module):
 
 
 class TorchScriptPythonDecoder (Decoder):
-    def __init__(self, pt_module, graph_element=None, example_input=None, alias_db=None):
+    def __init__(self, pt_module, graph_element=None, example_input=None, alias_db=None, mmap_weights=None):
+        """
+        mmap_weights enables conversion with low peak memory: the model is not frozen, parameters and
+        buffers are written to a file before conversion, and the file is memory-mapped and referenced
+        by the resulting model. It can be True to use a temporary file, a path to the file,
+        or MMapWeights object.
+        """
         Decoder.__init__(self)
         # We store every decoder created by this decoder so that all them are not deleted until the first decoder is deleted
         self.m_decoders = []
         self._input_signature = None
+        if mmap_weights is True:
+            mmap_weights = MMapWeights()
+        elif isinstance(mmap_weights, str):
+            mmap_weights = MMapWeights(mmap_weights)
+        self._mmap_weights = mmap_weights or None
         if graph_element is None:
             try:
                 pt_module = self._get_scripted_model(pt_module, example_input)
@@ -56,6 +67,9 @@ class TorchScriptPythonDecoder (Decoder):
             self.graph_element = graph_element
             self.alias_db = alias_db
         self.pt_module = pt_module
+        if self._mmap_weights is not None and graph_element is None:
+            # All weights are written before conversion, so the file is mapped only once
+            self._mmap_weights.write(list(pt_module.parameters()) + list(pt_module.buffers()))
         self.raw_inputs = list(self.graph_element.inputs())
         self.raw_outputs = list(self.graph_element.outputs())
         if self._input_signature is not None and "self" in self.raw_inputs[0].debugName():
@@ -170,6 +184,9 @@ class TorchScriptPythonDecoder (Decoder):
                             # do not freeze models with compressed constants
                             skip_freeze = True
                             break
+            if self._mmap_weights is not None:
+                # Parameters stay module attributes and are converted one by one in try_decode_get_attr
+                skip_freeze = True
             if not skip_freeze:
                 preserved_attrs = self._get_preserved_attributes(scripted)
                 f_model = torch.jit.freeze(scripted, preserved_attrs=preserved_attrs)
@@ -276,7 +293,7 @@ class TorchScriptPythonDecoder (Decoder):
     def visit_subgraph(self, node_visitor) -> None:
         # make sure topological order is satisfied
         for node in self.graph_element.nodes():
-            decoder = TorchScriptPythonDecoder(self.pt_module, node, alias_db=self.alias_db)
+            decoder = TorchScriptPythonDecoder(self.pt_module, node, alias_db=self.alias_db, mmap_weights=self._mmap_weights)
             self.m_decoders.append(decoder)
             node_visitor(decoder)
 
@@ -292,7 +309,8 @@ class TorchScriptPythonDecoder (Decoder):
         return list(self.graph_element.blocks())
 
     def get_subgraph_decoder(self, index: int):
-        decoder = TorchScriptPythonDecoder(self.pt_module, self.get_subgraphs()[index], alias_db=self.alias_db)
+        decoder = TorchScriptPythonDecoder(self.pt_module, self.get_subgraphs()[index], alias_db=self.alias_db,
+                                            mmap_weights=self._mmap_weights)
         self.m_decoders.append(decoder)
         return decoder
 
@@ -381,10 +399,17 @@ class TorchScriptPythonDecoder (Decoder):
                 pass
             return res
         elif not isinstance(pt_value, (torch.jit.ScriptModule, torch.jit.TracedModule)):
-            return ivalue_to_constant(pt_value)
+            return self._ivalue_to_constant(pt_value)
         else:
             return []
 
+    def _ivalue_to_constant(self, ivalue):
+        if isinstance(ivalue, torch.Tensor) and ivalue.is_quantized:
+            return self.convert_quantized_tensor(ivalue)
+        if self._mmap_weights is not None and isinstance(ivalue, torch.Tensor):
+            return self._mmap_weights.constant(ivalue).outputs()
+        return ivalue_to_constant(ivalue)
+
     def as_constant(self):
         if not isinstance(self.graph_element, torch.Node):
             return None
@@ -393,7 +418,7 @@ class TorchScriptPythonDecoder (Decoder):
         pt_value = self._raw_output(0)
         pt_type = pt_value.type()
         if isinstance(pt_type, torch.TensorType):
-            return ivalue_to_constant(pt_value.toIValue())
+            return self._ivalue_to_constant(pt_value.toIValue())
         if isinstance(pt_type, torch.ListType):
             return self._as_constant_list(pt_value)
         return ivalue_to_constant(pt_value.toIValue())
@@ -5,6 +5,8 @@
 # flake8: noqa
 # mypy: ignore-errors
 
+import tempfile
+
 import torch
 import numpy as np
 import ctypes
@@ -67,24 +69,110 @@ def ivalue_to_constant(ivalue):
         return op.Constant(ov_type, Shape([len(ivalue)]), ivalue).outputs()
 
     if isinstance(ivalue, torch.Tensor):
-        ivalue = ivalue.to(memory_format=torch.contiguous_format)
-        if ivalue.dtype == torch.bfloat16:
-            # reinterpret bfloat16 data as float16 to allow conversion to numpy
-            ivalue = ivalue.view(torch.float16)
-            narr = ivalue.numpy(force=True)
-            if not narr.flags['C_CONTIGUOUS']:
-                narr = np.ascontiguousarray(narr)
-            # TODO: this tensor doesn't share memory with initial tensor
-            tensor = Tensor(narr, ivalue.shape, OVType.bf16)
-            ov_const = op.Constant(tensor, shared_memory=True)
-        else:
-            narr = ivalue.numpy(force=True)
-            if not narr.flags['C_CONTIGUOUS']:
-                narr = np.ascontiguousarray(narr)
-            ov_const = op.Constant(narr, shared_memory=True)
-        return ov_const.outputs()
+        return torch_tensor_to_ov_const(ivalue, shared_memory=True).outputs()
     return None
 
+def torch_tensor_to_ov_const(torch_t: torch.Tensor, shared_memory=True):
+    """Create Constant from torch tensor.
+
+    Memory of contiguous CPU tensors is shared, Constant keeps a reference to the tensor
+    so the data stays valid after the module is released. Non-contiguous tensors are made
+    contiguous by torch once and the Constant shares this copy. Quantized tensors are not
+    supported, a Constant can't keep their scales and zero points.
+    """
+    if torch_t.is_quantized:
+        raise RuntimeError("Quantized tensor can't be converted to Constant, it has to be dequantized by the decoder.")
+    torch_t = torch_t.detach()
+    # No copy is made for contiguous tensors on CPU
+    torch_t = torch_t.cpu().contiguous()
+    if torch_t.dtype == torch.bfloat16:
+        # numpy has no bfloat16, data is passed as int16 and reinterpreted by Constant
+        return op.Constant(torch_t.view(torch.int16).numpy(force=True), OVType.bf16, shared_memory=shared_memory)
+    return op.Constant(torch_t.numpy(force=True), shared_memory=shared_memory)
+
+class MMapWeights:
+    """
+    Stores tensors in a file and creates Constants referencing memory-mapped regions of the file.
+
+    Tensors are written to the file once, before conversion, and the file is mapped only once,
+    so the resulting model references file-backed pages and conversion does not keep a second
+    in-memory copy of weights. Tensors which were not written, or have a type without OpenVINO
+    counterpart, are converted to Constants sharing memory of the tensor. If path is not given,
+    an anonymous temporary file is used. It is unlinked on posix and opened with delete-on-close
+    on Windows, so it is removed when the last Constant referencing its mapping is destroyed.
+    """
+
+    ALIGNMENT = 64
+
+    def __init__(self, path: str = None):
+        if path is None:
+            # Mapped regions stay valid after the file is removed
+            self._file = tempfile.TemporaryFile(suffix=".bin")
+        else:
+            self._file = open(path, "w+b")
+        self.path = path
+        self._offset = 0
+        self._arrays = {}
+        self._map = None
+
+    @staticmethod
+    def _key(torch_t: torch.Tensor):
+        return (torch_t.data_ptr(), torch_t.dtype, tuple(torch_t.shape), tuple(torch_t.stride()))
+
+    def write(self, tensors):
+        """Write tensors to the file and map it. Can be called only once."""
+        if self._map is not None:
+            raise RuntimeError("Weights file is already mapped, tensors can't be added to it")
+        regions = {}
+        for torch_t in tensors:
+            key = self._key(torch_t)
+            # The same tensor can be referenced by several attributes, it is written only once
+            if key in regions or key in self._arrays:
+                continue
+            region = self._write(torch_t)
+            if region is not None:
+                regions[key] = region
+        self._file.flush()
+        if self._offset > 0:
+            # Copy-on-write mapping: Constant requires writable memory, but the file is never modified
+            self._map = np.memmap(self._file, dtype=np.uint8, mode="c", shape=(self._offset,))
+        for key, (start, dtype, shape, ov_type) in regions.items():
+            nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+            if nbytes == 0:
+                array = np.empty(shape, dtype=dtype)
+            else:
+                array = self._map[start:start + nbytes].view(dtype).reshape(shape)
+            self._arrays[key] = (array, ov_type)
+
+    def constant(self, torch_t: torch.Tensor):
+        entry = self._arrays.get(self._key(torch_t))
+        if entry is None:
+            return torch_tensor_to_ov_const(torch_t, shared_memory=True)
+        array, ov_type = entry
+        return op.Constant(array, ov_type, shared_memory=True)
+
+    def _write(self, torch_t: torch.Tensor):
+        torch_t = torch_t.detach()
+        ov_type = pt_to_ov_type_map.get(str(torch_t.dtype))
+        if ov_type is None or torch_t.is_quantized:
+            return None
+        torch_t = torch_t.cpu().contiguous()
+        if torch_t.dtype == torch.bfloat16:
+            torch_t = torch_t.view(torch.int16)
+        narr = torch_t.numpy(force=True)
+        if narr.nbytes == 0:
+            return self._offset, narr.dtype, narr.shape, ov_type
+        start = self._offset + (-self._offset) % self.ALIGNMENT
+        self._file.seek(start)
+        self._file.write(memoryview(narr.reshape(-1)).cast("B"))
+        self._offset = start + narr.nbytes
+        return start, narr.dtype, narr.shape, ov_type
+
+    @property
+    def size(self) -> int:
+        return self._offset
+
+
 def get_value_from_getattr(getattr_node, self_module):
     assert getattr_node.kind() == "prim::GetAttr", "Got node of kind not equal to prim::GetAttr"
     # GetAttr nodes can be nested
@@ -14,7 +14,6 @@ class GraphIteratorTFGraph(GraphIterator):
         GraphIterator.__init__(self)
         self.m_graph = tf_graph
         self.m_node_index = 0
-        self.m_decoders = []
         self.m_inner_graph = inner_graph
         self.m_share_weights = share_weights
 
@@ -24,15 +23,17 @@ class GraphIteratorTFGraph(GraphIterator):
             # otherwise Python releases memory kept by variables when it is accessed from c++ bindings
             self.m_vars = tf_graph.variables
 
-        for op in tf_graph.get_operations():
-            self.m_decoders.append(TFGraphNodeDecoder(op, share_weights, inner_graph))
+        # Decoders are created when the iterator reaches the operation
+        self.m_operations = tf_graph.get_operations()
+        self.m_decoders = [None] * len(self.m_operations)
+        self.m_variables_map = None
 
         self.m_iterators = {}
         for func_name, _ in self.m_graph._functions.items():
             self.m_iterators[func_name] = None
 
     def get_input_names(self) -> list:
-        inp_ops = filter(lambda op: op.type == "Placeholder", self.m_graph.get_operations())
+        inp_ops = filter(lambda op: op.type == "Placeholder", self.m_operations)
         inp_names = []
         for inp in inp_ops:
             assert isinstance(inp, tf.Operation), "Unknown node type. Expected tf.Operation, got {}".format(type(inp))
@@ -55,13 +56,13 @@ class GraphIteratorTFGraph(GraphIterator):
         # as this approach does not lead to conflicts.
         # The order of outputs is important and wrong order may lead to conversion error.
         non_outputs = set()
-        for op in self.m_graph.get_operations():
+        for op in self.m_operations:
             assert isinstance(op, tf.Operation), "Unknown node type. Expected tf.Operation, got {}".format(type(op))
             for inp in op.inputs:
                 non_outputs.add(inp.op.name)
 
         outputs = []
-        for op in self.m_graph.get_operations():
+        for op in self.m_operations:
             if op.name not in non_outputs:
                 for output in op.outputs:
                     outputs = [output.name] + outputs
@@ -80,7 +81,15 @@ class GraphIteratorTFGraph(GraphIterator):
         self.m_node_index += 1
 
     def get_decoder(self):
-        return self.m_decoders[self.m_node_index]
+        decoder = self.m_decoders[self.m_node_index]
+        if decoder is None:
+            if self.m_variables_map is None and not self.m_inner_graph:
+                self.m_variables_map = TFGraphNodeDecoder.get_variables_map(self.m_graph)
+            decoder = TFGraphNodeDecoder(self.m_operations[self.m_node_index], self.m_share_weights, self.m_inner_graph,
+                                         self.m_variables_map)
+            # Decoders are kept alive by the iterator, as they are referenced from c++ frontend
+            self.m_decoders[self.m_node_index] = decoder
+        return decoder
 
     def get_body_graph_iterator(self, func_name):
         if func_name not in self.m_iterators:
@@ -47,16 +47,18 @@ def tf_attr_to_ov(attr):
 
 
 class TFGraphNodeDecoder(DecoderBase):
-    def __init__(self, operation: tf.Operation, share_weights: bool, inner_graph: bool):
+    def __init__(self, operation: tf.Operation, share_weights: bool, inner_graph: bool, variables_map: dict = None):
         DecoderBase.__init__(self)
         assert isinstance(operation, tf.Operation), "Unknown operation type. " \
                                                     "Expected tf.Operation, got {}".format(type(operation))
         self.m_operation = operation
         self.m_inner_graph = inner_graph
         self.m_data_type = None
+        self.m_variables_map = variables_map
+        # Attributes are requested several times by the frontend, each one is parsed only once
+        self.m_attributes = {}
 
-        # Copies value from inner buffer of TF_Operation to NodeDef class.
-        self.m_node_def = self.m_operation.node_def
+        self._node_def = None
         self.m_shared_memory = share_weights
 
         if self.m_operation.type == "Const":
@@ -88,7 +90,7 @@ class TFGraphNodeDecoder(DecoderBase):
             self.m_data_type = tf.dtypes.DType(self.m_node_def.attr["dtype"].type).name
 
             if self.m_data_type == "resource" and not self.m_inner_graph:
-                variable_value = TFGraphNodeDecoder.get_variable(self.m_operation)
+                variable_value = TFGraphNodeDecoder.get_variable(self.m_operation, self.m_variables_map)
                 if variable_value is not None:
                     # does not copy data
                     self.m_parsed_content = variable_value.value().__array__()
@@ -97,6 +99,13 @@ class TFGraphNodeDecoder(DecoderBase):
                         self.m_data_type = "string"
                         self.m_parsed_content = [str(self.m_parsed_content)]
 
+    @property
+    def m_node_def(self):
+        if self._node_def is None:
+            # Copies value from inner buffer of TF_Operation to NodeDef class.
+            self._node_def = self.m_operation.node_def
+        return self._node_def
+
     def get_op_name(self) -> str:
         return self.m_operation.name
 
@@ -104,13 +113,28 @@ class TFGraphNodeDecoder(DecoderBase):
         if self.m_operation.type == "Placeholder":
             type_attr = tf.dtypes.DType(self.m_node_def.attr["dtype"].type)
             if type_attr.name == "resource" and not self.m_inner_graph:
-                if TFGraphNodeDecoder.get_variable(self.m_operation) is not None:
+                if TFGraphNodeDecoder.get_variable(self.m_operation, self.m_variables_map) is not None:
                     return "Const"
                 raise Exception("Could not get variable for resource Placeholder {0}".format(self.m_operation.name))
         return self.m_operation.type
 
     @staticmethod
-    def get_variable(operation):
+    def get_variables_map(tf_graph) -> dict:
+        """Maps names of captured tensors to variables, or returns None if graph has no captures."""
+        if not hasattr(tf_graph, "captures"):
+            return None
+        variables_by_name = {}
+        for variable_value in tf_graph.variables:
+            variables_by_name.setdefault(variable_value.name, variable_value)
+        variables_map = {}
+        for var_tensor, op_tensor in tf_graph.captures:
+            variables_map.setdefault(op_tensor.name, variables_by_name.get(var_tensor._name))
+        return variables_map
+
+    @staticmethod
+    def get_variable(operation, variables_map: dict = None):
+        if variables_map is not None:
+            return variables_map.get(operation.outputs[0].name)
         tf_graph = operation.graph
         if not hasattr(tf_graph, "captures"):
             return None
@@ -124,6 +148,13 @@ class TFGraphNodeDecoder(DecoderBase):
         return None
 
     def get_attribute(self, name):
+        attribute = self.m_attributes.get(name)
+        if attribute is None:
+            attribute = self._get_attribute(name)
+            self.m_attributes[name] = attribute
+        return attribute
+
+    def _get_attribute(self, name):
         if name == "shape" or name == "_output_shapes":
             if self.m_node_def.attr["shape"].shape.unknown_rank:
                 return OVAny(PartialShape.dynamic())
@@ -133,14 +164,14 @@ class TFGraphNodeDecoder(DecoderBase):
             if type_num is not None and tf.dtypes.DType(type_num).name == "resource":
                 if self.m_inner_graph:
                     return OVAny(PartialShape.dynamic())
-                variable_value = TFGraphNodeDecoder.get_variable(self.m_operation)
+                variable_value = TFGraphNodeDecoder.get_variable(self.m_operation, self.m_variables_map)
                 return OVAny(PartialShape(list(variable_value.shape)))
             return OVAny(PartialShape(shape))
         if name == "dtype":
             type_num = self.m_node_def.attr["dtype"].type
             if tf.dtypes.DType(type_num).name == "resource":
                 if not self.m_inner_graph:
-                    variable_value = TFGraphNodeDecoder.get_variable(self.m_operation)
+                    variable_value = TFGraphNodeDecoder.get_variable(self.m_operation, self.m_variables_map)
                     return OVAny(tf_type_to_ov_type(variable_value.dtype))
                 else:
                     return OVAny(Type.undefined)
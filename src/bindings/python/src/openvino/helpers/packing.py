@@ -4,9 +4,61 @@
 # flake8: noqa
 
 import numpy as np
-from typing import Union
+from typing import Iterator, Optional, Union
 from openvino.runtime import Type, Shape
 
+# Default size of a chunk processed at once by the streaming variants, in packed bytes.
+DEFAULT_CHUNK_SIZE = 1 << 22
+
+
+def _check_type(type: Type) -> None:
+    assert type in [Type.u1, Type.u4, Type.i4], "Packing algorithm for the" "data types stored in 1, 2 or 4 bits"
+
+
+def _to_regular_type(array: np.ndarray, type: Type) -> np.ndarray:
+    minimum_regular_dtype = np.int8 if type == Type.i4 else np.uint8
+    casted_to_regular_type = array.astype(dtype=minimum_regular_dtype, casting="unsafe", copy=False)
+    if not np.array_equal(casted_to_regular_type, array):
+        raise RuntimeError(f'The conversion of array "{array}" to dtype' f' "{casted_to_regular_type}" results in rounding')
+    return casted_to_regular_type
+
+
+def _pack_flat(flattened: np.ndarray, num_bits: int) -> np.ndarray:
+    """Pack 1-D array of uint8/int8 values, only `num_bits` least significant bits of every value are kept."""
+    values = flattened.view(np.uint8)
+    if num_bits == 1:
+        return np.packbits(values & 1)
+    num_values_fitting_into_uint8 = 8 // num_bits
+    pad = (-values.size) % num_values_fitting_into_uint8
+    if pad:
+        values = np.concatenate((values, np.zeros([pad], dtype=np.uint8)))
+    grouped = (values & ((1 << num_bits) - 1)).reshape(-1, num_values_fitting_into_uint8)
+    packed = grouped[:, 0] << (8 - num_bits)
+    for i in range(1, num_values_fitting_into_uint8):
+        packed |= grouped[:, i] << (8 - num_bits * (i + 1))
+    return packed
+
+
+def _unpack_flat(array: np.ndarray, type: Type) -> np.ndarray:
+    """Unpack every value stored in 1-D uint8 array, padding values are kept."""
+    if type.bitwidth == 1:
+        return np.unpackbits(array)
+    # The first value is kept in the most significant bits.
+    # For i4 arithmetic shifts of int8 values extend the sign.
+    values = array.view(np.int8) if type == Type.i4 else array
+    unpacked = np.empty((values.size, 2), dtype=values.dtype)
+    np.right_shift(values, 4, out=unpacked[:, 0])
+    np.left_shift(values, 4, out=unpacked[:, 1])
+    unpacked[:, 1] >>= 4
+    return unpacked.reshape(-1)
+
+
+def _reshape(unpacked: np.ndarray, shape: list) -> np.ndarray:
+    size = int(np.prod(shape))
+    if unpacked.size >= size:
+        return unpacked[:size].reshape(shape)
+    return np.resize(unpacked, shape)
+
 
 def pack_data(array: np.ndarray, type: Type) -> np.ndarray:
     """Represent array values as u1,u4 or i4 openvino element type and pack them into uint8 numpy array.
@@ -23,29 +75,12 @@ def pack_data(array: np.ndarray, type: Type) -> np.ndarray:
     :param type: Type to interpret the array values. Type must be u1, u4 or i4.
     :type type: openvino.runtime.Type
     """
-    assert type in [Type.u1, Type.u4, Type.i4], "Packing algorithm for the" "data types stored in 1, 2 or 4 bits"
-
-    minimum_regular_dtype = np.int8 if type == Type.i4 else np.uint8
-    casted_to_regular_type = array.astype(dtype=minimum_regular_dtype, casting="unsafe")
-    if not np.array_equal(casted_to_regular_type, array):
-        raise RuntimeError(f'The conversion of array "{array}" to dtype' f' "{casted_to_regular_type}" results in rounding')
-
-    data_size = casted_to_regular_type.size
+    _check_type(type)
     num_bits = type.bitwidth
 
     assert num_bits < 8 and 8 % num_bits == 0, "Packing algorithm for the" "data types stored in 1, 2 or 4 bits"
-    num_values_fitting_into_uint8 = 8 // num_bits
-    pad = (-data_size) % num_values_fitting_into_uint8
-
-    flattened = casted_to_regular_type.flatten()
-    padded = np.concatenate((flattened, np.zeros([pad], dtype=minimum_regular_dtype)))  # type: ignore
-    assert padded.size % num_values_fitting_into_uint8 == 0
-
-    bit_order_little = (padded[:, None] & (1 << np.arange(num_bits)) > 0).astype(minimum_regular_dtype)
-    bit_order_big = np.flip(bit_order_little, axis=1)  # type: ignore
-    bit_order_big_flattened = bit_order_big.flatten()
 
-    return np.packbits(bit_order_big_flattened)
+    return _pack_flat(_to_regular_type(array, type).reshape(-1), num_bits)
 
 
 def unpack_data(array: np.ndarray, type: Type, shape: Union[list, Shape]) -> np.ndarray:
@@ -63,25 +98,59 @@ def unpack_data(array: np.ndarray, type: Type, shape: Union[list, Shape]) -> np.
     :type shape: Union[list, openvino.runtime.Shape]
     """
     assert type in [Type.u1, Type.u4, Type.i4], "Unpacking algorithm for the" "data types stored in 1, 2 or 4 bits"
-    unpacked = np.unpackbits(array.view(np.uint8))
-    shape = list(shape)
-    if type.bitwidth == 1:
-        return np.resize(unpacked, shape)
-    else:
-        unpacked = unpacked.reshape(-1, type.bitwidth)
-        padding_shape = (unpacked.shape[0], 8 - type.bitwidth)
-        padding = np.ndarray(padding_shape, np.uint8)  # type: np.ndarray
-        if type == Type.i4:
-            for axis, bits in enumerate(unpacked):
-                if bits[0] == 1:
-                    padding[axis] = np.ones((padding_shape[1],), np.uint8)
-                else:
-                    padding[axis] = np.zeros((padding_shape[1],), np.uint8)
-        else:
-            padding = np.zeros(padding_shape, np.uint8)
-        padded = np.concatenate((padding, unpacked), 1)  # type: ignore
-        packed = np.packbits(padded, 1)
-        if type == Type.i4:
-            return np.resize(packed, shape).astype(dtype=np.int8)
-        else:
-            return np.resize(packed, shape)
+    return _reshape(_unpack_flat(array.view(np.uint8).reshape(-1), type), list(shape))
+
+
+def pack_data_chunks(array: np.ndarray, type: Type, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[np.ndarray]:
+    """Pack array values as u1, u4 or i4 openvino element type chunk by chunk.
+
+    Works like `pack_data`, but reads at most `chunk_size` packed bytes worth of values at once,
+    so the input can be a memory-mapped array larger than available memory.
+    Concatenation of the yielded chunks is equal to the result of `pack_data`.
+
+    :param array: numpy array with values to pack, e.g. `numpy.memmap`.
+    :type array: numpy array
+    :param type: Type to interpret the array values. Type must be u1, u4 or i4.
+    :type type: openvino.runtime.Type
+    :param chunk_size: Maximum size of a yielded chunk in bytes.
+    :type chunk_size: int
+    :return: Generator of uint8 arrays with packed values.
+    """
+    _check_type(type)
+    flattened = array.reshape(-1)
+    step = chunk_size * (8 // type.bitwidth)
+    for start in range(0, flattened.size, step):
+        yield _pack_flat(_to_regular_type(flattened[start:start + step], type), type.bitwidth)
+
+
+def unpack_data_chunks(
+    array: np.ndarray,
+    type: Type,
+    size: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[np.ndarray]:
+    """Extract openvino element type values from array chunk by chunk.
+
+    Works like `unpack_data`, but unpacks at most `chunk_size` bytes of the input at once,
+    so the input can be a memory-mapped array and the whole unpacked array is never materialized.
+
+    :param array: numpy array to unpack, e.g. `numpy.memmap`.
+    :type array: numpy array
+    :param type: Type to extract from array values. Type must be u1, u4 or i4.
+    :type type: openvino.runtime.Type
+    :param size: Number of values to extract. If None, all values including padding are extracted.
+    :type size: int, optional
+    :param chunk_size: Maximum number of input bytes unpacked at once.
+    :type chunk_size: int
+    :return: Generator of flat uint8/int8 arrays with unpacked values.
+    """
+    assert type in [Type.u1, Type.u4, Type.i4], "Unpacking algorithm for the" "data types stored in 1, 2 or 4 bits"
+    packed = array.reshape(-1).view(np.uint8)
+    values_in_byte = 8 // type.bitwidth
+    remaining = packed.size * values_in_byte if size is None else size
+    for start in range(0, packed.size, chunk_size):
+        if remaining <= 0:
+            break
+        unpacked = _unpack_flat(np.asarray(packed[start:start + chunk_size]), type)
+        yield unpacked[:remaining]
+        remaining -= unpacked.size
@@ -5,6 +5,9 @@
 """openvino module namespace, exposing factory functions for all ops and other classes."""
 # noqa: F401
 
+from importlib import import_module
+from typing import Any, Callable, List
+
 from openvino.utils import _add_openvino_libs_to_search_path
 
 _add_openvino_libs_to_search_path()
@@ -47,19 +50,8 @@ from openvino._pyopenvino import serialize
 from openvino._pyopenvino import save_model
 from openvino._pyopenvino import shutdown
 
-# Import opsets
-from openvino.runtime import opset1
-from openvino.runtime import opset2
-from openvino.runtime import opset3
-from openvino.runtime import opset4
-from openvino.runtime import opset5
-from openvino.runtime import opset6
-from openvino.runtime import opset7
-from openvino.runtime import opset8
-from openvino.runtime import opset9
-from openvino.runtime import opset10
-from openvino.runtime import opset11
-from openvino.runtime import opset12
+# Opsets are imported lazily on the first access, see __getattr__ below
+_LAZY_SUBMODULES = {f"opset{version}" for version in range(1, 13)}
 
 # Import properties API
 from openvino.runtime import properties
@@ -68,20 +60,40 @@ from openvino.runtime import properties
 from openvino.runtime.ie_api import tensor_from_file
 from openvino.runtime.ie_api import compile_model
 
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        # import_module binds the submodule to this package,
+        # so __getattr__ is called only on the first access.
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
+
+
+def _node_operator(op_name: str, reflected: bool = False) -> Callable:
+    def operator(left: Node, right: Any) -> Node:
+        op = getattr(import_module(f"{__name__}.opset12"), op_name)
+        return op(right, left) if reflected else op(left, right)
+    return operator
+
+
 # Extend Node class to support binary operators
-Node.__add__ = opset12.add
-Node.__sub__ = opset12.subtract
-Node.__mul__ = opset12.multiply
-Node.__div__ = opset12.divide
-Node.__truediv__ = opset12.divide
-Node.__radd__ = lambda left, right: opset12.add(right, left)
-Node.__rsub__ = lambda left, right: opset12.subtract(right, left)
-Node.__rmul__ = lambda left, right: opset12.multiply(right, left)
-Node.__rdiv__ = lambda left, right: opset12.divide(right, left)
-Node.__rtruediv__ = lambda left, right: opset12.divide(right, left)
-Node.__eq__ = opset12.equal
-Node.__ne__ = opset12.not_equal
-Node.__lt__ = opset12.less
-Node.__le__ = opset12.less_equal
-Node.__gt__ = opset12.greater
-Node.__ge__ = opset12.greater_equal
+Node.__add__ = _node_operator("add")
+Node.__sub__ = _node_operator("subtract")
+Node.__mul__ = _node_operator("multiply")
+Node.__div__ = _node_operator("divide")
+Node.__truediv__ = _node_operator("divide")
+Node.__radd__ = _node_operator("add", reflected=True)
+Node.__rsub__ = _node_operator("subtract", reflected=True)
+Node.__rmul__ = _node_operator("multiply", reflected=True)
+Node.__rdiv__ = _node_operator("divide", reflected=True)
+Node.__rtruediv__ = _node_operator("divide", reflected=True)
+Node.__eq__ = _node_operator("equal")
+Node.__ne__ = _node_operator("not_equal")
+Node.__lt__ = _node_operator("less")
+Node.__le__ = _node_operator("less_equal")
+Node.__gt__ = _node_operator("greater")
+Node.__ge__ = _node_operator("greater_equal")
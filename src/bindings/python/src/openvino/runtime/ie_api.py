@@ -2,7 +2,7 @@
 # Copyright (C) 2018-2023 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Any, Iterable, Union, Optional, Dict
+from typing import Any, Iterable, Iterator, Union, Optional, Dict, Tuple
 from pathlib import Path
 import warnings
 
@@ -17,8 +17,10 @@ from openvino._pyopenvino import Node
 
 from openvino.runtime.utils.data_helpers import (
     OVDict,
+    _OVDictKeyTable,
     _InferRequestWrapper,
     _data_dispatch,
+    _bind_outputs,
     tensor_from_file,
 )
 
@@ -72,6 +74,7 @@ class InferRequest(_InferRequestWrapper):
         share_outputs: bool = False,
         *,
         shared_memory: Any = None,
+        outputs: Any = None,
     ) -> OVDict:
         """Infers specified input(s) in synchronous mode.
 
@@ -137,14 +140,39 @@ class InferRequest(_InferRequestWrapper):
 
                               Default value: None
         :type shared_memory: bool, optional
+        :param outputs: Preallocated `numpy.ndarray` buffers to be bound as output tensors.
+                        Results of inference are written directly into these buffers.
+
+                        The allowed types of keys are the same as for `inputs`,
+                        a list or tuple of buffers is addressed by output index.
+
+                        Every buffer has to be C contiguous, writeable and match
+                        data type and shape of the output. Buffers are checked and bound
+                        only when they differ from the ones bound in the previous call,
+                        and they stay bound to the request until other buffers are passed.
+
+                        Note: This is keyword-only argument.
+
+                        Default value: None
+        :type outputs: Union[Dict[keys, numpy.ndarray], List[numpy.ndarray], Tuple[numpy.ndarray]], optional
         :return: Dictionary of results from output tensors with port/int/str keys.
+                 Results of outputs given in `outputs` are views of the bound buffers,
+                 other results follow `share_outputs` mode.
         :rtype: OVDict
         """
-        return OVDict(super().infer(_data_dispatch(
+        inputs = _data_dispatch(
             self,
             inputs,
             is_shared=_deprecated_memory_arg(shared_memory, share_inputs),
-        ), share_outputs=share_outputs))
+        )
+        if outputs is None:
+            return OVDict(super().infer(inputs, share_outputs=share_outputs), self._get_key_table())
+        bound_ports = _bind_outputs(self, outputs)
+        results = super().infer(inputs, share_outputs=True)
+        if not share_outputs:
+            # Results of bound outputs are already in user buffers, only the other ones are copied.
+            results = {port: value if port in bound_ports else value.copy() for port, value in results.items()}
+        return OVDict(results, self._get_key_table())
 
     def start_async(
         self,
@@ -153,6 +181,7 @@ class InferRequest(_InferRequestWrapper):
         share_inputs: bool = False,
         *,
         shared_memory: Any = None,
+        outputs: Any = None,
     ) -> None:
         """Starts inference of specified input(s) in asynchronous mode.
 
@@ -209,7 +238,23 @@ class InferRequest(_InferRequestWrapper):
 
                               Default value: None
         :type shared_memory: bool, optional
+        :param outputs: Preallocated `numpy.ndarray` buffers to be bound as output tensors.
+                        Results of inference are written directly into these buffers.
+
+                        The allowed types of keys are the same as for `inputs`,
+                        a list or tuple of buffers is addressed by output index.
+
+                        Every buffer has to be C contiguous, writeable and match
+                        data type and shape of the output. Buffers are checked and bound
+                        only when they differ from the ones bound in the previous call,
+                        and they stay bound to the request until other buffers are passed.
+
+                        Note: This is keyword-only argument.
+
+                        Default value: None
+        :type outputs: Union[Dict[keys, numpy.ndarray], List[numpy.ndarray], Tuple[numpy.ndarray]], optional
         """
+        _bind_outputs(self, outputs)
         super().start_async(
             _data_dispatch(
                 self,
@@ -234,7 +279,7 @@ class InferRequest(_InferRequestWrapper):
         :return: Dictionary of results from output tensors with ports as keys.
         :rtype: Dict[openvino.runtime.ConstOutput, numpy.array]
         """
-        return OVDict(super().results)
+        return OVDict(super().results, self._get_key_table())
 
 
 class CompiledModel(CompiledModelBase):
@@ -247,6 +292,8 @@ class CompiledModel(CompiledModelBase):
     def __init__(self, other: CompiledModelBase) -> None:
         # Private memeber to store already created InferRequest
         self._infer_request: Optional[InferRequest] = None
+        # Private member to store key table shared by all results of this model
+        self._key_table: Optional[_OVDictKeyTable] = None
         super().__init__(other)
 
     def get_runtime_model(self) -> Model:
@@ -260,7 +307,11 @@ class CompiledModel(CompiledModelBase):
         :return: New InferRequest object.
         :rtype: openvino.runtime.InferRequest
         """
-        return InferRequest(super().create_infer_request())
+        request = InferRequest(super().create_infer_request())
+        if self._key_table is None:
+            self._key_table = _OVDictKeyTable(self.outputs)
+        request._key_table = self._key_table
+        return request
 
     def infer_new_request(self, inputs: Union[dict, list, tuple, Tensor, np.ndarray] = None) -> OVDict:
         """Infers specified input(s) in synchronous mode.
@@ -302,6 +353,7 @@ class CompiledModel(CompiledModelBase):
         share_outputs: bool = False,
         *,
         shared_memory: Any = None,
+        outputs: Any = None,
     ) -> OVDict:
         """Callable infer wrapper for CompiledModel.
 
@@ -375,6 +427,21 @@ class CompiledModel(CompiledModelBase):
 
                               Default value: None
         :type shared_memory: bool, optional
+        :param outputs: Preallocated `numpy.ndarray` buffers to be bound as output tensors.
+                        Results of inference are written directly into these buffers.
+
+                        The allowed types of keys are the same as for `inputs`,
+                        a list or tuple of buffers is addressed by output index.
+
+                        Every buffer has to be C contiguous, writeable and match
+                        data type and shape of the output. Buffers are checked and bound
+                        only when they differ from the ones bound in the previous call,
+                        and they stay bound to the request until other buffers are passed.
+
+                        Note: This is keyword-only argument.
+
+                        Default value: None
+        :type outputs: Union[Dict[keys, numpy.ndarray], List[numpy.ndarray], Tuple[numpy.ndarray]], optional
         :return: Dictionary of results from output tensors with port/int/str as keys.
         :rtype: OVDict
         """
@@ -385,6 +452,7 @@ class CompiledModel(CompiledModelBase):
             inputs,
             share_inputs=_deprecated_memory_arg(shared_memory, share_inputs),
             share_outputs=share_outputs,
+            outputs=outputs,
         )
 
 
@@ -422,6 +490,38 @@ class AsyncInferQueue(AsyncInferQueueBase):
         """
         return InferRequest(super().__getitem__(i))
 
+    def completed(self, max_items: int = 0) -> Iterator[Tuple[int, Any]]:
+        """Iterates over finished requests in the completion queue mode.
+
+        Completions are drained from the queue in batches of at most `max_items`
+        elements, so the GIL is not acquired for every finished request.
+        Iteration stops when there are no more running nor not drained requests.
+
+        .. code-block:: python
+
+            infer_queue.set_completion_queue()
+            for i, data in enumerate(dataset):
+                infer_queue.start_async(data, i)
+                # Non-blocking, frees slots of the completion queue
+                finished.extend(infer_queue.drain(timeout=0))
+            finished.extend(infer_queue.completed())
+
+        Note: Requests are reused by the queue, results of the request have to be
+              read before it is started again.
+
+        :param max_items: Maximum number of completions drained at once. If 0,
+                          all available completions are drained. Default: 0
+        :type max_items: int
+        :return: a generator that yields pairs of InferRequest id and userdata.
+        :rtype: Iterator[Tuple[int, Any]]
+        """
+        while True:
+            batch = self.drain(max_items)
+            yield from batch
+            # drain() returns an empty list also when all drained requests failed
+            if not batch and self.outstanding == 0:
+                return
+
     def start_async(
         self,
         inputs: Any = None,
@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from openvino.runtime.utils.data_helpers.data_dispatcher import _data_dispatch
+from openvino.runtime.utils.data_helpers.data_dispatcher import _bind_outputs
 from openvino.runtime.utils.data_helpers.wrappers import tensor_from_file
 from openvino.runtime.utils.data_helpers.wrappers import _InferRequestWrapper
 from openvino.runtime.utils.data_helpers.wrappers import OVDict
+from openvino.runtime.utils.data_helpers.wrappers import _OVDictKeyTable
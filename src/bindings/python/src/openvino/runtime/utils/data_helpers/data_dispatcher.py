@@ -3,11 +3,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from functools import singledispatch
-from typing import Any, Dict, Union, Optional
+from typing import Any, Dict, List, Set, Tuple, Union, Optional
 
 import numpy as np
 
-from openvino._pyopenvino import ConstOutput, Tensor, Type
+from openvino._pyopenvino import ConstOutput, PartialShape, Tensor, Type
 from openvino.runtime.utils.data_helpers.wrappers import _InferRequestWrapper
 
 ContainerTypes = Union[dict, list, tuple]
@@ -344,6 +344,152 @@ def _(
 ###
 
 
+###
+# Start of dispatch plans.
+# Plan records actions chosen for every input of already seen input signature,
+# so repeated calls with the same structure of inputs skip dispatching.
+# (1) Signature consists of keys, value types, dtypes and flags of arrays.
+# (2) Only containers of `np.ndarray`/`Tensor` and single `np.ndarray` are planned,
+#     any other inputs go through the dispatchers above.
+###
+MAX_DISPATCH_PLANS = 32
+
+# Actions of the "shared" mode
+KEEP = 0       # Tensor is passed "as-is"
+SHARE = 1      # array is shared with a new Tensor
+CAST = 2       # array is converted to the type of input
+BF16 = 3       # array is copied to new BF16 Tensor
+READONLY = 4   # not writeable array is copied to new Tensor
+# Actions of the "copied" mode
+COPY = 5       # array is copied to the existing Tensor of request
+# Action of both modes, used for scalar arrays
+GENERIC = 6    # value goes through the dispatchers
+
+PlanStep = Tuple[int, Optional[Type], Any]
+
+
+def get_signature(inputs: Any, is_shared: bool) -> Optional[tuple]:
+    if isinstance(inputs, dict):
+        items = inputs.items()
+    elif isinstance(inputs, (list, tuple)):
+        items = enumerate(inputs)
+    elif isinstance(inputs, np.ndarray):
+        flags = inputs.flags
+        return (is_shared, None, inputs.dtype, inputs.ndim == 0, flags["C_CONTIGUOUS"], flags["WRITEABLE"])
+    else:
+        return None
+    signature: List[Any] = [is_shared, type(inputs)]
+    for key, value in items:
+        if not isinstance(key, (str, int, ConstOutput)):
+            return None
+        if isinstance(value, np.ndarray):
+            flags = value.flags
+            signature.append((key, value.dtype, value.ndim == 0, flags["C_CONTIGUOUS"], flags["WRITEABLE"]))
+        elif isinstance(value, Tensor):
+            signature.append((key, Tensor))
+        else:
+            return None
+    return tuple(signature)
+
+
+def create_plan_step(
+    value: Union[Tensor, np.ndarray],
+    request: _InferRequestWrapper,
+    is_shared: bool,
+    key: Optional[ValidKeys] = None,
+) -> PlanStep:
+    if isinstance(value, Tensor):
+        return KEEP, None, None
+    if value.ndim == 0:
+        return GENERIC, None, None
+    if not is_shared:
+        return COPY, None, None
+    tensor_type = get_request_tensor(request, key).get_element_type()
+    tensor_dtype = tensor_type.to_dtype()
+    if tensor_type == Type.bf16:
+        return BF16, tensor_type, tensor_dtype
+    if value.flags["WRITEABLE"] is False:
+        return READONLY, tensor_type, tensor_dtype
+    if tensor_dtype != value.dtype:
+        return CAST, tensor_type, tensor_dtype
+    return SHARE, tensor_type, tensor_dtype
+
+
+def run_plan_step(
+    step: PlanStep,
+    value: Union[Tensor, np.ndarray],
+    request: _InferRequestWrapper,
+    is_shared: bool,
+    key: Optional[ValidKeys] = None,
+) -> Optional[Tensor]:
+    action, tensor_type, tensor_dtype = step
+    if action == KEEP:
+        return value
+    if action == COPY:
+        tensor = get_request_tensor(request, key)
+        # Update shape if there is a mismatch
+        if tuple(tensor.shape) != value.shape:
+            tensor.shape = value.shape
+        # When copying, type should be up/down-casted automatically.
+        tensor.data[:] = value
+        return None
+    if action == SHARE:
+        return Tensor(value, shared_memory=True)
+    if action == CAST:
+        return Tensor(value.astype(tensor_dtype), shared_memory=False)
+    if action == BF16:
+        tensor = Tensor(tensor_type, value.shape)
+        tensor.data[:] = value.view(tensor_dtype)
+        return tensor
+    if action == READONLY:
+        tensor = Tensor(tensor_type, value.shape)
+        tensor.data[:] = value.astype(tensor_dtype) if tensor_dtype != value.dtype else value
+        return tensor
+    # GENERIC
+    if is_shared:
+        return value_to_tensor(value, request=request, is_shared=True, key=key)
+    update_tensor(value, request, key)
+    return None
+
+
+def dispatch_with_plan(
+    signature: tuple,
+    inputs: Union[ContainerTypes, np.ndarray],
+    request: _InferRequestWrapper,
+    is_shared: bool,
+) -> Union[dict, Tensor]:
+    if is_shared:
+        inputs = normalize_arrays(inputs, is_shared=True)
+        request._inputs_data = inputs
+    plans = request._dispatch_plans
+    if isinstance(inputs, np.ndarray):
+        plan = plans.get(signature)
+        if plan is None:
+            plan = create_plan_step(inputs, request, is_shared)
+            if len(plans) >= MAX_DISPATCH_PLANS:
+                plans.clear()
+            plans[signature] = plan
+        result = run_plan_step(plan, inputs, request, is_shared)
+        return {} if result is None else result
+    items = inputs.items() if isinstance(inputs, dict) else enumerate(inputs)
+    steps = plans.get(signature)
+    if steps is None:
+        items = list(items)
+        steps = tuple(create_plan_step(value, request, is_shared, key) for key, value in items)
+        if len(plans) >= MAX_DISPATCH_PLANS:
+            plans.clear()
+        plans[signature] = steps
+    new_inputs: Dict[ValidKeys, Tensor] = {}
+    for step, (key, value) in zip(steps, items):
+        tensor = run_plan_step(step, value, request, is_shared, key)
+        if tensor is not None:
+            new_inputs[key] = tensor
+    return new_inputs
+###
+# End of dispatch plans.
+###
+
+
 def _data_dispatch(
     request: _InferRequestWrapper,
     inputs: Union[ContainerTypes, Tensor, np.ndarray, ScalarTypes] = None,
@@ -351,4 +497,79 @@ def _data_dispatch(
 ) -> Union[dict, Tensor]:
     if inputs is None:
         return {}
+    signature = get_signature(inputs, is_shared)
+    if signature is not None:
+        return dispatch_with_plan(signature, inputs, request, is_shared)
     return create_shared(inputs, request) if is_shared else create_copied(inputs, request)
+
+
+###
+# Start of output binding.
+# Preallocated numpy arrays are bound as output Tensors of the request,
+# results are written directly into them by the inference.
+# (1) Array is validated and bound only when it differs from the one bound under the key.
+# (2) Bound arrays stay bound to the request until other arrays are passed.
+###
+def get_output_port(
+    request: _InferRequestWrapper,
+    key: ValidKeys,
+) -> ConstOutput:
+    if isinstance(key, ConstOutput):
+        return key
+    if isinstance(key, int):
+        return request.model_outputs[key]
+    if isinstance(key, str):
+        for port in request.model_outputs:
+            if key in port.get_names():
+                return port
+        raise KeyError(f"Port for output name {key} was not found")
+    raise TypeError(f"Incompatible key type for output: {key}")
+
+
+def bind_output(
+    request: _InferRequestWrapper,
+    key: ValidKeys,
+    value: np.ndarray,
+) -> None:
+    if not isinstance(value, np.ndarray):
+        raise TypeError(f"Incompatible output buffer of type: {type(value)} under {key} key!")
+    bound = request._output_bindings.get(key)
+    if bound is not None and bound[0] is value and bound[1] == value.shape and bound[2] == value.dtype:
+        return
+    port = get_output_port(request, key)
+    port_dtype = port.get_element_type().to_dtype()
+    if port_dtype != value.dtype:
+        raise TypeError(f"Output buffer under {key} key has dtype {value.dtype}, expected {port_dtype}")
+    if not port.get_partial_shape().compatible(PartialShape(list(value.shape))):
+        raise ValueError(f"Output buffer under {key} key has shape {value.shape}, "
+                         f"which is not compatible with {port.get_partial_shape()}")
+    if not value.flags["C_CONTIGUOUS"] or not value.flags["WRITEABLE"]:
+        raise ValueError(f"Output buffer under {key} key has to be C contiguous and writeable")
+    tensor = Tensor(value, shared_memory=True)
+    if isinstance(key, int):
+        request.set_output_tensor(key, tensor)
+    else:
+        request.set_tensor(key, tensor)
+    request._output_bindings[key] = (value, value.shape, value.dtype)
+
+
+def _bind_outputs(
+    request: _InferRequestWrapper,
+    outputs: Union[Dict[ValidKeys, np.ndarray], list, tuple, None] = None,
+) -> Set[ConstOutput]:
+    if outputs is None:
+        return set()
+    if isinstance(outputs, dict):
+        items = outputs.items()
+    elif isinstance(outputs, (list, tuple)):
+        items = enumerate(outputs)
+    else:
+        raise TypeError(f"Incompatible outputs of type: {type(outputs)}")
+    bound_ports = set()
+    for key, value in items:
+        bind_output(request, key, value)
+        bound_ports.add(get_output_port(request, key))
+    return bound_ports
+###
+# End of output binding.
+###
@@ -4,15 +4,8 @@
 
 import numpy as np
 
-# TODO: remove this WA and refactor OVDict when Python3.8
-# becomes minimal supported version.
-try:
-    from functools import singledispatchmethod
-except ImportError:
-    from singledispatchmethod import singledispatchmethod  # type: ignore[no-redef]
-
 from collections.abc import Mapping
-from typing import Dict, Set, Tuple, Union, Iterator, Optional
+from typing import Dict, Iterable, Set, Tuple, Union, Iterator, Optional
 from typing import KeysView, ItemsView, ValuesView
 
 from openvino._pyopenvino import Tensor, ConstOutput
@@ -24,14 +17,43 @@ def tensor_from_file(path: str) -> Tensor:
     return Tensor(np.fromfile(path, dtype=np.uint8))  # type: ignore
 
 
+class _OVDictKeyTable:
+    """Immutable table of output keys of a compiled model.
+
+    Results of the same compiled model always have the same outputs,
+    so one table is shared by every OVDict created for them.
+    """
+    __slots__ = ("ports", "names", "port_by_name")
+
+    def __init__(self, ports: Iterable[ConstOutput]) -> None:
+        self.ports: Tuple[ConstOutput, ...] = tuple(ports)
+        self.names: Tuple[Set[str], ...] = tuple(port.get_names() for port in self.ports)
+        self.port_by_name: Dict[str, ConstOutput] = {}
+        for port, port_names in zip(self.ports, self.names):
+            for name in port_names:
+                # If the name is repeated, the first port is used
+                self.port_by_name.setdefault(name, port)
+
+
 class _InferRequestWrapper(InferRequestBase):
     """InferRequest class with internal memory."""
 
     def __init__(self, other: InferRequestBase) -> None:
         # Private memeber to store newly created shared memory data
         self._inputs_data = None
+        # Private member to store dispatch plans of already seen input signatures
+        self._dispatch_plans: dict = {}
+        # Private member to store user buffers bound as output tensors
+        self._output_bindings: dict = {}
+        # Private member to store key table shared by all results of this request
+        self._key_table: Optional[_OVDictKeyTable] = None
         super().__init__(other)
 
+    def _get_key_table(self) -> _OVDictKeyTable:
+        if self._key_table is None:
+            self._key_table = _OVDictKeyTable(self.model_outputs)
+        return self._key_table
+
 
 class OVDict(Mapping):
     """Custom OpenVINO dictionary with inference results.
@@ -70,9 +92,9 @@ class OVDict(Mapping):
         # or alternatively:
         out1, out2, out3, _ = request.infer(inputs).to_tuple()
     """
-    def __init__(self, _dict: Dict[ConstOutput, np.ndarray]) -> None:
+    def __init__(self, _dict: Dict[ConstOutput, np.ndarray], _key_table: Optional[_OVDictKeyTable] = None) -> None:
         self._dict = _dict
-        self._names: Optional[Dict[ConstOutput, Set[str]]] = None
+        self._key_table = _key_table
 
     def __iter__(self) -> Iterator:
         return self._dict.__iter__()
@@ -83,42 +105,25 @@ class OVDict(Mapping):
     def __repr__(self) -> str:
         return self._dict.__repr__()
 
-    def __get_names(self) -> Dict[ConstOutput, Set[str]]:
-        """Return names of every output key.
-
-        Insert empty set if key has no name.
-        """
-        return {key: key.get_names() for key in self._dict.keys()}
-
-    def __get_key(self, index: int) -> ConstOutput:
-        return list(self._dict.keys())[index]
-
-    @singledispatchmethod
-    def __getitem_impl(self, key: Union[ConstOutput, int, str]) -> np.ndarray:
-        raise TypeError(f"Unknown key type: {type(key)}")
-
-    @__getitem_impl.register
-    def _(self, key: ConstOutput) -> np.ndarray:
-        return self._dict[key]
-
-    @__getitem_impl.register
-    def _(self, key: int) -> np.ndarray:
-        try:
-            return self._dict[self.__get_key(key)]
-        except IndexError:
-            raise KeyError(key)
-
-    @__getitem_impl.register
-    def _(self, key: str) -> np.ndarray:
-        if self._names is None:
-            self._names = self.__get_names()
-        for port, port_names in self._names.items():
-            if key in port_names:
-                return self._dict[port]
-        raise KeyError(key)
+    def __get_key_table(self) -> _OVDictKeyTable:
+        if self._key_table is None:
+            self._key_table = _OVDictKeyTable(self._dict.keys())
+        return self._key_table
 
     def __getitem__(self, key: Union[ConstOutput, int, str]) -> np.ndarray:
-        return self.__getitem_impl(key)
+        if isinstance(key, ConstOutput):
+            return self._dict[key]
+        if isinstance(key, str):
+            port = self.__get_key_table().port_by_name.get(key)
+            if port is None:
+                raise KeyError(key)
+            return self._dict[port]
+        if isinstance(key, int):
+            try:
+                return self._dict[self.__get_key_table().ports[key]]
+            except IndexError:
+                raise KeyError(key)
+        raise TypeError(f"Unknown key type: {type(key)}")
 
     def keys(self) -> KeysView[ConstOutput]:
         return self._dict.keys()
@@ -134,9 +139,7 @@ class OVDict(Mapping):
 
         Insert empty set if key has no name.
         """
-        if self._names is None:
-            self._names = self.__get_names()
-        return tuple(self._names.values())
+        return self.__get_key_table().names
 
     def to_dict(self) -> Dict[ConstOutput, np.ndarray]:
         """Return underlaying native dictionary.
@@ -7,8 +7,11 @@
 #include <pybind11/functional.h>
 #include <pybind11/stl.h>
 
+#include <atomic>
 #include <chrono>
 #include <condition_variable>
+#include <cstdint>
+#include <memory>
 #include <mutex>
 #include <queue>
 #include <string>
@@ -19,6 +22,92 @@
 
 namespace py = pybind11;
 
+// Bounded multi-producer/single-consumer ring of finished requests.
+// Producers are inference callbacks running on runtime threads without the GIL,
+// the consumer is Python thread draining completions in batches.
+class CompletionRing {
+public:
+    struct Completion {
+        size_t handle;
+        PyObject* userdata;  // strong reference, released by the consumer
+        bool failed;
+    };
+
+    explicit CompletionRing(size_t capacity) {
+        size_t size = 1;
+        while (size < capacity) {
+            size <<= 1;
+        }
+        m_mask = size - 1;
+        m_cells.reset(new Cell[size]);
+        for (size_t i = 0; i < size; i++) {
+            m_cells[i].sequence.store(i, std::memory_order_relaxed);
+        }
+        m_enqueue_pos.store(0, std::memory_order_relaxed);
+        m_dequeue_pos.store(0, std::memory_order_relaxed);
+    }
+
+    bool push(const Completion& completion) {
+        Cell* cell;
+        size_t pos = m_enqueue_pos.load(std::memory_order_relaxed);
+        for (;;) {
+            cell = &m_cells[pos & m_mask];
+            size_t sequence = cell->sequence.load(std::memory_order_acquire);
+            auto diff = static_cast<std::intptr_t>(sequence) - static_cast<std::intptr_t>(pos);
+            if (diff == 0) {
+                if (m_enqueue_pos.compare_exchange_weak(pos, pos + 1, std::memory_order_relaxed)) {
+                    break;
+                }
+            } else if (diff < 0) {
+                return false;
+            } else {
+                pos = m_enqueue_pos.load(std::memory_order_relaxed);
+            }
+        }
+        cell->completion = completion;
+        cell->sequence.store(pos + 1, std::memory_order_release);
+        return true;
+    }
+
+    bool pop(Completion& completion) {
+        Cell* cell;
+        size_t pos = m_dequeue_pos.load(std::memory_order_relaxed);
+        for (;;) {
+            cell = &m_cells[pos & m_mask];
+            size_t sequence = cell->sequence.load(std::memory_order_acquire);
+            auto diff = static_cast<std::intptr_t>(sequence) - static_cast<std::intptr_t>(pos + 1);
+            if (diff == 0) {
+                if (m_dequeue_pos.compare_exchange_weak(pos, pos + 1, std::memory_order_relaxed)) {
+                    break;
+                }
+            } else if (diff < 0) {
+                return false;
+            } else {
+                pos = m_dequeue_pos.load(std::memory_order_relaxed);
+            }
+        }
+        completion = cell->completion;
+        cell->sequence.store(pos + m_mask + 1, std::memory_order_release);
+        return true;
+    }
+
+    bool empty() const {
+        size_t pos = m_dequeue_pos.load(std::memory_order_relaxed);
+        return m_cells[pos & m_mask].sequence.load(std::memory_order_acquire) != pos + 1;
+    }
+
+private:
+    struct Cell {
+        std::atomic<size_t> sequence;
+        Completion completion;
+    };
+
+    std::unique_ptr<Cell[]> m_cells;
+    size_t m_mask;
+    std::atomic<size_t> m_enqueue_pos;
+    std::atomic<size_t> m_dequeue_pos;
+};
+
 class AsyncInferQueue {
 public:
     AsyncInferQueue(ov::CompiledModel& model, size_t jobs) {
@@ -34,6 +123,7 @@ public:
             // copy Inputs and Outputs from ov::CompiledModel
             m_requests.emplace_back(model.create_infer_request(), model.inputs(), model.outputs(), false);
             m_user_ids.push_back(py::none());
+            m_completion_user_ids.push_back(nullptr);
             m_idle_handles.push(handle);
         }
 
@@ -42,6 +132,16 @@ public:
 
     ~AsyncInferQueue() {
         m_requests.clear();
+        // Release userdata of completions which were never drained
+        if (m_completions) {
+            CompletionRing::Completion completion;
+            while (m_completions->pop(completion)) {
+                Py_XDECREF(completion.userdata);
+            }
+        }
+        for (auto&& userdata : m_completion_user_ids) {
+            Py_XDECREF(userdata);
+        }
     }
 
     bool _is_ready() {
@@ -51,7 +151,7 @@ public:
         std::lock_guard<std::mutex> lock(m_mutex);
         if (m_errors.size() > 0)
             throw m_errors.front();
-        return !(m_idle_handles.empty());
+        return !(m_idle_handles.empty()) && (!m_completion_mode || m_outstanding < m_completion_capacity);
     }
 
     size_t get_idle_request_id() {
@@ -61,7 +161,9 @@ public:
         // acquire the mutex to access m_errors and m_idle_handles
         std::unique_lock<std::mutex> lock(m_mutex);
         m_cv.wait(lock, [this] {
-            return !(m_idle_handles.empty());
+            // In completion queue mode every started request occupies a slot in the ring
+            // until it is drained, new requests are not started when the ring is full.
+            return !(m_idle_handles.empty()) && (!m_completion_mode || m_outstanding < m_completion_capacity);
         });
         size_t idle_handle = m_idle_handles.front();
         // wait for request to make sure it returned from callback
@@ -84,7 +186,26 @@ public:
             throw m_errors.front();
     }
 
+    void start_handle(size_t handle, py::object& userdata) {
+        {
+            std::lock_guard<std::mutex> lock(m_mutex);
+            m_idle_handles.pop();
+            if (m_completion_mode) {
+                m_outstanding++;
+            }
+        }
+        // Set new inputs label/id from user
+        m_user_ids[handle] = userdata;
+        if (m_completion_mode) {
+            // Keep additional reference which travels with the completion,
+            // m_user_ids may be overwritten before the completion is drained.
+            Py_XDECREF(m_completion_user_ids[handle]);
+            m_completion_user_ids[handle] = userdata.inc_ref().ptr();
+        }
+    }
+
     void set_default_callbacks() {
+        m_completion_mode = false;
         for (size_t handle = 0; handle < m_requests.size(); handle++) {
             // auto end_time = m_requests[handle].m_end_time; // TODO: pass it bellow? like in InferRequestWrapper
 
@@ -111,6 +232,7 @@ public:
     }
 
     void set_custom_callbacks(py::function f_callback) {
+        m_completion_mode = false;
         for (size_t handle = 0; handle < m_requests.size(); handle++) {
             m_requests[handle].m_request.set_callback([this, f_callback, handle](std::exception_ptr exception_ptr) {
                 *m_requests[handle].m_end_time = Time::now();
@@ -151,6 +273,108 @@ public:
         }
     }
 
+    void set_completion_queue(size_t capacity) {
+        if (capacity == 0) {
+            capacity = 8 * m_requests.size();
+        }
+        if (capacity < m_requests.size()) {
+            OPENVINO_THROW("Capacity of completion queue cannot be smaller than number of jobs: ",
+                           m_requests.size());
+        }
+        {
+            py::gil_scoped_release release;
+            // Requests must not report into the previous callbacks while the mode is switched
+            for (auto&& request : m_requests) {
+                request.m_request.wait();
+            }
+        }
+        if (m_completions && !m_completions->empty()) {
+            OPENVINO_THROW("Completion queue contains not drained items, call drain() before resetting it.");
+        }
+        m_completions.reset(new CompletionRing(capacity));
+        m_completion_capacity = capacity;
+        m_outstanding = 0;
+        m_completion_mode = true;
+
+        for (size_t handle = 0; handle < m_requests.size(); handle++) {
+            m_requests[handle].m_request.set_callback([this, handle](std::exception_ptr exception_ptr) {
+                *m_requests[handle].m_end_time = Time::now();
+                // GIL is not acquired here, only the raw pointer to userdata is moved into the ring.
+                // Completion is pushed before the handle becomes idle to keep order of completions
+                // the same as in the callback mode. Capacity is guarded by get_idle_request_id(),
+                // so pushing cannot fail.
+                m_completions->push({handle, m_completion_user_ids[handle], exception_ptr != nullptr});
+                m_completion_user_ids[handle] = nullptr;
+                {
+                    // acquire the mutex to access m_idle_handles
+                    std::lock_guard<std::mutex> lock(m_mutex);
+                    // Add idle handle to queue
+                    m_idle_handles.push(handle);
+                }
+                // Notify locks in getIdleRequestId()
+                m_cv.notify_one();
+                {
+                    // Synchronize with waiting drain() to avoid lost wake-ups
+                    std::lock_guard<std::mutex> lock(m_completion_mutex);
+                }
+                m_completion_cv.notify_one();
+
+                try {
+                    if (exception_ptr) {
+                        std::rethrow_exception(exception_ptr);
+                    }
+                } catch (const std::exception& e) {
+                    OPENVINO_THROW(e.what());
+                }
+            });
+        }
+    }
+
+    py::list drain(size_t max_items, int64_t timeout) {
+        if (!m_completions) {
+            OPENVINO_THROW("Completion queue is not set, call set_completion_queue() first.");
+        }
+        std::vector<CompletionRing::Completion> batch;
+        {
+            // release GIL to allow callbacks and other Python threads to run while waiting
+            py::gil_scoped_release release;
+            auto is_ready = [this] {
+                return !m_completions->empty() || m_outstanding == 0;
+            };
+            if (timeout != 0) {
+                std::unique_lock<std::mutex> lock(m_completion_mutex);
+                if (timeout < 0) {
+                    m_completion_cv.wait(lock, is_ready);
+                } else {
+                    m_completion_cv.wait_for(lock, std::chrono::milliseconds(timeout), is_ready);
+                }
+            }
+            CompletionRing::Completion completion;
+            while ((max_items == 0 || batch.size() < max_items) && m_completions->pop(completion)) {
+                batch.push_back(completion);
+            }
+        }
+        if (!batch.empty()) {
+            {
+                std::lock_guard<std::mutex> lock(m_mutex);
+                m_outstanding -= batch.size();
+            }
+            // Notify locks in getIdleRequestId() waiting for free space in the ring
+            m_cv.notify_all();
+        }
+
+        py::list result;
+        for (auto&& item : batch) {
+            auto userdata = py::reinterpret_steal<py::object>(item.userdata);
+            // Same as in callback mode, failed requests are not reported to the user.
+            // Error is rethrown by wait_all() and get_idle_request_id().
+            if (!item.failed) {
+                result.append(py::make_tuple(item.handle, userdata));
+            }
+        }
+        return result;
+    }
+
     // AsyncInferQueue is the owner of all requests. When AsyncInferQueue is destroyed,
     // all of requests are destroyed as well.
     std::vector<InferRequestWrapper> m_requests;
@@ -159,6 +383,14 @@ public:
     std::mutex m_mutex;
     std::condition_variable m_cv;
     std::queue<py::error_already_set> m_errors;
+    // Completion queue mode
+    bool m_completion_mode = false;
+    size_t m_completion_capacity = 0;
+    std::atomic<size_t> m_outstanding{0};  // started and not drained requests
+    std::unique_ptr<CompletionRing> m_completions;
+    std::vector<PyObject*> m_completion_user_ids;
+    std::mutex m_completion_mutex;
+    std::condition_variable m_completion_cv;
 };
 
 void regclass_AsyncInferQueue(py::module m) {
@@ -187,12 +419,7 @@ void regclass_AsyncInferQueue(py::module m) {
             // getIdleRequestId function has an intention to block InferQueue
             // until there is at least one idle (free to use) InferRequest
             auto handle = self.get_idle_request_id();
-            {
-                std::lock_guard<std::mutex> lock(self.m_mutex);
-                self.m_idle_handles.pop();
-            }
-            // Set new inputs label/id from user
-            self.m_user_ids[handle] = userdata;
+            self.start_handle(handle, userdata);
             // Update inputs if there are any
             self.m_requests[handle].m_request.set_input_tensor(inputs);
             // Now GIL can be released - we are NOT working with Python objects in this block
@@ -233,12 +460,7 @@ void regclass_AsyncInferQueue(py::module m) {
             // getIdleRequestId function has an intention to block InferQueue
             // until there is at least one idle (free to use) InferRequest
             auto handle = self.get_idle_request_id();
-            {
-                std::lock_guard<std::mutex> lock(self.m_mutex);
-                self.m_idle_handles.pop();
-            }
-            // Set new inputs label/id from user
-            self.m_user_ids[handle] = userdata;
+            self.start_handle(handle, userdata);
             // Update inputs if there are any
             Common::set_request_tensors(self.m_requests[handle].m_request, inputs);
             // Now GIL can be released - we are NOT working with Python objects in this block
@@ -318,6 +540,67 @@ void regclass_AsyncInferQueue(py::module m) {
             :type callback: function
         )");
 
+    cls.def("set_completion_queue",
+            &AsyncInferQueue::set_completion_queue,
+            py::arg("capacity") = 0,
+            R"(
+            Switches AsyncInferQueue to the completion queue mode.
+
+            Instead of calling Python function for every finished request,
+            ids of finished requests and their userdata are stored in a lock-free
+            ring buffer without acquiring the GIL. Completions are retrieved in
+            batches with `drain` method, in the order in which requests finished.
+
+            Each started request occupies a slot in the ring until it is drained,
+            `start_async` and `get_idle_request_id` block while the ring is full.
+            Requests which failed during inference are not reported,
+            the error is rethrown by `wait_all` and `get_idle_request_id`.
+
+            Calling `set_callback` switches the queue back to the callback mode.
+
+            GIL is released while waiting for running requests.
+
+            :param capacity: Maximum number of not drained completions. If 0,
+            capacity will be set to eight times the number of jobs. Default: 0
+            :type capacity: int
+        )");
+
+    cls.def("drain",
+            &AsyncInferQueue::drain,
+            py::arg("max_items") = 0,
+            py::arg("timeout") = -1,
+            R"(
+            Retrieves finished requests in the completion queue mode.
+
+            Blocks until at least one completion is available, the timeout has
+            elapsed or there are no more running nor not drained requests.
+            Completions of failed requests are drained but not returned, so the
+            list is also empty if all drained requests failed. Use `outstanding`
+            to check whether there are requests which are not drained yet.
+
+            GIL is released while waiting for completions.
+
+            :param max_items: Maximum number of returned completions. If 0,
+            all available completions are returned. Default: 0
+            :type max_items: int
+            :param timeout: Maximum duration in milliseconds (ms) of blocking call.
+            If -1, waits without limit. If 0, returns immediately. Default: -1
+            :type timeout: int
+            :return: List of pairs of InferRequest id and userdata.
+            :rtype: List[Tuple[int, Any]]
+        )");
+
+    cls.def_property_readonly(
+        "outstanding",
+        [](AsyncInferQueue& self) {
+            return self.m_outstanding.load();
+        },
+        R"(
+        Number of started requests which are not drained yet in the completion queue mode.
+
+        :rtype: int
+    )");
+
     cls.def(
         "__len__",
         [](AsyncInferQueue& self) {
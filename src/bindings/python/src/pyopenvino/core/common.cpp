@@ -184,6 +184,31 @@ ov::op::v0::Constant create_shared(py::array& array) {
     // If passed array is not C-style, throw an error.
     OPENVINO_THROW("SHARED MEMORY MODE FOR THIS CONSTANT IS NOT APPLICABLE! Passed numpy array must be C contiguous.");
 }
+
+ov::op::v0::Constant constant_from_array(py::array& array, const ov::element::Type& ov_type, bool shared_memory) {
+    OPENVINO_ASSERT(static_cast<size_t>(array.itemsize()) * 8 == ov_type.bitwidth(),
+                    "Size of array elements (",
+                    array.itemsize(),
+                    " bytes) doesn't match element type ",
+                    ov_type);
+    if (!shared_memory) {
+        if (!array_helpers::is_contiguous(array)) {
+            array = array_helpers::as_contiguous(array, array_helpers::get_ov_type(array));
+        }
+        return ov::op::v0::Constant(ov_type,
+                                    array_helpers::get_shape(array),
+                                    array.ndim() == 0 ? array.data() : array.data(0));
+    }
+    if (array_helpers::is_contiguous(array)) {
+        // Memory is owned by the array, the buffer keeps a reference to it for the lifetime of Constant.
+        auto memory = std::make_shared<ngraph::runtime::SharedBuffer<py::array>>(
+            static_cast<char*>(array.ndim() == 0 ? array.mutable_data() : array.mutable_data(0)),
+            array.ndim() == 0 ? array.itemsize() : array.nbytes(),
+            array);
+        return ov::op::v0::Constant(ov_type, array_helpers::get_shape(array), memory);
+    }
+    OPENVINO_THROW("SHARED MEMORY MODE FOR THIS CONSTANT IS NOT APPLICABLE! Passed numpy array must be C contiguous.");
+}
 OPENVINO_SUPPRESS_DEPRECATED_END
 
 template <>
@@ -84,6 +84,8 @@ T object_from_data(D& data, bool shared_memory) {
 
 ov::Tensor tensor_from_pointer(py::array& array, const ov::Shape& shape, const ov::element::Type& ov_type);
 
+ov::op::v0::Constant constant_from_array(py::array& array, const ov::element::Type& ov_type, bool shared_memory);
+
 ov::Tensor tensor_from_pointer(py::array& array, const ov::Output<const ov::Node>& port);
 
 ov::PartialShape partial_shape_from_list(const py::list& shape);
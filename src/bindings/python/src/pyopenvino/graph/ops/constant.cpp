@@ -106,6 +106,26 @@ void regclass_graph_op_Constant(py::module m) {
                  }),
                  py::arg("array"),
                  py::arg("shared_memory") = false);
+    constant.def(py::init([](py::array& array, const ov::element::Type& type, bool shared_memory) {
+                     return Common::constant_from_array(array, type, shared_memory);
+                 }),
+                 py::arg("array"),
+                 py::arg("type"),
+                 py::arg("shared_memory") = false,
+                 R"(
+                    Creates Constant of given element type from array data.
+
+                    Array data is reinterpreted, e.g. bf16 values can be passed as int16 array.
+                    Size of array elements must match the size of the element type.
+
+                    :param array: Array with data.
+                    :type array: numpy.ndarray
+                    :param type: Element type of Constant.
+                    :type type: openvino.runtime.Type
+                    :param shared_memory: If `True`, Constant shares memory of C contiguous array
+                                          and keeps a reference to it.
+                    :type shared_memory: bool
+                 )");
     // Tensor-based constructors
     constant.def(py::init([](ov::Tensor& tensor, bool shared_memory) {
                      return Common::object_from_data<ov::op::v0::Constant>(tensor, shared_memory);
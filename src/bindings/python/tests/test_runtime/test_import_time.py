@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def _get_import_times(statement):
+    """Run statement in a new interpreter with `-X importtime` and return cumulative import times in us."""
+    args = [sys.executable, "-X", "importtime", "-c", statement]
+    status = subprocess.run(args, env=os.environ, capture_output=True, text=True)
+    assert not status.returncode, status.stderr
+    times = {}
+    for line in status.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_opsets_not_imported_with_runtime():
+    times = _get_import_times("import openvino.runtime")
+
+    assert "openvino.runtime" in times
+    assert not [name for name in times if name.startswith("openvino.runtime.opset")]
+    assert "openvino.runtime.utils.node_factory" not in times
+
+
+def test_opsets_imported_on_access():
+    times = _get_import_times("import openvino.runtime as ov; ov.opset12.parameter([1])")
+
+    assert "openvino.runtime.opset12" in times
+
+
+def test_lazy_opsets_attributes():
+    import openvino.runtime as ov
+
+    for version in range(1, 13):
+        assert f"opset{version}" in dir(ov)
+        assert getattr(ov, f"opset{version}").__name__ == f"openvino.runtime.opset{version}"
+
+    with pytest.raises(AttributeError) as e:
+        _ = ov.opset0
+    assert "has no attribute 'opset0'" in str(e.value)
+
+
+def test_node_operators():
+    import openvino.runtime as ov
+
+    left = ov.opset12.parameter([2], name="left")
+    right = ov.opset12.parameter([2], name="right")
+
+    assert (left + right).get_type_name() == "Add"
+    assert (left - right).get_type_name() == "Subtract"
+    assert (1 - right).get_type_name() == "Subtract"
+    assert (left * 2).get_type_name() == "Multiply"
+    assert (left / right).get_type_name() == "Divide"
+    assert (left == right).get_type_name() == "Equal"
+    assert (left >= right).get_type_name() == "GreaterEqual"
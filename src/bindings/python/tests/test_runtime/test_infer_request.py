@@ -654,6 +654,126 @@ def test_infer_queue_get_idle_handle(device):
     queue.wait_all()
 
 
+@pytest.mark.parametrize("max_items", [0, 1, 3])
+def test_infer_queue_completion_queue(device, max_items):
+    jobs = 20
+    num_request = 4
+    param = ops.parameter([10])
+    model = Model(ops.relu(param), [param])
+    core = Core()
+    compiled_model = core.compile_model(model, device)
+    infer_queue = AsyncInferQueue(compiled_model, num_request)
+    infer_queue.set_completion_queue()
+
+    finished = []
+    for i in range(jobs):
+        infer_queue.start_async({0: np.full(10, i, dtype=np.float32)}, i)
+        for request_id, userdata in infer_queue.drain(max_items, timeout=0):
+            assert 0 <= request_id < num_request
+            finished.append(userdata)
+    for request_id, userdata in infer_queue.completed(max_items):
+        assert 0 <= request_id < num_request
+        finished.append(userdata)
+
+    assert sorted(finished) == list(range(jobs))
+    assert infer_queue.drain(timeout=0) == []
+    infer_queue.wait_all()
+
+
+def test_infer_queue_completion_queue_blocks_when_full(device):
+    param = ops.parameter([10])
+    model = Model(ops.relu(param), [param])
+    core = Core()
+    compiled_model = core.compile_model(model, device)
+    infer_queue = AsyncInferQueue(compiled_model, 2)
+    infer_queue.set_completion_queue(capacity=2)
+
+    infer_queue.start_async(userdata="a")
+    infer_queue.start_async(userdata="b")
+    infer_queue.wait_all()
+    assert not infer_queue.is_ready()
+    assert sorted(userdata for _, userdata in infer_queue.drain()) == ["a", "b"]
+    assert infer_queue.is_ready()
+
+
+def test_infer_queue_completion_queue_capacity(device):
+    param = ops.parameter([10])
+    model = Model(ops.relu(param), [param])
+    core = Core()
+    compiled_model = core.compile_model(model, device)
+    infer_queue = AsyncInferQueue(compiled_model, 4)
+
+    with pytest.raises(RuntimeError) as e:
+        infer_queue.drain()
+    assert "Completion queue is not set" in str(e.value)
+
+    with pytest.raises(RuntimeError) as e:
+        infer_queue.set_completion_queue(capacity=2)
+    assert "cannot be smaller than number of jobs" in str(e.value)
+
+
+def test_infer_queue_completion_queue_back_to_callback(device):
+    param = ops.parameter([10])
+    model = Model(ops.relu(param), [param])
+    core = Core()
+    compiled_model = core.compile_model(model, device)
+    infer_queue = AsyncInferQueue(compiled_model, 2)
+    called = []
+
+    infer_queue.set_completion_queue()
+    infer_queue.start_async(userdata=0)
+    assert [userdata for _, userdata in infer_queue.completed()] == [0]
+
+    infer_queue.set_callback(lambda _, userdata: called.append(userdata))
+    infer_queue.start_async(userdata=1)
+    infer_queue.wait_all()
+    assert called == [1]
+
+
+@pytest.mark.parametrize("num_request", [1, 4])
+def test_infer_queue_completion_queue_drains_every_job_once(device, num_request):
+    jobs = 500
+    param = ops.parameter([8])
+    model = Model(ops.relu(param), [param])
+    core = Core()
+    compiled_model = core.compile_model(model, device)
+    data = np.ones(8, dtype=np.float32)
+
+    infer_queue = AsyncInferQueue(compiled_model, num_request)
+    infer_queue.set_completion_queue()
+    drained = []
+    for i in range(jobs):
+        infer_queue.start_async({0: data}, i, share_inputs=True)
+        drained += [userdata for _, userdata in infer_queue.drain(timeout=0)]
+    drained += [userdata for _, userdata in infer_queue.completed()]
+
+    assert sorted(drained) == list(range(jobs))
+
+
+@skip_need_mock_op
+def test_infer_queue_completion_queue_failed_requests(device):
+    core = Core()
+    data = ops.parameter([10], dtype=np.float32, name="data")
+    k_op = ops.parameter(Shape([]), dtype=np.int32, name="k")
+    emb = ops.topk(data, k_op, axis=0, mode="max", sort="value")
+    model = Model(emb, [data, k_op])
+    compiled_model = core.compile_model(model, device)
+    infer_queue = AsyncInferQueue(compiled_model, 4)
+    infer_queue.set_completion_queue()
+
+    data_tensor = Tensor(np.arange(10).astype(np.float32))
+    valid_k, invalid_k = Tensor(np.array(3, dtype=np.int32)), Tensor(np.array(11, dtype=np.int32))
+    # Batches made only of failed requests must not stop iteration over other requests
+    for i in range(4):
+        infer_queue.start_async({"data": data_tensor, "k": invalid_k if i < 2 else valid_k}, i)
+    completed = [userdata for _, userdata in infer_queue.completed(max_items=1)]
+
+    assert sorted(completed) == [2, 3]
+    assert infer_queue.outstanding == 0
+    with pytest.raises(RuntimeError):
+        infer_queue.wait_all()
+
+
 @pytest.mark.parametrize("data_type",
                          [np.float32,
                           np.int32,
@@ -1247,3 +1367,67 @@ def test_infer_request_share_memory(device, share_inputs, share_outputs, is_posi
     else:
         assert not out_tensor_shares
         assert results[0].flags["OWNDATA"] is True
+
+
+def test_infer_with_output_buffers(device):
+    param = ops.parameter([2, 2], np.float32, name="data")
+    relu = ops.relu(param)
+    relu.output(0).get_tensor().set_names({"relu_out"})
+    core = Core()
+    compiled = core.compile_model(Model(relu, [param]), device)
+    request = compiled.create_infer_request()
+    buffers = [np.zeros([2, 2], dtype=np.float32) for _ in range(2)]
+
+    for i in range(4):
+        input_data = np.full([2, 2], i, dtype=np.float32)
+        buffer = buffers[i % 2]
+        results = request.infer({0: input_data}, outputs={"relu_out": buffer})
+        assert np.array_equal(buffer, input_data)
+        assert np.shares_memory(results[0], buffer)
+        assert request._output_bindings["relu_out"][0] is buffer
+
+    # Buffers are bound by index as well
+    buffer = np.zeros([2, 2], dtype=np.float32)
+    compiled([np.ones([2, 2], dtype=np.float32)], outputs=[buffer])
+    assert np.array_equal(buffer, np.ones([2, 2], dtype=np.float32))
+
+    request.start_async({0: np.full([2, 2], 5, dtype=np.float32)}, outputs={0: buffer})
+    request.wait()
+    assert np.array_equal(buffer, np.full([2, 2], 5, dtype=np.float32))
+
+
+@pytest.mark.parametrize("share_outputs", [True, False])
+def test_infer_with_partially_bound_outputs(device, share_outputs):
+    param = ops.parameter([2, 2], np.float32, name="data")
+    model = Model([ops.relu(param), ops.negative(param)], [param])
+    compiled = Core().compile_model(model, device)
+    request = compiled.create_infer_request()
+    buffer = np.zeros([2, 2], dtype=np.float32)
+
+    first = request.infer({0: np.ones([2, 2], dtype=np.float32)}, share_outputs=share_outputs, outputs={0: buffer})
+    unbound = first[1]
+    request.infer({0: np.full([2, 2], 2, dtype=np.float32)}, share_outputs=share_outputs, outputs={0: buffer})
+
+    assert np.shares_memory(first[0], buffer)
+    assert np.shares_memory(request.get_output_tensor(1).data, unbound) is share_outputs
+    if not share_outputs:
+        # Result of an unbound output is a copy and is not overwritten by the next inference
+        assert np.array_equal(unbound, np.full([2, 2], -1, dtype=np.float32))
+
+
+@pytest.mark.parametrize(("buffer", "error", "message"), [
+    (np.zeros([2, 2], dtype=np.float64), TypeError, "has dtype float64, expected float32"),
+    (np.zeros([3, 2], dtype=np.float32), ValueError, "which is not compatible with"),
+    (np.zeros([2, 2], dtype=np.float32, order="F").T[:, :1], ValueError, "is not compatible"),
+    (np.asfortranarray(np.zeros([2, 2], dtype=np.float32)), ValueError, "has to be C contiguous and writeable"),
+    ([[0, 0], [0, 0]], TypeError, "Incompatible output buffer of type"),
+])
+def test_infer_with_invalid_output_buffers(device, buffer, error, message):
+    param = ops.parameter([2, 2], np.float32)
+    core = Core()
+    compiled = core.compile_model(Model(ops.relu(param), [param]), device)
+    request = compiled.create_infer_request()
+
+    with pytest.raises(error) as e:
+        request.infer({0: np.ones([2, 2], dtype=np.float32)}, outputs={0: buffer})
+    assert message in str(e.value)
@@ -149,3 +149,37 @@ def test_with_scalars(cls, shared_flag, scalar):
         assert ov_object.data == 6
     else:
         assert not (np.shares_memory(_scalar, ov_object.data))
+
+
+@pytest.mark.parametrize("shared_flag", [True, False])
+@pytest.mark.parametrize(("ov_type", "numpy_dtype"), [
+    (ov.Type.bf16, np.int16),
+    (ov.Type.f16, np.uint16),
+    (ov.Type.f32, np.int32),
+    (ov.Type.u8, np.int8),
+])
+def test_constant_with_reinterpreted_type(shared_flag, ov_type, numpy_dtype):
+    arr = np.arange(12, dtype=numpy_dtype).reshape(3, 4)
+    ov_object = Constant(arr, ov_type, shared_memory=shared_flag)
+
+    assert ov_object.get_element_type() == ov_type
+    assert list(ov_object.get_output_shape(0)) == [3, 4]
+    assert np.array_equal(ov_object.data.view(numpy_dtype), arr)
+    assert np.shares_memory(arr, ov_object.data) == shared_flag
+
+
+def test_constant_with_reinterpreted_type_non_contiguous():
+    arr = np.arange(12, dtype=np.int16).reshape(3, 4).T
+
+    with pytest.raises(RuntimeError) as e:
+        Constant(arr, ov.Type.bf16, shared_memory=True)
+    assert "SHARED MEMORY MODE FOR THIS CONSTANT IS NOT APPLICABLE" in str(e.value)
+
+    ov_object = Constant(arr, ov.Type.bf16, shared_memory=False)
+    assert np.array_equal(ov_object.data.view(np.int16), arr)
+
+
+def test_constant_with_reinterpreted_type_size_mismatch():
+    with pytest.raises(RuntimeError) as e:
+        Constant(np.zeros(4, dtype=np.int32), ov.Type.bf16, shared_memory=True)
+    assert "doesn't match element type" in str(e.value)
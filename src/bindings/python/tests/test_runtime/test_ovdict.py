@@ -257,3 +257,54 @@ def test_ovdict_multi_output_tuple0(device, is_direct, use_function):
 
     assert np.equal(result[outs[0]], out0).all()
     assert np.equal(result[outs[1]], out1).all()
+
+
+def test_ovdict_key_table_shared(device):
+    output_names = ["output_0", "output_1"]
+    _, compiled_model = _get_ovdict(
+        device,
+        input_shape=(1, 10),
+        multi_output=True,
+        direct_infer=True,
+        split_num=2,
+        output_names=output_names,
+    )
+    request = compiled_model.create_infer_request()
+    input_data = np.random.random((1, 10)).astype(np.float32)
+
+    result_0 = request.infer(input_data)
+    result_1 = request.infer(input_data)
+    other_request = compiled_model.create_infer_request()
+    result_2 = other_request.infer(input_data)
+
+    assert result_0._key_table is result_1._key_table
+    assert result_0._key_table is result_2._key_table
+    assert result_0.names() is result_2.names()
+    assert np.array_equal(result_0["output_1"], result_0[1])
+    assert np.array_equal(result_0[-1], result_0[1])
+
+
+def test_ovdict_without_key_table(device):
+    result, request = _get_ovdict(device, output_names=["output_0"])
+    native_dict = OVDict(result.to_dict())
+
+    assert np.array_equal(native_dict["output_0"], result["output_0"])
+    assert np.array_equal(native_dict[0], result[request.model_outputs[0]])
+    assert native_dict.names() == result.names()
+
+
+@pytest.mark.parametrize("num_outputs", [1, 64])
+def test_ovdict_lookup_many_outputs(device, num_outputs):
+    output_names = [f"output_{i}" for i in range(num_outputs)]
+    param = ops.parameter([1, num_outputs], np.float32)
+    model = Model(ops.split(param, 1, num_outputs).outputs() if num_outputs > 1 else [ops.abs(param)], [param])
+    for i, name in enumerate(output_names):
+        model.output(i).tensor.names = {name}
+    compiled_model = Core().compile_model(model, device)
+    result = compiled_model.create_infer_request().infer(np.arange(num_outputs, dtype=np.float32).reshape(1, -1))
+
+    for i, (port, name) in enumerate(zip(compiled_model.outputs, output_names)):
+        assert result[name] is result[port]
+        assert result[i] is result[port]
+        assert result[i - num_outputs] is result[port]
+        assert result[name][0, 0] == i
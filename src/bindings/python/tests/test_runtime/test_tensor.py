@@ -11,10 +11,11 @@ import numpy as np
 import openvino.runtime as ov
 import openvino.runtime.opset11 as ops
 from openvino import Tensor
-from openvino.helpers import pack_data, unpack_data
+from openvino.helpers import pack_data, unpack_data, pack_data_chunks, unpack_data_chunks
 
 import pytest
 
+
 from tests.test_utils.test_utils import generate_image, generate_relu_compiled_model
 
 
@@ -387,6 +388,42 @@ def test_packing(shape, low, high, ov_type, dtype):
     assert np.array_equal(unpacked, data)
 
 
+@pytest.mark.parametrize(("values", "ov_type", "packed"), [
+    ([7, 8], ov.Type.u4, [120]),
+    ([-1, 7, -8], ov.Type.i4, [247, 128]),
+    ([1, 0, 1, 1, 0, 0, 0, 1, 1], ov.Type.u1, [177, 128]),
+])
+def test_packing_bit_order(values, ov_type, packed):
+    dtype = np.int8 if ov_type == ov.Type.i4 else np.uint8
+    data = np.array(values, dtype=dtype)
+    packed_data = pack_data(data, ov_type)
+    assert packed_data.dtype == np.uint8
+    assert np.array_equal(packed_data, np.array(packed, dtype=np.uint8))
+    unpacked = unpack_data(packed_data, ov_type, [len(values)])
+    assert unpacked.dtype == dtype
+    assert np.array_equal(unpacked, data)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 1024])
+@pytest.mark.parametrize(("low", "high", "ov_type", "dtype"), [
+    (0, 2, ov.Type.u1, np.uint8),
+    (0, 16, ov.Type.u4, np.uint8),
+    (-8, 7, ov.Type.i4, np.int8),
+])
+def test_packing_chunks(tmp_path, chunk_size, low, high, ov_type, dtype):
+    shape = [3, 27, 27]
+    data = np.random.uniform(low, high, shape).astype(dtype)
+    mapped = np.lib.format.open_memmap(tmp_path / "data.npy", mode="w+", dtype=dtype, shape=tuple(shape))
+    mapped[:] = data
+
+    packed_data = np.concatenate(list(pack_data_chunks(mapped, ov_type, chunk_size)))
+    assert np.array_equal(packed_data, pack_data(data, ov_type))
+
+    chunks = list(unpack_data_chunks(packed_data, ov_type, data.size, chunk_size))
+    assert all(chunk.size <= chunk_size * 8 // ov_type.bitwidth for chunk in chunks)
+    assert np.array_equal(np.concatenate(chunks).reshape(shape), data)
+
+
 @pytest.mark.parametrize("dtype", [
     (np.uint8),
     (np.int8),
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import time
+
+import numpy as np
+import pytest
+import torch
+
+import openvino.runtime.opset12 as ops
+from openvino.runtime import Core, Model, Type
+from openvino.frontend.pytorch.torchdynamo.cache import CompiledModelCache, ModelDiskCache, bucket, model_cache_key
+
+
+@pytest.mark.parametrize(("dim", "expected"), [
+    (1, (1, 1)),
+    (2, (2, 2)),
+    (3, (3, 4)),
+    (4, (3, 4)),
+    (5, (5, 8)),
+    (100, (65, 128)),
+    (128, (65, 128)),
+])
+def test_bucket(dim, expected):
+    assert bucket(dim) == expected
+
+
+def test_cache_lru_eviction():
+    cache = CompiledModelCache(max_entries=2)
+    cache.put("a", "compiled_a")
+    cache.put("b", "compiled_b")
+    assert cache.get("a") == "compiled_a"
+    cache.put("c", "compiled_c")
+
+    assert "b" not in cache
+    assert cache.get("a") == "compiled_a"
+    assert cache.get("c") == "compiled_c"
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+    assert stats["compilations"] == 3
+
+
+def test_cache_byte_budget():
+    cache = CompiledModelCache(max_bytes=100)
+    cache.put("a", "compiled_a", nbytes=60, compile_time=1.0)
+    cache.put("b", "compiled_b", nbytes=60, compile_time=2.0)
+
+    assert "a" not in cache
+    assert cache.stats()["bytes"] == 60
+    assert cache.stats()["compile_time"] == 3.0
+
+    # Single entry is kept even if it exceeds the budget
+    cache.put("c", "compiled_c", nbytes=200)
+    assert len(cache) == 1
+    assert "c" in cache
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats()["compilations"] == 0
+
+
+def test_cache_signature_static():
+    cache = CompiledModelCache()
+    args = [torch.zeros(1, 7, dtype=torch.int64), torch.zeros(1, 7, 16)]
+
+    assert cache.signature(("graph", 0), args) == ((torch.int64, (1, 7)), (torch.float32, (1, 7, 16)))
+    assert cache.signature(("graph", 0), [torch.zeros(1, 9, dtype=torch.int64), torch.zeros(1, 9, 16)]) == \
+        ((torch.int64, (1, 9)), (torch.float32, (1, 9, 16)))
+
+
+def test_cache_signature_dynamic():
+    cache = CompiledModelCache(dynamic_shapes=True)
+    key = ("graph", 0)
+
+    assert cache.signature(key, [torch.zeros(1, 7)]) == ((torch.float32, (1, 7)),)
+    # Only the changed dimension is bucketed
+    assert cache.signature(key, [torch.zeros(1, 9)]) == ((torch.float32, (1, (9, 16))),)
+    assert cache.signature(key, [torch.zeros(1, 12)]) == ((torch.float32, (1, (9, 16))),)
+    assert cache.signature(key, [torch.zeros(1, 7)]) == ((torch.float32, (1, (5, 8))),)
+    # Other partitions are not affected
+    assert cache.signature(("graph", 1), [torch.zeros(1, 9)]) == ((torch.float32, (1, 9)),)
+
+
+class Scale(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.weight = torch.nn.Parameter(torch.ones(4))
+
+    def forward(self, x):
+        return x * self.weight
+
+
+def test_model_cache_key():
+    gm = torch.fx.symbolic_trace(Scale())
+    args = [torch.zeros(2, 4)]
+    key = model_cache_key(gm, args, None, "CPU")
+
+    assert key == model_cache_key(gm, args, None, "CPU")
+    assert key != model_cache_key(gm, args, None, "GPU")
+    assert key != model_cache_key(gm, [torch.zeros(3, 4)], None, "CPU")
+    assert key != model_cache_key(gm, [torch.zeros(2, 4, dtype=torch.float64)], None, "CPU")
+    with torch.no_grad():
+        gm.weight.add_(1)
+    assert key != model_cache_key(gm, args, None, "CPU")
+
+
+class LargeScale(torch.nn.Module):
+    def __init__(self, size):
+        super().__init__()
+        self.weight = torch.nn.Parameter(torch.ones(size))
+
+    def forward(self, x):
+        return x * self.weight
+
+
+def test_compiled_cache_byte_budget_eviction():
+    from openvino.frontend.pytorch.torchdynamo.cache import compiled_cache, graph_hash
+    from openvino.frontend.pytorch.torchdynamo.execute import clear_caches, openvino_execute
+
+    size = 1024
+    gm = torch.fx.symbolic_trace(LargeScale(size))
+    clear_caches()
+    compiled_cache.configure(max_bytes=int(size * 4 * 2.5))
+    try:
+        # Every batch size is a separate entry holding the whole weight
+        for batch in [1, 2, 3]:
+            data = torch.rand(batch, size)
+            result = openvino_execute(gm, data, partition_id=0, graph_hash_str=graph_hash(gm))
+            assert torch.allclose(result, gm(data))
+        stats = compiled_cache.stats()
+    finally:
+        compiled_cache.configure(max_bytes=0)
+        clear_caches()
+
+    assert stats["compilations"] == 3
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+    assert size * 4 * 2 <= stats["bytes"] <= size * 4 * 2.5
+
+
+def make_model(size):
+    param = ops.parameter([size], Type.f32)
+    constant = ops.constant(np.ones(size, dtype=np.float32))
+    return Model([ops.add(param, constant)], [param], "add")
+
+
+def test_model_disk_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("OPENVINO_TORCH_CACHE_DIR", str(tmp_path))
+    core = Core()
+    cache = ModelDiskCache()
+
+    assert cache.load("a", core) is None
+    cache.store("a", make_model(16))
+    model = cache.load("a", core)
+
+    assert model is not None
+    assert len(model.inputs) == 1
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["bytes"] > 0
+    assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 1, 1)
+    assert not [path for path in (tmp_path / "model").iterdir() if ".tmp." in path.name]
+
+    cache.clear()
+    assert cache.stats()["entries"] == 0
+    assert cache.load("a", core) is None
+
+
+def test_model_disk_cache_serialize_error(monkeypatch, tmp_path):
+    from openvino.frontend.pytorch.torchdynamo import cache as cache_module
+
+    def failing_serialize(model, xml_path, bin_path):
+        with open(bin_path, "wb") as bin_file:
+            bin_file.write(b"partial")
+        raise RuntimeError("Cannot serialize model")
+
+    monkeypatch.setenv("OPENVINO_TORCH_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(cache_module, "serialize", failing_serialize)
+    cache = ModelDiskCache()
+
+    with pytest.warns(UserWarning, match="Cannot serialize model"):
+        cache.store("a", make_model(16))
+    assert cache.stats()["writes"] == 0
+    assert list((tmp_path / "model").iterdir()) == []
+    assert cache.load("a", Core()) is None
+
+
+def test_model_disk_cache_lru_eviction(monkeypatch, tmp_path):
+    monkeypatch.setenv("OPENVINO_TORCH_CACHE_DIR", str(tmp_path))
+    core = Core()
+    probe = ModelDiskCache()
+    probe.store("probe", make_model(1024))
+    entry_size = probe.stats()["bytes"]
+    probe.clear()
+
+    cache = ModelDiskCache(max_bytes=int(entry_size * 2.5))
+    cache.store("a", make_model(1024))
+    time.sleep(0.01)
+    cache.store("b", make_model(1024))
+    time.sleep(0.01)
+    assert cache.load("a", core) is not None
+    time.sleep(0.01)
+    cache.store("c", make_model(1024))
+
+    assert cache.load("b", core) is None
+    assert cache.load("a", core) is not None
+    assert cache.load("c", core) is not None
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import torch
+
+import openvino.runtime.opset12 as ops
+from openvino.runtime import Core, Model, PartialShape, Type
+from openvino.frontend.pytorch.torchdynamo.execute import infer_on_ov, _partition_runners
+
+
+def compile_relu(device, shape):
+    param = ops.parameter(PartialShape(shape), Type.f32, name="data")
+    model = Model([ops.relu(param)], [param], "relu")
+    return Core().compile_model(model, device)
+
+
+def test_infer_on_ov_static_outputs(device):
+    compiled = compile_relu(device, [2, 3])
+    data = torch.tensor([[-1.0, 2.0, -3.0], [4.0, -5.0, 6.0]])
+
+    first = infer_on_ov(compiled, [data])
+    second = infer_on_ov(compiled, [data * 2])
+
+    assert len(first) == 1
+    assert torch.equal(first[0], torch.relu(data))
+    assert torch.equal(second[0], torch.relu(data * 2))
+    # Every call returns a new buffer, results of the previous call are not overwritten
+    assert first[0].data_ptr() != second[0].data_ptr()
+
+
+def test_infer_on_ov_dynamic_outputs(device):
+    compiled = compile_relu(device, [-1, 3])
+
+    for rows in [1, 4, 2]:
+        data = torch.randn(rows, 3)
+        result = infer_on_ov(compiled, [data])
+        assert torch.equal(result[0], torch.relu(data))
+
+
+def test_infer_on_ov_reuses_request(device):
+    compiled = compile_relu(device, [2, 2])
+    data = torch.ones(2, 2, requires_grad=True)
+
+    infer_on_ov(compiled, [data])
+    request = _partition_runners[compiled].request
+    result = infer_on_ov(compiled, [data])
+
+    assert _partition_runners[compiled].request is request
+    assert torch.equal(result[0], torch.ones(2, 2))
+
+
+def test_shared_core_and_frontend():
+    from openvino.frontend.pytorch.torchdynamo.compile import get_core, get_frontend
+
+    assert get_core() is get_core()
+    assert get_frontend() is get_frontend()
+
+
+def run_partitioned_model(monkeypatch, parallel_compile):
+    monkeypatch.setenv("PYTORCH_TRACING_MODE", "TORCHFX")
+    if parallel_compile:
+        monkeypatch.setenv("OPENVINO_TORCH_PARALLEL_COMPILE", str(parallel_compile))
+    import openvino.frontend.pytorch.torchdynamo.backend  # noqa: F401 registers the backend
+    from openvino.frontend.pytorch.torchdynamo.backend import cache_stats, partition_timings, reset
+
+    torch._dynamo.reset()
+    reset()
+    model = torch.nn.TransformerEncoder(torch.nn.TransformerEncoderLayer(d_model=64, nhead=4, batch_first=True), num_layers=4)
+    model.eval()
+    compiled = torch.compile(model, backend="openvino", dynamic=False)
+    data = torch.rand(1, 16, 64)
+
+    with torch.no_grad():
+        result = compiled(data)
+        expected = model(data)
+    return result, expected, cache_stats(), partition_timings()
+
+
+def test_parallel_compile(monkeypatch):
+    result, expected, stats, timings = run_partitioned_model(monkeypatch, parallel_compile=4)
+
+    assert torch.allclose(result, expected, atol=1e-4)
+    assert stats["compilations"] == len(timings)
+    assert stats["hits"] >= stats["compilations"]
+    for partition_timings in timings.values():
+        assert partition_timings["convert"] >= 0
+        assert partition_timings["compile"] >= 0
@@ -8,8 +8,10 @@ import numpy as np
 
 from tests.conftest import model_path
 from tests.test_utils.test_utils import generate_relu_compiled_model
+import openvino.runtime.opset12 as ops
 from openvino.runtime import Model, ConstOutput, Type, Shape, Core, Tensor
 from openvino.runtime.utils.data_helpers import _data_dispatch
+from openvino.runtime.utils.data_helpers.data_dispatcher import create_copied, create_shared
 
 is_myriad = os.environ.get("TEST_DEVICE") == "MYRIAD"
 test_net_xml, test_net_bin = model_path(is_myriad)
@@ -162,3 +164,62 @@ def test_ndarray_copied_dispatcher(device, input_shape):
     test_data[0] = 2.0
 
     assert not np.array_equal(infer_request.input_tensors[0].data, test_data)
+
+
+@pytest.mark.parametrize("is_shared", [True, False])
+def test_dispatch_plan_reused(device, is_shared):
+    input_shape = [2, 2]
+    compiled_model = generate_relu_compiled_model(device, input_shape)
+    infer_request = compiled_model.create_infer_request()
+
+    for i in range(3):
+        test_data = np.full(input_shape, i, dtype=np.float32)
+        result = _data_dispatch(infer_request, {0: test_data}, is_shared)
+        assert len(infer_request._dispatch_plans) == 1
+        if is_shared:
+            assert np.array_equal(result[0].data, test_data)
+        else:
+            assert result == {}
+            assert np.array_equal(infer_request.input_tensors[0].data, test_data)
+
+    # Other dtype creates new plan
+    test_data = np.ones(input_shape, dtype=np.float64)
+    _data_dispatch(infer_request, {0: test_data}, is_shared)
+    assert len(infer_request._dispatch_plans) == 2
+
+
+@pytest.mark.parametrize("is_shared", [True, False])
+def test_dispatch_plan_dynamic_shape(device, is_shared):
+    param = ops.parameter([-1, 2], np.float32)
+    model = Model(ops.relu(param), [param])
+    compiled_model = Core().compile_model(model, device)
+    infer_request = compiled_model.create_infer_request()
+
+    for batch in [1, 4, 2]:
+        test_data = np.ones([batch, 2], dtype=np.float32)
+        infer_request.infer([test_data], share_inputs=is_shared)
+        assert np.array_equal(infer_request.get_output_tensor().data, test_data)
+    assert len(infer_request._dispatch_plans) == 1
+
+
+@pytest.mark.parametrize("num_inputs", [1, 8])
+@pytest.mark.parametrize("is_shared", [True, False])
+def test_dispatch_plan_matches_dispatcher(device, num_inputs, is_shared):
+    params = [ops.parameter([1, 8], np.float32) for _ in range(num_inputs)]
+    model = Model([ops.relu(param) for param in params], params)
+    compiled_model = Core().compile_model(model, device)
+    infer_request = compiled_model.create_infer_request()
+    dispatcher = create_shared if is_shared else create_copied
+
+    for i in range(2):
+        inputs = {idx: np.full([1, 8], i + idx, dtype=np.float32) for idx in range(num_inputs)}
+        expected = dispatcher(inputs, infer_request)
+        # The second call reuses the dispatch plan created by the first one
+        result = _data_dispatch(infer_request, inputs, is_shared)
+        assert len(infer_request._dispatch_plans) == 1
+        assert result.keys() == expected.keys()
+        for key, value in result.items():
+            assert np.array_equal(_get_value(value), _get_value(expected[key]))
+        if not is_shared:
+            for idx in range(num_inputs):
+                assert np.array_equal(infer_request.input_tensors[idx].data, inputs[idx])
@@ -987,3 +987,44 @@ class TestTFLoadByModel(unittest.TestCase):
         fe = fem.load_by_model(model)
         assert fe is not None
         assert fe.get_name() == "tf"
+
+    def test_graph_iterator_creates_decoders_lazily(self):
+        import tensorflow as tf
+        from openvino.frontend.tensorflow.graph_iterator import GraphIteratorTFGraph
+
+        tf.compat.v1.reset_default_graph()
+        with tf.compat.v1.Session() as sess:
+            inp = tf.compat.v1.placeholder(tf.float32, [1, 2, 3], "Input")
+            _ = tf.nn.sigmoid(tf.nn.relu(inp), name="Sigmoid")
+            tf_graph = sess.graph
+
+        iterator = GraphIteratorTFGraph(tf_graph, True)
+        assert iterator.size() == len(tf_graph.get_operations())
+        assert all(decoder is None for decoder in iterator.m_decoders)
+
+        iterator.next_impl()
+        decoder = iterator.get_decoder()
+        assert decoder.get_op_type() == "Relu"
+        assert iterator.get_decoder() is decoder
+        assert sum(decoder is not None for decoder in iterator.m_decoders) == 1
+
+        # Attributes are parsed once and then served from cache
+        attribute = decoder.get_attribute("T")
+        assert decoder.get_attribute("T") is attribute
+
+    def test_graph_iterator_variables_map(self):
+        import tensorflow as tf
+        from openvino.frontend.tensorflow.node_decoder import TFGraphNodeDecoder
+
+        weights = tf.Variable(np.ones([2, 3], dtype=np.float32), name="weights")
+
+        @tf.function(input_signature=[tf.TensorSpec([1, 2], tf.float32)])
+        def function(x):
+            return tf.matmul(x, weights)
+
+        graph = function.get_concrete_function().graph
+        variables_map = TFGraphNodeDecoder.get_variables_map(graph)
+        for op in graph.get_operations():
+            if op.type == "Placeholder" and op.get_attr("dtype") == tf.resource:
+                assert TFGraphNodeDecoder.get_variable(op, variables_map) is TFGraphNodeDecoder.get_variable(op)
+                assert TFGraphNodeDecoder.get_variable(op, variables_map) is not None
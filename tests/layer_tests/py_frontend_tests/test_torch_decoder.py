@@ -2,6 +2,9 @@
 # Copyright (C) 2018-2023 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import os
+
+import numpy as np
 import torch
 import pytest
 
@@ -645,3 +648,162 @@ def test_pytorch_decoder_can_convert_scripted_function():
     scripted = torch.jit.script(f)
     model = convert_model(scripted)
     assert model is not None
+
+
+@pytest.mark.precommit
+@pytest.mark.parametrize(("dtype", "ov_type_name"), [
+    (torch.float32, "f32"),
+    (torch.float16, "f16"),
+    (torch.bfloat16, "bf16"),
+    (torch.int8, "i8"),
+    (torch.uint8, "u8"),
+    (torch.int64, "i64"),
+    (torch.bool, "boolean"),
+])
+def test_pytorch_tensor_to_constant_shares_memory(dtype, ov_type_name):
+    from openvino.frontend.pytorch.utils import torch_tensor_to_ov_const
+    from openvino.runtime import Type
+
+    tensor = torch.arange(12).reshape(3, 4).to(dtype)
+    ov_const = torch_tensor_to_ov_const(tensor)
+
+    assert ov_const.get_element_type() == getattr(Type, ov_type_name)
+    assert list(ov_const.get_output_shape(0)) == [3, 4]
+    assert ov_const.data.ctypes.data == tensor.data_ptr()
+    ref = tensor.view(torch.int16) if dtype == torch.bfloat16 else tensor
+    assert np.array_equal(ov_const.data.view(ref.numpy().dtype), ref.numpy())
+
+
+@pytest.mark.precommit
+def test_pytorch_tensor_to_constant_keeps_tensor_alive():
+    import gc
+    from openvino.frontend.pytorch.utils import torch_tensor_to_ov_const
+
+    ov_const = torch_tensor_to_ov_const(torch.full([1024], 3.0, dtype=torch.bfloat16))
+    gc.collect()
+    torch.full([1024], 5.0, dtype=torch.bfloat16)
+
+    assert np.array_equal(ov_const.data.view(np.int16), torch.full([1024], 3.0, dtype=torch.bfloat16).view(torch.int16).numpy())
+
+
+@pytest.mark.precommit
+@pytest.mark.parametrize("dtype", [torch.float32, torch.bfloat16])
+def test_pytorch_tensor_to_constant_non_contiguous(dtype):
+    from openvino.frontend.pytorch.utils import torch_tensor_to_ov_const
+
+    tensor = torch.arange(24).reshape(4, 6).to(dtype)
+    for view in [tensor.t(), tensor[:, ::2], tensor.expand(2, 4, 6)]:
+        ov_const = torch_tensor_to_ov_const(view)
+        expected = view.contiguous()
+        if dtype == torch.bfloat16:
+            expected = expected.view(torch.int16)
+        assert list(ov_const.get_output_shape(0)) == list(view.shape)
+        assert np.array_equal(ov_const.data.view(expected.numpy().dtype), expected.numpy())
+
+
+@pytest.mark.precommit
+def test_pytorch_tensor_to_constant_quantized():
+    from openvino.frontend.pytorch.utils import torch_tensor_to_ov_const
+
+    tensor = torch.quantize_per_tensor(torch.tensor([[-1.0, 0.0], [0.5, 1.0]]), 0.1, 10, torch.quint8)
+    # Scale and zero point would be lost in Constant
+    with pytest.raises(RuntimeError, match="Quantized tensor"):
+        torch_tensor_to_ov_const(tensor)
+
+
+class SharedWeights(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.first = torch.nn.Linear(8, 8)
+        self.second = torch.nn.Linear(8, 8)
+        self.second.weight = self.first.weight
+        self.scale = torch.nn.Parameter(torch.full([8], 2.0, dtype=torch.bfloat16), requires_grad=False)
+
+    def forward(self, x):
+        return self.second(self.first(x)) * self.scale.float()
+
+
+@pytest.mark.precommit
+@pytest.mark.parametrize("use_path", [False, True])
+def test_pytorch_decoder_mmap_weights(tmp_path, use_path):
+    from openvino.frontend import FrontEndManager
+    from openvino.frontend.pytorch.ts_decoder import TorchScriptPythonDecoder
+    from openvino.runtime import Core
+
+    model = SharedWeights()
+    example = torch.randn(2, 8)
+    path = str(tmp_path / "weights.bin") if use_path else True
+    decoder = TorchScriptPythonDecoder(model, example_input=example, mmap_weights=path)
+    fe = FrontEndManager().load_by_framework("pytorch")
+    ov_model = fe.convert(fe.load(decoder))
+
+    # Parameters are written once, shared weight is not duplicated
+    param_bytes = sum(p.numel() * p.element_size() for p in model.parameters())
+    assert param_bytes <= decoder._mmap_weights.size < param_bytes + 64 * 8
+    if use_path:
+        assert (tmp_path / "weights.bin").stat().st_size == decoder._mmap_weights.size
+    constants = [node for node in ov_model.get_ops() if node.get_type_name() == "Constant"]
+    for param in model.parameters():
+        param_data = param.detach().view(torch.int16 if param.dtype == torch.bfloat16 else param.dtype).numpy()
+        assert not any(np.shares_memory(const.data, param_data) for const in constants)
+
+    compiled = Core().compile_model(ov_model, "CPU")
+    with torch.no_grad():
+        expected = model(example).numpy()
+    assert np.allclose(compiled(example.numpy())[0], expected, atol=1e-5)
+
+
+@pytest.mark.precommit
+def test_pytorch_mmap_weights_temporary_file_removed(tmp_path, monkeypatch):
+    import gc
+    import tempfile
+    from openvino.frontend.pytorch.utils import MMapWeights
+
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    tensor = torch.arange(16, dtype=torch.float32)
+    weights = MMapWeights()
+    weights.write([tensor])
+    ov_const = weights.constant(tensor)
+    assert np.array_equal(ov_const.data, tensor.numpy())
+
+    del weights, ov_const
+    gc.collect()
+    assert list(tmp_path.iterdir()) == []
+
+
+class ManyParameters(torch.nn.Module):
+    def __init__(self, count):
+        super().__init__()
+        self.params = torch.nn.ParameterList([torch.nn.Parameter(torch.full([4], float(i))) for i in range(count)])
+        self.register_buffer("offset", torch.ones([4], dtype=torch.int16))
+
+    def forward(self, x):
+        for param in self.params:
+            x = x + param
+        return x + self.offset
+
+
+@pytest.mark.precommit
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="Open file descriptors are counted in /proc")
+def test_pytorch_decoder_mmap_weights_many_parameters():
+    from openvino.frontend import FrontEndManager
+    from openvino.frontend.pytorch.ts_decoder import TorchScriptPythonDecoder
+    from openvino.frontend.pytorch.utils import MMapWeights
+    from openvino.runtime import Core
+
+    count = 1500
+    model = ManyParameters(count)
+    example = torch.zeros(1, 4)
+    open_fds = len(os.listdir("/proc/self/fd"))
+    decoder = TorchScriptPythonDecoder(model, example_input=example, mmap_weights=True)
+    fe = FrontEndManager().load_by_framework("pytorch")
+    ov_model = fe.convert(fe.load(decoder))
+
+    # The file is mapped once, not once per parameter
+    assert len(os.listdir("/proc/self/fd")) < open_fds + 16
+    # int16 has no entry in the type map, such buffer is converted without memory mapping
+    assert decoder._mmap_weights.size == (count - 1) * MMapWeights.ALIGNMENT + 16
+    compiled = Core().compile_model(ov_model, "CPU")
+    with torch.no_grad():
+        expected = model(example).numpy()
+    assert np.allclose(compiled(example.numpy())[0], expected)
@@ -2,28 +2,40 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import os
+import random
+import time
+from collections import deque
 from datetime import datetime
-from math import ceil
+from statistics import mean, pstdev
+from threading import Lock
 from openvino.runtime import Core, get_version, AsyncInferQueue
 
 from .utils.constants import GPU_DEVICE_NAME, XML_EXTENSION, BIN_EXTENSION
 from .utils.logging import logger
-from .utils.utils import get_duration_seconds
-
-def percentile(values, percent):
-    return values[ceil(len(values) * percent / 100) - 1]
+from .utils.utils import get_duration_seconds, LatencyHistogram
 
 class Benchmark:
     def __init__(self, device: str, number_infer_requests: int = 0, number_iterations: int = None,
-                 duration_seconds: int = None, api_type: str = 'async', inference_only = None):
+                 duration_seconds: int = None, api_type: str = 'async', inference_only = None,
+                 rate: float = None, arrival: str = 'poisson', latency_precision: int = 3,
+                 latency_interval: float = 1.0, core: Core = None):
         self.device = device
-        self.core = Core()
+        self.core = core if core is not None else Core()
         self.nireq = number_infer_requests if api_type == 'async' else 1
         self.niter = number_iterations
         self.duration_seconds = get_duration_seconds(duration_seconds, self.niter, self.device)
         self.api_type = api_type
         self.inference_only = inference_only
         self.latency_groups = []
+        self.rate = rate
+        self.arrival = arrival
+        self.open_loop_statistics = None
+        self.latency_precision = latency_precision
+        self.latency_interval = latency_interval
+        self.snapshot_histogram = None
+        self._snapshot_lock = Lock()
+        self.reset_latency_statistics()
+        self.configure_warm_up()
 
     def __del__(self):
         del self.core
@@ -83,27 +95,146 @@ class Benchmark:
             requests.wait_all()
             return requests[id].latency
 
+    def configure_warm_up(self, iterations: int = 0, duration_seconds: float = 0, steady_threshold: float = 0,
+                          window: int = 50, max_duration_seconds: float = 60):
+        """Sets conditions which all should be met before measurements start.
+
+        :param iterations: Minimal number of warm-up iterations.
+        :param duration_seconds: Minimal duration of warm-up in seconds.
+        :param steady_threshold: Maximal coefficient of variation of latencies in the rolling window and maximal
+                                 relative difference of throughput between its halves. 0 disables steady-state detection.
+        :param window: Number of the latest iterations in the rolling window.
+        :param max_duration_seconds: Warm-up stops after this time even if steady state is not reached.
+        """
+        self.warmup_iterations = iterations
+        self.warmup_duration_seconds = duration_seconds
+        self.warmup_steady_threshold = steady_threshold
+        self.warmup_window = max(window, 2)
+        self.warmup_max_duration_seconds = max_duration_seconds
+        self.warmup_statistics = None
+
+    def is_warm_up_required(self):
+        return bool(self.warmup_iterations or self.warmup_duration_seconds or self.warmup_steady_threshold)
+
+    def is_steady(self, latencies, completion_times):
+        if len(latencies) < self.warmup_window:
+            return False
+        latency_variation = pstdev(latencies) / mean(latencies)
+        half = len(completion_times) // 2
+        first_half_duration = completion_times[half] - completion_times[0]
+        second_half_duration = completion_times[-1] - completion_times[half]
+        if first_half_duration <= 0 or second_half_duration <= 0:
+            return False
+        first_half_fps = half / first_half_duration
+        second_half_fps = (len(completion_times) - 1 - half) / second_half_duration
+        fps_variation = abs(second_half_fps - first_half_fps) / max(first_half_fps, second_half_fps)
+        return latency_variation < self.warmup_steady_threshold and fps_variation < self.warmup_steady_threshold
+
+    def warm_up(self, requests, data_queue):
+        """Runs inferences until the conditions set by configure_warm_up are met. Results are not measured."""
+        latencies = deque(maxlen=self.warmup_window)
+        completion_times = deque(maxlen=self.warmup_window)
+        steady = not self.warmup_steady_threshold
+        iteration = 0
+        start_time = time.perf_counter()
+
+        def record(latency):
+            nonlocal steady
+            latencies.append(latency)
+            completion_times.append(time.perf_counter())
+            if not steady:
+                steady = self.is_steady(latencies, completion_times)
+
+        def is_finished():
+            elapsed = time.perf_counter() - start_time
+            if iteration < self.warmup_iterations or elapsed < self.warmup_duration_seconds:
+                return False
+            return steady or elapsed >= self.warmup_max_duration_seconds
+
+        if self.api_type == 'sync':
+            while not is_finished():
+                if not self.inference_only:
+                    requests[0].set_input_tensors(data_queue.get_next_input())
+                requests[0].infer()
+                record(requests[0].latency)
+                iteration += 1
+        else:
+            in_fly = set()
+            while not is_finished():
+                idle_id = requests.get_idle_request_id()
+                if idle_id in in_fly:
+                    record(requests[idle_id].latency)
+                else:
+                    in_fly.add(idle_id)
+                if not self.inference_only:
+                    requests[idle_id].set_input_tensors(data_queue.get_next_input())
+                requests.start_async()
+                iteration += 1
+            requests.wait_all()
+
+        self.warmup_statistics = {
+            'duration_seconds': time.perf_counter() - start_time,
+            'iterations': iteration,
+            'steady': steady,
+        }
+        return self.warmup_statistics
+
+    def reset_latency_statistics(self):
+        self.latency_histogram = LatencyHistogram(self.latency_precision)
+        self.interval_histogram = LatencyHistogram(self.latency_precision)
+        self.latency_series = []
+        self.measurement_start = time.perf_counter()
+        self.interval_start = self.measurement_start
+
+    def record_latency(self, latency, group_id=None):
+        self.latency_histogram.record(latency)
+        self.interval_histogram.record(latency)
+        if group_id is not None:
+            self.latency_groups[group_id].histogram.record(latency)
+        if self.snapshot_histogram is not None:
+            # Latencies are recorded from callback threads while the snapshot reporter swaps the histogram
+            with self._snapshot_lock:
+                if self.snapshot_histogram is not None:
+                    self.snapshot_histogram.record(latency)
+        now = time.perf_counter()
+        if self.latency_interval and now - self.interval_start >= self.latency_interval:
+            self.flush_latency_interval(now)
+
+    def swap_snapshot_histogram(self, histogram):
+        """Replaces the histogram of latencies recorded for snapshots and returns the previous one."""
+        with self._snapshot_lock:
+            previous = self.snapshot_histogram
+            self.snapshot_histogram = histogram
+        return previous
+
+    def flush_latency_interval(self, now):
+        """Appends percentiles of latencies recorded since the previous flush to the latency time-series."""
+        if self.interval_histogram.count:
+            entry = {'time (s)': round(now - self.measurement_start, 3), 'count': self.interval_histogram.count}
+            entry.update(self.interval_histogram.summary())
+            self.latency_series.append(entry)
+        self.interval_histogram.reset()
+        self.interval_start = now
+
     def sync_inference(self, request, data_queue):
         exec_time = 0
         iteration = 0
-        times = []
         start_time = datetime.utcnow()
         while (self.niter and iteration < self.niter) or \
               (self.duration_seconds and exec_time < self.duration_seconds):
             if self.inference_only == False:
                 request.set_input_tensors(data_queue.get_next_input())
             request.infer()
-            times.append(request.latency)
+            self.record_latency(request.latency)
             iteration += 1
 
             exec_time = (datetime.utcnow() - start_time).total_seconds()
         total_duration_sec = (datetime.utcnow() - start_time).total_seconds()
-        return sorted(times), total_duration_sec, iteration
+        return total_duration_sec, iteration
 
     def async_inference_only(self, infer_queue):
         exec_time = 0
         iteration = 0
-        times = []
         in_fly = set()
         start_time = datetime.utcnow()
         while (self.niter and iteration < self.niter) or \
@@ -111,7 +242,7 @@ class Benchmark:
               (iteration % self.nireq):
             idle_id = infer_queue.get_idle_request_id()
             if idle_id in in_fly:
-                times.append(infer_queue[idle_id].latency)
+                self.record_latency(infer_queue[idle_id].latency)
             else:
                 in_fly.add(idle_id)
             infer_queue.start_async()
@@ -121,14 +252,13 @@ class Benchmark:
         infer_queue.wait_all()
         total_duration_sec = (datetime.utcnow() - start_time).total_seconds()
         for infer_request_id in in_fly:
-            times.append(infer_queue[infer_request_id].latency)
-        return sorted(times), total_duration_sec, iteration
+            self.record_latency(infer_queue[infer_request_id].latency)
+        return total_duration_sec, iteration
 
     def async_inference_full_mode(self, infer_queue, data_queue, pcseq):
         processed_frames = 0
         exec_time = 0
         iteration = 0
-        times = []
         num_groups = len(self.latency_groups)
         start_time = datetime.utcnow()
         in_fly = set()
@@ -138,9 +268,7 @@ class Benchmark:
             processed_frames += data_queue.get_next_batch_size()
             idle_id = infer_queue.get_idle_request_id()
             if idle_id in in_fly:
-                times.append(infer_queue[idle_id].latency)
-                if pcseq:
-                    self.latency_groups[infer_queue.userdata[idle_id]].times.append(infer_queue[idle_id].latency)
+                self.record_latency(infer_queue[idle_id].latency, infer_queue.userdata[idle_id] if pcseq else None)
             else:
                 in_fly.add(idle_id)
             group_id = data_queue.current_group_id
@@ -153,34 +281,112 @@ class Benchmark:
         total_duration_sec = (datetime.utcnow() - start_time).total_seconds()
         
         for infer_request_id in in_fly:
-            times.append(infer_queue[infer_request_id].latency)
-            if pcseq:
-                self.latency_groups[infer_queue.userdata[infer_request_id]].times.append(infer_queue[infer_request_id].latency)
+            self.record_latency(infer_queue[infer_request_id].latency, infer_queue.userdata[infer_request_id] if pcseq else None)
         
-        return sorted(times), total_duration_sec, processed_frames, iteration
+        return total_duration_sec, processed_frames, iteration
+
+    def arrival_intervals(self):
+        """Generates intervals in seconds between scheduled arrivals of requests in open-loop mode."""
+        if self.arrival == 'constant':
+            while True:
+                yield 1.0 / self.rate
+        # Fixed seed makes the schedule reproducible between runs
+        generator = random.Random(0)
+        while True:
+            yield generator.expovariate(self.rate)
+
+    def async_inference_open_loop(self, infer_queue, data_queue, pcseq):
+        """Submits requests on a schedule independent of completion of previous requests.
+
+        Latency is measured from the scheduled arrival time, so it includes time spent waiting
+        for an idle infer request (queue wait) in addition to inference itself (service time).
+        Arrivals which find all infer requests busy are counted as late. When the run is limited
+        by time, arrivals scheduled before the end of the run but not submitted until then are dropped.
+        """
+        processed_frames = 0
+        iteration = 0
+        late = 0
+        dropped = 0
+        queue_waits = LatencyHistogram(self.latency_precision)
+        service_times = LatencyHistogram(self.latency_precision)
+        # Callbacks are called from threads of infer requests
+        lock = Lock()
+
+        def completion_callback(request, userdata):
+            scheduled_time, submit_time, group_id = userdata
+            latency = (time.perf_counter() - scheduled_time) * 1000
+            with lock:
+                self.record_latency(latency, group_id if pcseq else None)
+                queue_waits.record((submit_time - scheduled_time) * 1000)
+                service_times.record(request.latency)
+
+        infer_queue.set_callback(completion_callback)
+        intervals = self.arrival_intervals()
+        start_time = time.perf_counter()
+        arrival_offset = 0
+        while (self.niter and iteration < self.niter) or \
+              (self.duration_seconds and arrival_offset < self.duration_seconds):
+            scheduled_time = start_time + arrival_offset
+            now = time.perf_counter()
+            if scheduled_time > now:
+                time.sleep(scheduled_time - now)
+            elif self.duration_seconds and not self.niter and now - start_time >= self.duration_seconds:
+                # The run is over, the rest of arrivals scheduled before its end are not served
+                while arrival_offset < self.duration_seconds:
+                    dropped += 1
+                    arrival_offset += next(intervals)
+                break
+            if not infer_queue.is_ready():
+                late += 1
+            idle_id = infer_queue.get_idle_request_id()
+            group_id = data_queue.current_group_id
+            if self.inference_only:
+                processed_frames += data_queue.batch_sizes[group_id]
+            else:
+                processed_frames += data_queue.get_next_batch_size()
+                infer_queue[idle_id].set_input_tensors(data_queue.get_next_input())
+            infer_queue.start_async(userdata=(scheduled_time, time.perf_counter(), group_id))
+            iteration += 1
+            arrival_offset += next(intervals)
+        infer_queue.wait_all()
+        total_duration_sec = time.perf_counter() - start_time
+
+        self.open_loop_statistics = {
+            'offered_rate': self.rate,
+            'arrival': self.arrival,
+            'late': late,
+            'dropped': dropped,
+            'queue_waits': queue_waits,
+            'service_times': service_times,
+        }
+        return total_duration_sec, processed_frames, iteration
 
     def main_loop(self, requests, data_queue, batch_size, latency_percentile, pcseq):
-        if self.api_type == 'sync':
-            times, total_duration_sec, iteration = self.sync_inference(requests[0], data_queue)
+        self.reset_latency_statistics()
+        if self.rate:
+            total_duration_sec, processed_frames, iteration = self.async_inference_open_loop(requests, data_queue, pcseq)
+            fps = processed_frames / total_duration_sec
+        elif self.api_type == 'sync':
+            total_duration_sec, iteration = self.sync_inference(requests[0], data_queue)
             fps = len(batch_size) * iteration / total_duration_sec
         elif self.inference_only:
-            times, total_duration_sec, iteration = self.async_inference_only(requests)
+            total_duration_sec, iteration = self.async_inference_only(requests)
             fps = len(batch_size) * iteration / total_duration_sec
         else:
-            times, total_duration_sec, processed_frames, iteration = self.async_inference_full_mode(requests, data_queue, pcseq)
+            total_duration_sec, processed_frames, iteration = self.async_inference_full_mode(requests, data_queue, pcseq)
             fps = processed_frames / total_duration_sec
+        self.flush_latency_interval(time.perf_counter())
 
-        median_latency_ms = percentile(times, latency_percentile)
-        avg_latency_ms = sum(times) / len(times)
-        min_latency_ms = times[0]
-        max_latency_ms = times[-1]
+        median_latency_ms = self.latency_histogram.percentile(latency_percentile)
+        avg_latency_ms = self.latency_histogram.mean
+        min_latency_ms = self.latency_histogram.min
+        max_latency_ms = self.latency_histogram.max
 
         if pcseq:
             for group in self.latency_groups:
-                if group.times:
-                    group.times.sort()
-                    group.median = percentile(group.times, latency_percentile)
-                    group.avg = sum(group.times) / len(group.times)
-                    group.min = group.times[0]
-                    group.max = group.times[-1]
+                if group.histogram.count:
+                    group.median = group.histogram.percentile(latency_percentile)
+                    group.avg = group.histogram.mean
+                    group.min = group.histogram.min
+                    group.max = group.histogram.max
         return fps, median_latency_ms, avg_latency_ms, min_latency_ms, max_latency_ms, total_duration_sec, iteration
@@ -12,8 +12,10 @@ from openvino.tools.benchmark.parameters import parse_args
 from openvino.tools.benchmark.utils.constants import MULTI_DEVICE_NAME, \
     CPU_DEVICE_NAME, GPU_DEVICE_NAME, \
     BLOB_EXTENSION, AUTO_DEVICE_NAME
-from openvino.tools.benchmark.utils.inputs_filling import get_input_data
+from openvino.tools.benchmark.multi_model import run_multi_model
+from openvino.tools.benchmark.utils.inputs_filling import get_input_data, set_input_tensors
 from openvino.tools.benchmark.utils.logging import logger
+from openvino.tools.benchmark.utils.snapshots import SnapshotReporter
 from openvino.tools.benchmark.utils.utils import next_step, get_number_iterations, pre_post_processing, \
     process_help_inference_string, print_perf_counters, print_perf_counters_sort, dump_exec_graph, get_duration_in_milliseconds, \
     get_command_line_arguments, parse_value_per_device, parse_devices, get_inputs_info, \
@@ -37,9 +39,34 @@ def parse_and_check_command_line():
                         "should explicitely set -hint option to none. This is not OpenVINO limitation " \
                         "(those options can be used in OpenVINO together), but a benchmark_app UI rule.")
 
+    if args.input_workers < 0:
+        raise RuntimeError("The number of input workers is incorrect. It should be a non-negative number.")
+
+    if args.warmup_number_iterations < 0 or args.warmup_time < 0 or args.warmup_steady_threshold < 0 or args.warmup_max_time < 0:
+        raise RuntimeError("Warm-up parameters should be non-negative numbers.")
+
+    if args.snapshot_interval < 0:
+        raise RuntimeError("The snapshot interval value is incorrect. It should be a non-negative number of seconds.")
+
+    if args.latency_interval < 0:
+        raise RuntimeError("The latency interval value is incorrect. It should be a non-negative number of seconds.")
+
+    if args.rate is not None:
+        if args.rate <= 0:
+            raise RuntimeError("The rate value is incorrect. It should be a positive number of requests per second.")
+        if args.api_type == 'sync':
+            raise Exception("Open-loop mode (-rate) is available for async API only.")
+
     if args.report_type == "average_counters" and MULTI_DEVICE_NAME in args.target_device:
         raise Exception("only detailed_counters report type is supported for MULTI device")
 
+    if not args.path_to_model and not args.multi_model_config:
+        parser.print_help()
+        raise RuntimeError("Path to a model should be set by -m or a multi-model configuration by -mm.")
+
+    if args.multi_model_config:
+        return args, False
+
     _, ext = os.path.splitext(args.path_to_model)
     is_network_compiled = True if ext == BLOB_EXTENSION else False
     is_precisiton_set = not (args.input_precision == "" and args.output_precision == "" and args.input_output_precision == "")
@@ -64,6 +91,12 @@ def main():
             statistics = _statistics_class(StatisticsReport.Config(args.report_type, args.report_folder))
             statistics.add_parameters(StatisticsReport.Category.COMMAND_LINE_PARAMETERS, command_line_arguments)
 
+        if args.multi_model_config:
+            run_multi_model(args, statistics)
+            if statistics:
+                statistics.dump()
+            return
+
         def is_flag_set_in_command_line(flag):
             return any(x.strip('-') == flag for x, y in command_line_arguments)
 
@@ -84,7 +117,11 @@ def main():
         next_step(step_id=2)
 
         benchmark = Benchmark(args.target_device, args.number_infer_requests,
-                              args.number_iterations, args.time, args.api_type, args.inference_only)
+                              args.number_iterations, args.time, args.api_type, args.inference_only,
+                              args.rate, args.arrival, args.latency_precision, args.latency_interval)
+
+        benchmark.configure_warm_up(args.warmup_number_iterations, args.warmup_time, args.warmup_steady_threshold,
+                                    args.warmup_window, args.warmup_max_time)
 
         if args.extensions:
             benchmark.add_extension(path_to_extensions=args.extensions)
@@ -482,7 +519,7 @@ def main():
                 else:
                     paths_to_input.append(os.path.abspath(*path))
 
-        data_queue = get_input_data(paths_to_input, app_inputs_info)
+        data_queue = get_input_data(paths_to_input, app_inputs_info, args.input_workers, args.input_cache)
 
         static_mode = check_for_static(app_inputs_info)
         allow_inference_only_or_sync = can_measure_as_static(app_inputs_info)
@@ -502,7 +539,7 @@ def main():
         if allow_inference_only_or_sync and batch_size.is_dynamic:
             batch_size = Dimension(data_queue.batch_sizes[data_queue.current_group_id])
 
-        benchmark.latency_groups = get_latency_groups(app_inputs_info)
+        benchmark.latency_groups = get_latency_groups(app_inputs_info, args.latency_precision)
 
         if len(benchmark.latency_groups) > 1:
             logger.info(f"Defined {len(benchmark.latency_groups)} tensor groups:")
@@ -513,16 +550,7 @@ def main():
         benchmark.niter = get_number_iterations(benchmark.niter, benchmark.nireq, max(len(info.shapes) for info in app_inputs_info), benchmark.api_type)
 
         # Set input tensors before first inference
-        for request in requests:
-            data_tensors = data_queue.get_next_input()
-            for port, data_tensor in data_tensors.items():
-                input_tensor = request.get_input_tensor(port)
-                if not static_mode:
-                    input_tensor.shape = data_tensor.shape
-                if not len(input_tensor.shape):
-                    input_tensor.data.flat[:] = data_tensor.data
-                else:
-                    input_tensor.data[:] = data_tensor.data
+        set_input_tensors(requests, data_queue, static_mode)
 
         if statistics:
             statistics.add_parameters(StatisticsReport.Category.RUNTIME_CONFIG,
@@ -562,11 +590,36 @@ def main():
                                         ('first inference time (ms)', duration_ms)
                                     ])
 
+        if benchmark.is_warm_up_required():
+            warmup = benchmark.warm_up(requests, data_queue)
+            warmup_duration_ms = f"{get_duration_in_milliseconds(warmup['duration_seconds']):.2f}"
+            logger.info(f"Warm-up took {warmup_duration_ms} ms, {warmup['iterations']} iterations")
+            if not warmup['steady']:
+                logger.warning("Steady state was not reached during warm-up, results may be noisy")
+            if statistics:
+                statistics.add_parameters(StatisticsReport.Category.EXECUTION_RESULTS,
+                                          [
+                                              ('warm-up time (ms)', warmup_duration_ms),
+                                              ('warm-up iterations', str(warmup['iterations'])),
+                                              ('steady state reached', str(warmup['steady'])),
+                                          ])
+
         pcseq = args.pcseq
         if static_mode or len(benchmark.latency_groups) == 1:
             pcseq = False
 
-        fps, median_latency_ms, avg_latency_ms, min_latency_ms, max_latency_ms, total_duration_sec, iteration = benchmark.main_loop(requests, data_queue, batch_size, args.latency_percentile, pcseq)
+        snapshot_reporter = None
+        if args.snapshot_interval:
+            snapshot_file = args.snapshot_file or os.path.join(args.report_folder, 'benchmark_snapshots.jsonl')
+            snapshot_reporter = SnapshotReporter(benchmark, args.snapshot_interval,
+                                                 sum(data_queue.batch_sizes) / len(data_queue.batch_sizes),
+                                                 snapshot_file, args.snapshot_port)
+            snapshot_reporter.start()
+        try:
+            fps, median_latency_ms, avg_latency_ms, min_latency_ms, max_latency_ms, total_duration_sec, iteration = benchmark.main_loop(requests, data_queue, batch_size, args.latency_percentile, pcseq)
+        finally:
+            if snapshot_reporter:
+                snapshot_reporter.stop()
 
         # ------------------------------------ 11. Dumping statistics report -------------------------------------------
         next_step()
@@ -624,6 +677,9 @@ def main():
                                           [
                                               ("max latency", f'{max_latency_ms:.2f}'),
                                           ])
+                statistics.add_parameters(StatisticsReport.Category.EXECUTION_RESULTS,
+                                          [(f"{name} latency", f'{value:.2f}') for name, value in benchmark.latency_histogram.summary().items()])
+                statistics.add_latency_series(benchmark.latency_series)
                 if pcseq:
                     for group in benchmark.latency_groups:
                         statistics.add_parameters(StatisticsReport.Category.EXECUTION_RESULTS,
@@ -642,6 +698,21 @@ def main():
                                           [
                                               ("max latency", f'{group.max:.2f}'),
                                           ])
+            if benchmark.open_loop_statistics:
+                open_loop = benchmark.open_loop_statistics
+                statistics.add_parameters(StatisticsReport.Category.EXECUTION_RESULTS,
+                                          [
+                                              ('offered rate (requests per second)', f"{open_loop['offered_rate']:.2f}"),
+                                              ('arrival', open_loop['arrival']),
+                                              ('avg queue wait (ms)', f"{open_loop['queue_waits'].mean:.2f}"),
+                                              (f'queue wait ({args.latency_percentile} percentile) (ms)',
+                                               f"{open_loop['queue_waits'].percentile(args.latency_percentile):.2f}"),
+                                              ('avg service time (ms)', f"{open_loop['service_times'].mean:.2f}"),
+                                              (f'service time ({args.latency_percentile} percentile) (ms)',
+                                               f"{open_loop['service_times'].percentile(args.latency_percentile):.2f}"),
+                                              ('late requests', str(open_loop['late'])),
+                                              ('dropped requests', str(open_loop['dropped'])),
+                                          ])
             statistics.add_parameters(StatisticsReport.Category.EXECUTION_RESULTS,
                                       [
                                           ('throughput', f'{fps:.2f}'),
@@ -664,6 +735,7 @@ def main():
             logger.info(f'   Average:       {avg_latency_ms:.2f} ms')
             logger.info(f'   Min:           {min_latency_ms:.2f} ms')
             logger.info(f'   Max:           {max_latency_ms:.2f} ms')
+            logger.info('   ' + ', '.join(f'{name}: {value:.2f} ms' for name, value in benchmark.latency_histogram.summary().items()))
 
             if pcseq:
                 logger.info("Latency for each data shape group:")
@@ -677,6 +749,18 @@ def main():
                     logger.info(f'   Min:        {group.min:.2f} ms')
                     logger.info(f'   Max:        {group.max:.2f} ms')
 
+        if benchmark.open_loop_statistics:
+            open_loop = benchmark.open_loop_statistics
+            logger.info(f"Offered rate: {open_loop['offered_rate']:.2f} requests per second ({open_loop['arrival']} arrivals)")
+            logger.info('Queue wait:')
+            logger.info(f"   Average:       {open_loop['queue_waits'].mean:.2f} ms")
+            logger.info(f"   {args.latency_percentile} percentile: {open_loop['queue_waits'].percentile(args.latency_percentile):.2f} ms")
+            logger.info('Service time:')
+            logger.info(f"   Average:       {open_loop['service_times'].mean:.2f} ms")
+            logger.info(f"   {args.latency_percentile} percentile: {open_loop['service_times'].percentile(args.latency_percentile):.2f} ms")
+            logger.info(f"Late requests:    {open_loop['late']}")
+            logger.info(f"Dropped requests: {open_loop['dropped']}")
+
         logger.info(f'Throughput:   {fps:.2f} FPS')
 
         del compiled_model
@@ -0,0 +1,187 @@
+# Copyright (C) 2018-2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+from threading import Barrier, BrokenBarrierError, Thread
+
+from openvino.runtime import Core, properties
+
+from .benchmark import Benchmark
+from .utils.inputs_filling import get_input_data, set_input_tensors
+from .utils.logging import logger
+from .utils.statistics_report import StatisticsReport
+from .utils.utils import get_inputs_info, get_network_batch_size, get_latency_groups, pre_post_processing, \
+    check_for_static, get_duration_in_milliseconds
+
+PERFORMANCE_HINTS = {
+    'throughput': properties.hint.PerformanceMode.THROUGHPUT,
+    'tput': properties.hint.PerformanceMode.THROUGHPUT,
+    'latency': properties.hint.PerformanceMode.LATENCY,
+    'cumulative_throughput': properties.hint.PerformanceMode.CUMULATIVE_THROUGHPUT,
+    'ctput': properties.hint.PerformanceMode.CUMULATIVE_THROUGHPUT,
+    'none': properties.hint.PerformanceMode.UNDEFINED,
+}
+
+
+def load_multi_model_config(path):
+    with open(path) as config_file:
+        models = json.load(config_file)
+    if not isinstance(models, list) or not models:
+        raise Exception(f"Multi-model configuration {path} should contain a non-empty list of models.")
+    names = set()
+    for entry in models:
+        if not isinstance(entry, dict) or 'model' not in entry:
+            raise Exception(f"Every model in multi-model configuration {path} should be a dictionary with the \"model\" key.")
+        name = entry.setdefault('name', os.path.splitext(os.path.basename(entry['model']))[0])
+        if name in names:
+            raise Exception(f"Model name '{name}' is used more than once in multi-model configuration {path}. "
+                            f"Please set unique \"name\" values.")
+        names.add(name)
+    return models
+
+
+class ModelWorkload:
+    """Model of a multi-model run with its own compiled model, infer requests, input data and target rate.
+
+    Every workload is measured by a separate Benchmark object, all of them share one Core.
+    """
+
+    def __init__(self, core: Core, args, entry: dict):
+        self.name = entry['name']
+        self.latency_percentile = args.latency_percentile
+        device = entry.get('device', args.target_device)
+        self.benchmark = Benchmark(device, entry.get('nireq', args.number_infer_requests), None, entry.get('time', args.time),
+                                   'async', None, entry.get('rate', args.rate), entry.get('arrival', args.arrival),
+                                   args.latency_precision, args.latency_interval, core)
+
+        logger.info(f"[{self.name}] Loading model {entry['model']}")
+        model = self.benchmark.read_model(entry['model'])
+        app_inputs_info, reshape = get_inputs_info(entry.get('shape', ''), entry.get('data_shape', ''), entry.get('layout', ''),
+                                                   str(entry.get('batch_size', '')), '', '', model.inputs)
+        if reshape:
+            model.reshape({info.name: info.partial_shape for info in app_inputs_info})
+        pre_post_processing(model, app_inputs_info, '', '', '')
+
+        config = {}
+        hint = entry.get('hint', 'none' if 'nstreams' in entry else 'throughput')
+        if hint not in PERFORMANCE_HINTS:
+            raise Exception(f"Incorrect performance hint '{hint}' of model '{self.name}'. "
+                            f"Possible values: {', '.join(PERFORMANCE_HINTS.keys())}.")
+        if PERFORMANCE_HINTS[hint] != properties.hint.PerformanceMode.UNDEFINED:
+            config[properties.hint.performance_mode()] = PERFORMANCE_HINTS[hint]
+        if 'nstreams' in entry:
+            config[properties.num_streams()] = int(entry['nstreams'])
+        self.compiled_model = core.compile_model(model, device, config)
+        self.requests = self.benchmark.create_infer_requests(self.compiled_model)
+
+        paths_to_input = [os.path.abspath(entry['input'])] if 'input' in entry else []
+        self.data_queue = get_input_data(paths_to_input, app_inputs_info, args.input_workers, args.input_cache)
+        self.batch_size = get_network_batch_size(app_inputs_info)
+        static_mode = check_for_static(app_inputs_info)
+        self.benchmark.inference_only = static_mode
+        self.benchmark.latency_groups = get_latency_groups(app_inputs_info, args.latency_precision)
+        set_input_tensors(self.requests, self.data_queue, static_mode)
+        logger.info(f"[{self.name}] {self.benchmark.nireq} infer requests on {device}"
+                    + (f", open-loop {self.benchmark.arrival} arrivals at {self.benchmark.rate} requests per second"
+                       if self.benchmark.rate else ""))
+
+    def run(self, barrier: Barrier = None):
+        self.benchmark.first_infer(self.requests)
+        if barrier is not None:
+            barrier.wait()
+        fps, _, avg_latency_ms, _, _, total_duration_sec, iteration = \
+            self.benchmark.main_loop(self.requests, self.data_queue, self.batch_size, self.latency_percentile, False)
+        self.result = {'fps': fps, 'avg latency': avg_latency_ms, 'duration': total_duration_sec, 'iterations': iteration}
+        self.result.update(self.benchmark.latency_histogram.summary())
+        if self.benchmark.open_loop_statistics:
+            self.result['late'] = self.benchmark.open_loop_statistics['late']
+            self.result['dropped'] = self.benchmark.open_loop_statistics['dropped']
+        return self.result
+
+
+def run_concurrently(workloads):
+    """Runs all workloads at the same time, each one from its own thread."""
+    barrier = Barrier(len(workloads))
+    errors = []
+
+    def run(workload):
+        try:
+            workload.run(barrier)
+        except Exception as e:
+            errors.append(e)
+            barrier.abort()
+
+    threads = [Thread(target=run, args=(workload,), name=workload.name) for workload in workloads]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        # Other workloads fail with BrokenBarrierError when the barrier is aborted, the original error is raised
+        raise next((error for error in errors if not isinstance(error, BrokenBarrierError)), errors[0])
+    return {workload.name: workload.result for workload in workloads}
+
+
+def log_result(name, result):
+    logger.info(f"[{name}] Count: {result['iterations']} iterations, "
+                f"duration: {get_duration_in_milliseconds(result['duration']):.2f} ms, throughput: {result['fps']:.2f} FPS")
+    logger.info(f"[{name}] Latency: average {result['avg latency']:.2f} ms, "
+                + ', '.join(f'{key} {result[key]:.2f} ms' for key in ('p50', 'p90', 'p99', 'p99.9', 'max')))
+    if 'late' in result:
+        logger.info(f"[{name}] Late requests: {result['late']}, dropped requests: {result['dropped']}")
+
+
+def run_multi_model(args, statistics=None):
+    """Benchmarks several models concurrently in one process on the same Core.
+
+    When args.multi_model_solo is set, every model is benchmarked alone first, and
+    interference is reported as the relative loss of throughput and the growth of
+    latency percentiles in the concurrent run compared with the solo one.
+    """
+    models = load_multi_model_config(args.multi_model_config)
+    core = Core()
+    if args.extensions:
+        for extension in args.extensions.split(","):
+            logger.info(f"Loading extension {extension}")
+            core.add_extension(extension)
+    if args.cache_dir:
+        core.set_property({'CACHE_DIR': args.cache_dir})
+
+    workloads = [ModelWorkload(core, args, entry) for entry in models]
+
+    solo_results = {}
+    if args.multi_model_solo:
+        for workload in workloads:
+            logger.info(f"Benchmarking '{workload.name}' alone")
+            solo_results[workload.name] = workload.run()
+            log_result(workload.name, solo_results[workload.name])
+
+    logger.info(f"Benchmarking {len(workloads)} models concurrently")
+    results = run_concurrently(workloads)
+    total_fps = 0
+    for name, result in results.items():
+        log_result(name, result)
+        total_fps += result['fps']
+        solo = solo_results.get(name)
+        if solo:
+            result['throughput loss'] = 1 - result['fps'] / solo['fps']
+            result['p99 latency growth'] = result['p99'] / solo['p99'] if solo['p99'] else 0.
+            logger.info(f"[{name}] Interference: throughput {solo['fps']:.2f} -> {result['fps']:.2f} FPS "
+                        f"({result['throughput loss'] * 100:.1f}% loss), "
+                        f"p99 latency {solo['p99']:.2f} -> {result['p99']:.2f} ms (x{result['p99 latency growth']:.2f})")
+    logger.info(f"Total throughput: {total_fps:.2f} FPS")
+
+    if statistics:
+        statistics.add_parameters(StatisticsReport.Category.RUNTIME_CONFIG,
+                                  [(f'{workload.name} model', workload_entry['model'])
+                                   for workload, workload_entry in zip(workloads, models)])
+        for name, result in results.items():
+            parameters = [(f'{name} {key}', f'{value:.2f}' if isinstance(value, float) else str(value))
+                          for key, value in result.items()]
+            if name in solo_results:
+                parameters += [(f'{name} solo {key}', f'{value:.2f}' if isinstance(value, float) else str(value))
+                               for key, value in solo_results[name].items()]
+            statistics.add_parameters(StatisticsReport.Category.EXECUTION_RESULTS, parameters)
+        statistics.add_parameters(StatisticsReport.Category.EXECUTION_RESULTS, [('total throughput', f'{total_fps:.2f}')])
+    return results
@@ -44,6 +44,14 @@ def parse_args():
     args = parser.add_argument_group('Options')
     args.add_argument('-h', '--help', action=print_help, nargs='?', default=argparse.SUPPRESS,
                       help='Show this help message and exit.')
+    args.add_argument('-mm', '--multi_model_config', type=str, required=False, default=None,
+                      help='Optional. Path to a JSON file with a list of models to benchmark concurrently in one process on the same Core. '
+                           'Every item is a dictionary with the required "model" key and optional "name", "device", "nstreams", '
+                           '"nireq", "hint", "time", "rate", "arrival", "shape", "data_shape", "layout", "batch_size" and "input" keys, '
+                           'which override the corresponding command line options for this model. Replaces -m.')
+    args.add_argument('-mm_solo', '--multi_model_solo', type=str2bool, required=False, default=True, nargs='?', const=True,
+                      help='Optional. Benchmark every model of -mm alone before the concurrent run to report interference. '
+                           'Default value is True.')
     args.add_argument('-i', '--paths_to_input', action='append', nargs='+', type=str, required=False,
                       help='Optional. '
                            'Path to a folder with images and/or binaries or to specific image or binary file.'
@@ -52,8 +60,14 @@ def parse_args():
                            'Currently supported data types: bin, npy. If OPENCV is enabled, this functionality'
                            'is extended with the following data types: bmp, dib, jpeg, jpg, jpe, jp2, png, pbm, '
                            'pgm, ppm, sr, ras, tiff, tif.')
-    args.add_argument('-m', '--path_to_model', type=str, required=True,
-                      help='Required. Path to an .xml/.onnx file with a trained model or '
+    args.add_argument('-input_workers', '--input_workers', type=int, required=False, default=0,
+                      help='Optional. Number of processes used to decode and resize input images. '
+                           'Default value is 0, which means the number of CPU cores. Set 1 to prepare images in the main process.')
+    args.add_argument('-input_cache', '--input_cache', type=str, required=False, default='',
+                      help='Optional. Path to a directory where images prepared for model inputs are cached as .npy files. '
+                           'Images found in the cache are memory-mapped instead of decoded again on the next runs.')
+    args.add_argument('-m', '--path_to_model', type=str, required=False,
+                      help='Required unless -mm is set. Path to an .xml/.onnx file with a trained model or '
                            'to a .blob file with a trained compiled model.')
     args.add_argument('-d', '--target_device', type=str, required=False, default='CPU',
                       help='Optional. Specify a target device to infer on (the list of available devices is shown below). '
@@ -72,6 +86,19 @@ def parse_args():
                            'If not specified, the number of iterations is calculated depending on a device.')
     args.add_argument('-t', '--time', type=check_positive, required=False, default=None,
                       help='Optional. Time in seconds to execute topology.')
+    args.add_argument('-warmup_niter', '--warmup_number_iterations', type=int, required=False, default=0,
+                      help='Optional. Minimal number of warm-up iterations which are run before measurements and are not included in results.')
+    args.add_argument('-warmup_t', '--warmup_time', type=float, required=False, default=0,
+                      help='Optional. Minimal time in seconds of warm-up which is run before measurements and is not included in results.')
+    args.add_argument('-warmup_steady', '--warmup_steady_threshold', type=float, required=False, default=0,
+                      help='Optional. Enables steady-state detection: warm-up continues until coefficient of variation of latencies '
+                           'in the rolling window and relative difference of throughput between its halves are below the threshold, '
+                           'e.g. 0.05. Default value is 0, which disables detection.')
+    args.add_argument('-warmup_window', '--warmup_window', type=check_positive, required=False, default=50,
+                      help='Optional. Number of the latest iterations in the rolling window of steady-state detection. Default value is 50.')
+    args.add_argument('-warmup_max_t', '--warmup_max_time', type=float, required=False, default=60,
+                      help='Optional. Maximal time in seconds of warm-up. When steady state is not reached by this time, '
+                           'measurements start anyway. Default value is 60.')
 
     shapes = parser.add_argument_group('Input shapes')
     shapes.add_argument('-b', '--batch_size', type=str, required=False, default='',
@@ -104,6 +131,13 @@ def parse_args():
                       help="Optional. Loads model from file directly without read_model.")
     args.add_argument('-api', '--api_type', type=str, required=False, default='async', choices=['sync', 'async'],
                       help='Optional. Enable using sync/async API. Default value is async.')
+    args.add_argument('-rate', '--rate', type=float, required=False, default=None,
+                      help='Optional. Enables open-loop mode: requests are submitted at the given rate (requests per second) '
+                           'independently of completion of previous requests, and latency is measured from the scheduled '
+                           'arrival time of a request. Available for async API only.')
+    args.add_argument('-arrival', '--arrival', type=str, required=False, default='poisson', choices=['poisson', 'constant'],
+                      help='Optional. Distribution of intervals between arrivals of requests in open-loop mode: '
+                           'exponential (\'poisson\') or fixed (\'constant\'). Default value is poisson.')
     advs.add_argument('-nireq', '--number_infer_requests', type=check_positive, required=False, default=0,
                       help='Optional. Number of infer requests. Default value is determined automatically for device.')
     advs.add_argument('-nstreams', '--number_streams', type=str, required=False, default=None,
@@ -153,6 +187,22 @@ def parse_args():
     stat = parser.add_argument_group('Statistics dumping options')
     stat.add_argument('-latency_percentile', '--latency_percentile', type=int, required=False, default=50,
                       help='Optional. Defines the percentile to be reported in latency metric. The valid range is [1, 100]. The default value is 50 (median).')
+    stat.add_argument('-latency_precision', '--latency_precision', type=int, required=False, default=3, choices=range(1, 6),
+                      metavar='[1-5]',
+                      help='Optional. Number of significant decimal digits of latency values kept by the latency histogram. '
+                           'Higher precision uses more memory. Default value is 3.')
+    stat.add_argument('-latency_interval', '--latency_interval', type=float, required=False, default=1.0,
+                      help='Optional. Interval in seconds for the time-series of latency percentiles in the statistics report. '
+                           'Set 0 to disable the time-series. Default value is 1.')
+    stat.add_argument('-snapshot_interval', '--snapshot_interval', type=float, required=False, default=0,
+                      help='Optional. Interval in seconds between snapshots of throughput, latency percentiles, infer request utilization, '
+                           'memory and CPU usage taken during the measurements. Default value is 0, which disables snapshots.')
+    stat.add_argument('-snapshot_file', '--snapshot_file', type=str, required=False, default='',
+                      help='Optional. Path to a file where snapshots are written as JSON lines. '
+                           'Default value is benchmark_snapshots.jsonl in the report folder.')
+    stat.add_argument('-snapshot_port', '--snapshot_port', type=int, required=False, default=None,
+                      help='Optional. Port of a local HTTP endpoint which serves the latest snapshot in Prometheus text format '
+                           'on http://127.0.0.1:<port>/metrics.')
     stat.add_argument('-report_type', '--report_type', type=str, required=False,
                       choices=['no_counters', 'average_counters', 'detailed_counters'],
                       help="Optional. Enable collecting statistics report. \"no_counters\" report contains "
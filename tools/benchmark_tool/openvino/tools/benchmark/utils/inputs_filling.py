@@ -4,6 +4,8 @@
 import os
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import sha256
 from typing import Dict, List
 import numpy as np
 from collections import defaultdict
@@ -49,6 +51,20 @@ class DataQueue:
         return self.batch_sizes[self.current_group_id]
 
 
+def set_input_tensors(requests, data_queue: DataQueue, static_mode: bool):
+    """Copy the next input data to tensors of every infer request before the first inference."""
+    for request in requests:
+        data_tensors = data_queue.get_next_input()
+        for port, data_tensor in data_tensors.items():
+            input_tensor = request.get_input_tensor(port)
+            if not static_mode:
+                input_tensor.shape = data_tensor.shape
+            if not len(input_tensor.shape):
+                input_tensor.data.flat[:] = data_tensor.data
+            else:
+                input_tensor.data[:] = data_tensor.data
+
+
 def get_group_batch_sizes(app_input_info):
     batch_sizes = []
     niter = max(len(info.shapes) for info in app_input_info)
@@ -89,7 +105,7 @@ def verify_objects_to_be_used(objects_to_be_used_map: Dict[str, List[str]], info
             logger.warning(f"Some {input_type_name} will be dublicated: {total_frames} is required, "
                             f"but only {objects_to_be_used_map[info.name]} were provided.")
 
-def get_input_data(paths_to_input, app_input_info):
+def get_input_data(paths_to_input, app_input_info, num_workers=0, cache_dir=''):
     image_mapping, numpy_mapping, binary_mapping = get_input_file_mappings(paths_to_input, app_input_info)
 
     image_sizes = get_image_sizes(app_input_info)
@@ -125,7 +141,8 @@ def get_input_data(paths_to_input, app_input_info):
     data = {}
     for port, info in enumerate(app_input_info):
         if info.name in image_mapping:
-            data[port] = get_image_tensors(image_mapping[info.name][:images_to_be_used_map[info.name]], info, batch_sizes_map[info.name])
+            data[port] = get_image_tensors(image_mapping[info.name][:images_to_be_used_map[info.name]], info, batch_sizes_map[info.name],
+                                           num_workers, cache_dir)
 
         elif info.name in numpy_mapping:
             data[port] = get_numpy_tensors(numpy_mapping[info.name][:numpys_to_be_used_map[info.name]], info, batch_sizes_map[info.name])
@@ -144,7 +161,89 @@ def get_input_data(paths_to_input, app_input_info):
     return DataQueue(data, get_group_batch_sizes(app_input_info))
 
 
-def get_image_tensors(image_paths: List[str], info: AppInputInfo, batch_sizes: List[int]) -> List[Tensor]:
+def get_prepared_image_cache_path(cache_dir: str, image_filename: str, image_size, model_channel: int, layout: str, dtype) -> str:
+    """Path of a prepared image in the cache, key includes size and modification time of the source file."""
+    stat = os.stat(image_filename)
+    key = f"{os.path.abspath(image_filename)};{stat.st_size};{stat.st_mtime_ns};{image_size};{model_channel};{layout};{np.dtype(dtype).str}"
+    return os.path.join(cache_dir, sha256(key.encode("utf-8")).hexdigest() + ".npy")
+
+
+def prepare_image(image_filename: str, image_size, model_channel: int, layout: str, dtype, cache_path: str = None):
+    """Read an image and convert it to the layout, size and type of the model input.
+
+    Runs in worker processes, so only picklable values are passed and returned.
+    Returns the prepared image and the size of the original one.
+    """
+    image = cv2.imread(image_filename)
+    original_size = image.shape[:-1]
+    if image_size is not None and original_size != image_size:
+        image = cv2.resize(image, image_size)
+
+    image_channel = image.shape[-1]
+    if model_channel == 1 and image_channel == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+    if model_channel == image_channel and layout in ['[N,C,H,W]', '[C,H,W]']:
+        image = image.transpose((2, 0, 1))
+    image = np.ascontiguousarray(image.astype(dtype))
+
+    if cache_path:
+        # Other processes never see a partially written file
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp.npy"
+        try:
+            np.save(tmp_path, image)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return image, original_size
+
+
+def load_prepared_images(tasks: list, info: AppInputInfo, dtype, num_workers: int, cache_dir: str) -> Dict:
+    """Prepare every (image index, image size) pair of tasks, return a dict of prepared images.
+
+    Images found in the cache are memory-mapped, the rest are decoded and resized
+    by a pool of worker processes and stored to the cache.
+    """
+    model_channel = int(str(info.channels))
+    layout = str(info.layout)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    prepared = {}
+    to_prepare = []
+    for image_filename, image_size in tasks:
+        logger.info(f'Prepare image {image_filename}')
+        cache_path = get_prepared_image_cache_path(cache_dir, image_filename, image_size, model_channel, layout, dtype) \
+            if cache_dir else None
+        if cache_path and os.path.exists(cache_path):
+            try:
+                prepared[(image_filename, image_size)] = np.load(cache_path, mmap_mode='r')
+                continue
+            except (OSError, ValueError):
+                logger.warning(f"Cached image {cache_path} is damaged and will be prepared again")
+        to_prepare.append((image_filename, image_size, cache_path))
+    if cache_dir:
+        logger.info(f"{len(tasks) - len(to_prepare)} of {len(tasks)} prepared images are loaded from cache {cache_dir}")
+
+    num_workers = min(num_workers or os.cpu_count() or 1, len(to_prepare))
+    arguments = [(image_filename, image_size, model_channel, layout, dtype, cache_path)
+                 for image_filename, image_size, cache_path in to_prepare]
+    if num_workers > 1:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            results = list(executor.map(prepare_image, *zip(*arguments), chunksize=max(len(arguments) // (4 * num_workers), 1)))
+    else:
+        results = [prepare_image(*task_arguments) for task_arguments in arguments]
+
+    for (image_filename, image_size, _), (image, original_size) in zip(to_prepare, results):
+        if image_size is not None and original_size != image_size:
+            logger.warning(f"Image {image_filename} is resized from ({original_size}) to ({image_size})")
+        prepared[(image_filename, image_size)] = image
+    return prepared
+
+
+def get_image_tensors(image_paths: List[str], info: AppInputInfo, batch_sizes: List[int],
+                      num_workers: int = 0, cache_dir: str = '') -> List[Tensor]:
     if 'cv2' not in sys.modules:
         logger.error("Loading images requires the opencv-python or opencv-python-headless package. "
                      "Please install it before continuing or run benchmark without "
@@ -153,60 +252,58 @@ def get_image_tensors(image_paths: List[str], info: AppInputInfo, batch_sizes: L
     num_shapes = len(info.shapes)
     num_images = len(image_paths)
 
-    processed_frames = 0
     widths = info.widths if info.is_dynamic else [info.width]
     heights = info.heights if info.is_dynamic else [info.height]
     process_with_original_shapes = num_shapes == 0
-    tensors = []
+    resize = not process_with_original_shapes and info.layout.has_name('H') and info.layout.has_name('W')
+    dtype = get_dtype(info.element_type)
 
+    # Images of every batch are collected first, so all of them are prepared at once
+    processed_frames = 0
+    batches = []
     niter = max(num_shapes, num_images)
     for i in range(niter):
-        shape = list(info.shapes[i % num_shapes]) if num_shapes else []
-        dtype = get_dtype(info.element_type)
-        images = np.ndarray(shape=shape, dtype=dtype)
         image_index = processed_frames
         current_batch_size = 1 if process_with_original_shapes else batch_sizes[i % num_shapes]
+        image_size = (widths[i % num_shapes], heights[i % num_shapes]) if resize else None
+        batch = []
         for b in range(current_batch_size):
             image_index %= num_images
-            image_filename = image_paths[image_index]
-            logger.info(f'Prepare image {image_filename}')
-            image = cv2.imread(image_filename)
-            if process_with_original_shapes:
-                logger.info(f'Image will be processed with original shape - {image.shape[:-1]}')
-            elif info.layout.has_name('H') and info.layout.has_name('W'):
-                new_im_size = (widths[i % num_shapes], heights[i % num_shapes])
-                if image.shape[:-1] != new_im_size:
-                    logger.warning(f"Image is resized from ({image.shape[:-1]}) to ({new_im_size})")
-                    image = cv2.resize(image, new_im_size)
-
-            model_channel = int(str(info.channels))
-            image_channel = image.shape[-1]
-            if model_channel == 1 and image_channel == 3:
-                image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-
-            if model_channel == image_channel and str(info.layout) in ['[N,C,H,W]', '[C,H,W]']:
-                image = image.transpose((2, 0, 1))
-
-            if process_with_original_shapes:
-                if len(info.partial_shape) == 4:
-                    image = np.expand_dims(image, 0)
-                p_shape = PartialShape(image.shape)
-                if info.partial_shape.compatible(p_shape):
-                    info.data_shapes.append(p_shape.to_shape())
-                else:
-                    raise Exception(f"Data shape '{str(p_shape)}' provided for input '{info.name}' "
-                                    f"is not compatible with partial shape '{str(info.partial_shape)}' for this input.")
-                tensors.append(Tensor(image.astype(dtype)))
-            else:
-                try:
-                    images[b] = image
-                except ValueError:
-                    raise Exception(f"Image shape {image.shape} is not compatible with input shape {shape}! "
-                                    f"Make sure -i parameter is valid.")
+            batch.append((image_paths[image_index], image_size))
             image_index += 1
         processed_frames += current_batch_size
-        if not process_with_original_shapes:
-            tensors.append(Tensor(images))
+        batches.append(batch)
+
+    tasks = list(dict.fromkeys(task for batch in batches for task in batch))
+    prepared = load_prepared_images(tasks, info, dtype, num_workers, cache_dir)
+
+    tensors = []
+    for i, batch in enumerate(batches):
+        if process_with_original_shapes:
+            image_filename, image_size = batch[0]
+            image = prepared[(image_filename, image_size)]
+            logger.info(f'Image {image_filename} will be processed with original shape - {image.shape}')
+            if len(info.partial_shape) == 4:
+                image = np.expand_dims(image, 0)
+            p_shape = PartialShape(image.shape)
+            if info.partial_shape.compatible(p_shape):
+                info.data_shapes.append(p_shape.to_shape())
+            else:
+                raise Exception(f"Data shape '{str(p_shape)}' provided for input '{info.name}' "
+                                f"is not compatible with partial shape '{str(info.partial_shape)}' for this input.")
+            tensors.append(Tensor(image))
+            continue
+
+        shape = list(info.shapes[i % num_shapes])
+        images = np.ndarray(shape=shape, dtype=dtype)
+        for b, task in enumerate(batch):
+            image = prepared[task]
+            try:
+                images[b] = image
+            except ValueError:
+                raise Exception(f"Image shape {image.shape} is not compatible with input shape {shape}! "
+                                f"Make sure -i parameter is valid.")
+        tensors.append(Tensor(images))
     return tensors
 
 
@@ -234,7 +331,8 @@ def get_numpy_tensors(numpy_paths: List[str], info: AppInputInfo, batch_sizes: L
             numpy_filename: str = numpy_paths[numpy_index]
             extension = numpy_filename.lower().split('.')[-1]
             if extension == "npy":
-                numpy_arr: np.ndarray = np.load(numpy_filename)
+                # Only the pages which are copied to the input tensor are read
+                numpy_arr: np.ndarray = np.load(numpy_filename, mmap_mode='r')
 
                 if list(numpy_arr.shape) != shape and not process_with_original_shapes:
                     raise Exception(
@@ -301,7 +399,7 @@ def get_binary_tensors(binary_paths: List[str], info: AppInputInfo, batch_sizes:
                 if blob_size != binary_file_size:
                     raise Exception(
                         f"File {binary_filename} contains {binary_file_size} bytes but model expects {blob_size}")
-                from_file = np.reshape(np.fromfile(binary_filename, dtype), shape)
+                from_file = np.memmap(binary_filename, dtype=dtype, mode='r', shape=tuple(shape))
                 if info.layout.has_name("N"):
                     binaries[[None] * info.layout.get_index_by_name("N") + [b]] = from_file
                 else:
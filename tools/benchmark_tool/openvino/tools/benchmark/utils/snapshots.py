@@ -0,0 +1,167 @@
+# Copyright (C) 2018-2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib.util import find_spec
+from threading import Event, Lock, Thread
+
+from .logging import logger
+from .utils import LatencyHistogram
+
+if find_spec('psutil') is not None:
+    import psutil
+
+
+def get_rss_bytes():
+    """Resident set size of the current process, None if it cannot be determined."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    if 'psutil' in globals():
+        return psutil.Process().memory_info().rss
+    return None
+
+
+def get_cpu_time():
+    times = os.times()
+    return times.user + times.system
+
+
+class SnapshotReporter:
+    """Periodically reports progress of a running benchmark.
+
+    Every `interval_seconds` a snapshot with throughput, latency percentiles, utilization of infer requests,
+    resident memory and CPU usage of the process since the previous snapshot is appended to `path` as a JSON line
+    and published on `http://127.0.0.1:<port>/metrics` in Prometheus text format.
+    Utilization is the share of time infer requests spent in inference according to their latencies.
+    """
+
+    def __init__(self, benchmark, interval_seconds: float, frames_per_request: float = 1, path: str = None, port: int = None):
+        self.benchmark = benchmark
+        self.interval_seconds = interval_seconds
+        self.frames_per_request = frames_per_request
+        self.path = path
+        self.port = port
+        self.snapshot = None
+        self.total_requests = 0
+        self._file = None
+        self._server = None
+        self._thread = None
+        self._stop = Event()
+        self._lock = Lock()
+
+    def start(self):
+        self.start_time = self.last_time = time.perf_counter()
+        self.last_cpu_time = get_cpu_time()
+        self.benchmark.swap_snapshot_histogram(LatencyHistogram(self.benchmark.latency_precision))
+        if self.path:
+            self._file = open(self.path, 'w')
+        if self.port is not None:
+            self._server = ThreadingHTTPServer(('127.0.0.1', self.port), self._make_handler())
+            Thread(target=self._server.serve_forever, name='snapshot_server', daemon=True).start()
+            logger.info(f"Snapshots are served on http://127.0.0.1:{self._server.server_address[1]}/metrics")
+        self._thread = Thread(target=self._run, name='snapshot_reporter', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.take_snapshot(last=True)
+        if self._file:
+            self._file.close()
+            logger.info(f"Snapshots are stored to {self.path}")
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def _run(self):
+        while not self._stop.wait(self.interval_seconds):
+            self.take_snapshot()
+
+    def take_snapshot(self, last: bool = False):
+        now = time.perf_counter()
+        cpu_time = get_cpu_time()
+        # After the last snapshot latencies are no longer recorded
+        histogram = self.benchmark.swap_snapshot_histogram(
+            None if last else LatencyHistogram(self.benchmark.latency_precision))
+        elapsed = now - self.last_time
+        if elapsed <= 0:
+            return None
+        self.total_requests += histogram.count
+        latency_ms = {key: round(value, 3) for key, value in histogram.summary().items()}
+        latency_ms['avg'] = round(histogram.mean, 3)
+        snapshot = {
+            'timestamp': time.time(),
+            'elapsed_s': round(now - self.start_time, 3),
+            'requests': histogram.count,
+            'total_requests': self.total_requests,
+            'fps': round(histogram.count * self.frames_per_request / elapsed, 3),
+            'latency_ms': latency_ms,
+            'infer_request_utilization': round(min(histogram.total / 1000 / (elapsed * max(self.benchmark.nireq, 1)), 1.), 3),
+            'rss_bytes': get_rss_bytes(),
+            'cpu_percent': round((cpu_time - self.last_cpu_time) / elapsed * 100, 1),
+        }
+        self.last_time = now
+        self.last_cpu_time = cpu_time
+        with self._lock:
+            self.snapshot = snapshot
+            if self._file:
+                self._file.write(json.dumps(snapshot) + '\n')
+                self._file.flush()
+        return snapshot
+
+    def to_prometheus(self):
+        with self._lock:
+            snapshot = self.snapshot
+        if snapshot is None:
+            return ''
+        lines = [
+            '# TYPE benchmark_app_fps gauge',
+            f"benchmark_app_fps {snapshot['fps']}",
+            '# TYPE benchmark_app_latency_ms gauge',
+        ]
+        for key, value in snapshot['latency_ms'].items():
+            if key.startswith('p'):
+                lines.append(f'benchmark_app_latency_ms{{quantile="{float(key[1:]) / 100:g}"}} {value}')
+        lines += [
+            f"benchmark_app_latency_ms_avg {snapshot['latency_ms']['avg']}",
+            f"benchmark_app_latency_ms_max {snapshot['latency_ms']['max']}",
+            '# TYPE benchmark_app_requests_total counter',
+            f"benchmark_app_requests_total {snapshot['total_requests']}",
+            '# TYPE benchmark_app_infer_request_utilization gauge',
+            f"benchmark_app_infer_request_utilization {snapshot['infer_request_utilization']}",
+            '# TYPE benchmark_app_cpu_percent gauge',
+            f"benchmark_app_cpu_percent {snapshot['cpu_percent']}",
+        ]
+        if snapshot['rss_bytes'] is not None:
+            lines += [
+                '# TYPE process_resident_memory_bytes gauge',
+                f"process_resident_memory_bytes {snapshot['rss_bytes']}",
+            ]
+        return '\n'.join(lines) + '\n'
+
+    def _make_handler(self):
+        reporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != '/metrics':
+                    self.send_error(404)
+                    return
+                body = reporter.to_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return MetricsHandler
@@ -32,6 +32,7 @@ class StatisticsReport(metaclass = abc.ABCMeta):
     def __init__(self, config) -> None:
         self.config = config
         self.parameters = {}
+        self.latency_series = []
 
     def add_parameters(self, category, parameters):
         if category not in self.parameters.keys():
@@ -39,6 +40,10 @@ class StatisticsReport(metaclass = abc.ABCMeta):
         else:
             self.parameters[category].extend(parameters)
 
+    def add_latency_series(self, latency_series):
+        """Sets time-series of latency percentiles, every entry describes one measurement interval."""
+        self.latency_series = latency_series
+
     @abc.abstractmethod
     def dump(self):
         pass
@@ -79,6 +84,15 @@ class CsvStatisticsReport(StatisticsReport):
                 dump_parameters(f, self.parameters[self.Category.EXECUTION_RESULTS])
                 f.write('\n')
 
+            if self.latency_series:
+                f.write('Latency percentiles per interval (ms)\n')
+                columns = list(self.latency_series[0].keys())
+                f.write(self.csv_separator.join(columns) + '\n')
+                for entry in self.latency_series:
+                    f.write(self.csv_separator.join(f'{entry[column]:.2f}' if isinstance(entry[column], float) else str(entry[column])
+                                                    for column in columns) + '\n')
+                f.write('\n')
+
             logger.info(f"Statistics report is stored to {f.name}")
 
     def dump_performance_counters(self, prof_info_list):
@@ -182,6 +196,9 @@ class JsonStatisticsReport(StatisticsReport):
                 json_statistics["execution_results"] = \
                     list_to_dict(self.parameters[self.Category.EXECUTION_RESULTS])
 
+            if self.latency_series:
+                json_statistics["latency_series"] = self.latency_series
+
             json.dump(json_statistics, file)
             logger.info(f"Statistics report is stored to {file.name}")
 
@@ -4,6 +4,7 @@
 from collections import defaultdict
 from datetime import timedelta
 import enum
+import math
 from openvino.runtime import Core, Model, PartialShape, Dimension, Layout, Type, serialize, properties, OVAny
 from openvino.preprocess import PrePostProcessor
 
@@ -219,11 +220,81 @@ def get_duration_seconds(time, number_iterations, device):
     return 0
 
 
+class LatencyHistogram:
+    """Histogram of latencies with logarithmic buckets.
+
+    Width of a bucket is proportional to its lower bound, so every reported value differs from
+    a recorded one by less than 10^-significant_digits of it. Memory depends only on the range of
+    recorded values and the precision, not on the number of recorded values.
+    """
+    PERCENTILES = (50, 90, 99, 99.9)
+
+    def __init__(self, significant_digits=3):
+        if not 1 <= significant_digits <= 5:
+            raise Exception("The number of significant digits of latency histogram should be in range [1, 5].")
+        self.significant_digits = significant_digits
+        self.log_base = math.log1p(2 * 10 ** -significant_digits)
+        self.reset()
+
+    def reset(self):
+        self.buckets = defaultdict(int)
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.
+        self.min = math.inf
+        self.max = 0.
+
+    def record(self, value):
+        if value > 0:
+            self.buckets[math.floor(math.log(value) / self.log_base)] += 1
+        else:
+            self.zero_count += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        for index, count in other.buckets.items():
+            self.buckets[index] += count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.
+
+    def percentile(self, percent):
+        if not self.count:
+            return 0.
+        rank = max(math.ceil(self.count * percent / 100), 1)
+        if rank >= self.count:
+            return self.max
+        if rank <= self.zero_count:
+            return 0.
+        seen = self.zero_count
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                # Middle of the bucket, clamped to values actually recorded
+                value = math.exp((index + 0.5) * self.log_base)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self):
+        summary = {f'p{percent:g}': self.percentile(percent) for percent in self.PERCENTILES}
+        summary['max'] = self.max if self.count else 0.
+        return summary
+
+
 class LatencyGroup:
-    def __init__(self, input_names, input_shapes):
+    def __init__(self, input_names, input_shapes, significant_digits=3):
         self.input_names = input_names
         self.input_shapes = input_shapes
-        self.times = list()
+        self.histogram = LatencyHistogram(significant_digits)
         self.median = 0.
         self.avg = 0.
         self.min = 0.
@@ -233,7 +304,7 @@ class LatencyGroup:
         return str().join(f" {name}: {str(shape)}" for name, shape in zip(self.input_names, self.input_shapes))
 
 
-def get_latency_groups(app_input_info):
+def get_latency_groups(app_input_info, significant_digits=3):
     num_groups = max(len(info.shapes) for info in app_input_info)
     latency_groups = []
     for i in range(num_groups):
@@ -242,7 +313,7 @@ def get_latency_groups(app_input_info):
         for info in app_input_info:
             names.append(info.name)
             shapes.append(info.shapes[i % len(info.shapes)])
-        latency_groups.append(LatencyGroup(names, shapes))
+        latency_groups.append(LatencyGroup(names, shapes, significant_digits))
     return latency_groups
 
 
@@ -363,6 +434,9 @@ def process_help_inference_string(benchmark_app, device_number_streams):
         if device_ss:
             output_string += ' using ' + device_ss
 
+        if benchmark_app.rate:
+            output_string += f', open-loop {benchmark_app.arrival} arrivals at {benchmark_app.rate} requests per second'
+
     output_string += ', limits: '
 
     if benchmark_app.duration_seconds:
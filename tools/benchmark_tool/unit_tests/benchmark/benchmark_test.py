@@ -0,0 +1,141 @@
+# Copyright (C) 2018-2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+from openvino.tools.benchmark.benchmark import Benchmark
+from unit_tests.benchmark.fake_infer_queue import FakeAsyncInferQueue, FakeDataQueue, FakeInferRequest
+
+
+def create_benchmark(number_iterations=None, duration_seconds=None, rate=None, arrival='constant',
+                     nireq=2, api_type='async'):
+    # Core is not used by the tested methods
+    return Benchmark('CPU', nireq, number_iterations, duration_seconds, api_type, False, rate, arrival, core=object())
+
+
+class TestOpenLoop(unittest.TestCase):
+    def test_late_requests(self):
+        benchmark = create_benchmark(number_iterations=10, rate=1e6)
+        infer_queue = FakeAsyncInferQueue(nireq=2, latencies=(2.,))
+
+        _, processed_frames, iteration = benchmark.async_inference_open_loop(infer_queue, FakeDataQueue(3), False)
+
+        self.assertEqual((processed_frames, iteration), (30, 10))
+        statistics = benchmark.open_loop_statistics
+        # Only the first two arrivals find an idle infer request
+        self.assertEqual((statistics['late'], statistics['dropped']), (8, 0))
+        self.assertEqual((statistics['offered_rate'], statistics['arrival']), (1e6, 'constant'))
+        self.assertEqual(benchmark.latency_histogram.count, 10)
+        self.assertEqual(statistics['queue_waits'].count, 10)
+        self.assertEqual(statistics['service_times'].count, 10)
+        self.assertEqual(statistics['service_times'].percentile(50), 2.)
+        self.assertGreaterEqual(benchmark.latency_histogram.min, statistics['queue_waits'].min)
+
+    def test_dropped_requests(self):
+        # Arrivals every 1/64 s, submission of a request takes longer than the whole run
+        benchmark = create_benchmark(duration_seconds=4 / 64, rate=64)
+        infer_queue = FakeAsyncInferQueue(nireq=2, start_seconds=0.1)
+
+        _, processed_frames, iteration = benchmark.async_inference_open_loop(infer_queue, FakeDataQueue(), False)
+
+        self.assertEqual((processed_frames, iteration), (1, 1))
+        self.assertEqual((benchmark.open_loop_statistics['late'], benchmark.open_loop_statistics['dropped']), (0, 3))
+        self.assertEqual(benchmark.latency_histogram.count, 1)
+
+    def test_inference_only(self):
+        benchmark = create_benchmark(number_iterations=4, rate=1e6)
+        benchmark.inference_only = True
+        infer_queue = FakeAsyncInferQueue(nireq=4)
+
+        _, processed_frames, iteration = benchmark.async_inference_open_loop(infer_queue, FakeDataQueue(2), False)
+
+        self.assertEqual((processed_frames, iteration), (8, 4))
+        self.assertEqual(benchmark.open_loop_statistics['late'], 0)
+        self.assertTrue(all(request.input_tensors is None for request in infer_queue.requests))
+
+    def test_arrival_intervals(self):
+        intervals = create_benchmark(rate=50).arrival_intervals()
+        self.assertEqual([next(intervals) for _ in range(3)], [0.02] * 3)
+
+        benchmark = create_benchmark(rate=50, arrival='poisson')
+        intervals = benchmark.arrival_intervals()
+        poisson_intervals = [next(intervals) for _ in range(10000)]
+        self.assertAlmostEqual(sum(poisson_intervals) / len(poisson_intervals), 0.02, delta=0.001)
+        # The schedule is reproducible
+        intervals = benchmark.arrival_intervals()
+        self.assertEqual([next(intervals) for _ in range(100)], poisson_intervals[:100])
+
+
+class TestWarmUp(unittest.TestCase):
+    def test_is_steady(self):
+        benchmark = create_benchmark()
+        benchmark.configure_warm_up(steady_threshold=0.1, window=4)
+
+        self.assertFalse(benchmark.is_steady([1., 1., 1.], [0., 1., 2.]))
+        self.assertTrue(benchmark.is_steady([1., 1., 1., 1.], [0., 1., 2., 3.]))
+        # Latencies vary too much
+        self.assertFalse(benchmark.is_steady([1., 2., 1., 2.], [0., 1., 2., 3.]))
+        # Throughput of the second half is two times lower
+        self.assertFalse(benchmark.is_steady([1., 1., 1., 1., 1.], [0., 1., 2., 4., 6.]))
+        # Requests finished at the same time
+        self.assertFalse(benchmark.is_steady([1., 1., 1., 1.], [0., 0., 0., 0.]))
+
+    def test_is_warm_up_required(self):
+        benchmark = create_benchmark()
+        self.assertFalse(benchmark.is_warm_up_required())
+        for conditions in ({'iterations': 1}, {'duration_seconds': 1}, {'steady_threshold': 0.1}):
+            benchmark.configure_warm_up(**conditions)
+            self.assertTrue(benchmark.is_warm_up_required())
+
+    def test_iterations(self):
+        benchmark = create_benchmark(api_type='sync')
+        benchmark.configure_warm_up(iterations=5)
+        request = FakeInferRequest()
+
+        statistics = benchmark.warm_up([request], FakeDataQueue())
+
+        self.assertEqual(statistics['iterations'], 5)
+        self.assertTrue(statistics['steady'])
+        self.assertEqual(request.input_tensors, {})
+        # Warm-up latencies are not measured
+        self.assertEqual(benchmark.latency_histogram.count, 0)
+
+    def test_duration(self):
+        benchmark = create_benchmark(api_type='sync')
+        benchmark.configure_warm_up(duration_seconds=0.05)
+
+        statistics = benchmark.warm_up([FakeInferRequest(infer_seconds=0.001)], FakeDataQueue())
+
+        self.assertGreaterEqual(statistics['duration_seconds'], 0.05)
+        self.assertGreater(statistics['iterations'], 0)
+
+    def test_steady_state(self):
+        benchmark = create_benchmark(api_type='sync')
+        benchmark.configure_warm_up(steady_threshold=0.5, window=10, max_duration_seconds=10)
+
+        statistics = benchmark.warm_up([FakeInferRequest(infer_seconds=0.002)], FakeDataQueue())
+
+        self.assertTrue(statistics['steady'])
+        self.assertGreaterEqual(statistics['iterations'], 10)
+        self.assertLess(statistics['duration_seconds'], 10)
+
+    def test_steady_state_is_not_reached(self):
+        benchmark = create_benchmark(api_type='sync')
+        benchmark.configure_warm_up(steady_threshold=0.1, window=10, max_duration_seconds=0.05)
+
+        statistics = benchmark.warm_up([FakeInferRequest(latencies=(1., 100.), infer_seconds=0.001)], FakeDataQueue())
+
+        self.assertFalse(statistics['steady'])
+        self.assertGreaterEqual(statistics['duration_seconds'], 0.05)
+
+    def test_async(self):
+        benchmark = create_benchmark()
+        benchmark.inference_only = True
+        benchmark.configure_warm_up(iterations=6)
+        infer_queue = FakeAsyncInferQueue(nireq=2)
+
+        statistics = benchmark.warm_up(infer_queue, FakeDataQueue())
+
+        self.assertEqual(statistics['iterations'], 6)
+        self.assertEqual(infer_queue.started, 6)
+        self.assertTrue(infer_queue.is_ready())
@@ -0,0 +1,88 @@
+# Copyright (C) 2018-2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import itertools
+import time
+from collections import deque
+
+
+class FakeInferRequest:
+    """Infer request which reports given latencies in turn and does not need a device."""
+
+    def __init__(self, latencies=(1.,), infer_seconds=0.):
+        self._latencies = itertools.cycle(latencies)
+        self.infer_seconds = infer_seconds
+        self.latency = None
+        self.input_tensors = None
+
+    def set_input_tensors(self, tensors):
+        self.input_tensors = tensors
+
+    def infer(self):
+        if self.infer_seconds:
+            time.sleep(self.infer_seconds)
+        self.latency = next(self._latencies)
+
+
+class FakeAsyncInferQueue:
+    """AsyncInferQueue without a device.
+
+    Requests finish in the order they were started: the oldest running request finishes when
+    an idle request is needed and all of them are busy, or when wait_all() is called.
+    """
+
+    def __init__(self, nireq=2, latencies=(1.,), start_seconds=0.):
+        self.requests = [FakeInferRequest(latencies) for _ in range(nireq)]
+        self.userdata = [None] * nireq
+        self.start_seconds = start_seconds
+        self.started = 0
+        self._running = deque()
+        self._callback = None
+
+    def __len__(self):
+        return len(self.requests)
+
+    def __getitem__(self, request_id):
+        return self.requests[request_id]
+
+    def set_callback(self, callback):
+        self._callback = callback
+
+    def is_ready(self):
+        return len(self._running) < len(self.requests)
+
+    def get_idle_request_id(self):
+        if not self.is_ready():
+            self._finish(self._running.popleft())
+        return next(request_id for request_id in range(len(self.requests)) if request_id not in self._running)
+
+    def start_async(self, inputs=None, userdata=None):
+        request_id = self.get_idle_request_id()
+        self.requests[request_id].infer()
+        self.userdata[request_id] = userdata
+        self._running.append(request_id)
+        self.started += 1
+        if self.start_seconds:
+            time.sleep(self.start_seconds)
+
+    def wait_all(self):
+        while self._running:
+            self._finish(self._running.popleft())
+
+    def _finish(self, request_id):
+        if self._callback is not None:
+            self._callback(self.requests[request_id], self.userdata[request_id])
+
+
+class FakeDataQueue:
+    """Data queue with a single group of empty inputs."""
+
+    def __init__(self, batch_size=1):
+        self.current_group_id = 0
+        self.batch_sizes = [batch_size]
+
+    def get_next_batch_size(self):
+        return self.batch_sizes[self.current_group_id]
+
+    def get_next_input(self):
+        return {}
@@ -0,0 +1,67 @@
+# Copyright (C) 2018-2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import tempfile
+import unittest
+
+from openvino.tools.benchmark.multi_model import load_multi_model_config, run_concurrently
+
+
+class FakeWorkload:
+    def __init__(self, name, error=None):
+        self.name = name
+        self.error = error
+        self.result = None
+
+    def run(self, barrier=None):
+        if self.error is not None:
+            raise self.error
+        barrier.wait()
+        self.result = {'fps': 1.}
+        return self.result
+
+
+class TestMultiModelConfig(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_config(self, config):
+        path = os.path.join(self.tmp_dir.name, 'models.json')
+        with open(path, 'w') as config_file:
+            json.dump(config, config_file)
+        return path
+
+    def test_names(self):
+        models = load_multi_model_config(self.write_config([
+            {'model': 'models/resnet.xml', 'rate': 100},
+            {'model': 'models/resnet.xml', 'name': 'resnet_gpu', 'device': 'GPU'},
+        ]))
+        self.assertEqual([entry['name'] for entry in models], ['resnet', 'resnet_gpu'])
+        self.assertEqual(models[0]['rate'], 100)
+
+    def test_invalid_config(self):
+        for config in ({'model': 'resnet.xml'}, [], [{'name': 'resnet'}], ['resnet.xml']):
+            with self.assertRaisesRegex(Exception, '[Mm]ulti-model configuration'):
+                load_multi_model_config(self.write_config(config))
+
+    def test_duplicate_names(self):
+        path = self.write_config([{'model': 'a/resnet.xml'}, {'model': 'b/resnet.xml'}])
+        with self.assertRaisesRegex(Exception, "'resnet' is used more than once"):
+            load_multi_model_config(path)
+
+
+class TestRunConcurrently(unittest.TestCase):
+    def test_results(self):
+        results = run_concurrently([FakeWorkload('a'), FakeWorkload('b'), FakeWorkload('c')])
+        self.assertEqual(results, {'a': {'fps': 1.}, 'b': {'fps': 1.}, 'c': {'fps': 1.}})
+
+    def test_original_error(self):
+        # Other workloads fail on the aborted barrier, the error of the failed workload is raised
+        workloads = [FakeWorkload('a'), FakeWorkload('b', ValueError('cannot compile')), FakeWorkload('c')]
+        with self.assertRaisesRegex(ValueError, 'cannot compile'):
+            run_concurrently(workloads)
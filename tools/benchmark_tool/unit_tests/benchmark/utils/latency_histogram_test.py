@@ -0,0 +1,90 @@
+# Copyright (C) 2018-2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import unittest
+
+import numpy as np
+
+from openvino.tools.benchmark.utils.utils import LatencyHistogram
+
+
+def create_histogram(values, significant_digits=3):
+    histogram = LatencyHistogram(significant_digits)
+    for value in values:
+        histogram.record(float(value))
+    return histogram
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def assert_within_precision(self, value, reference, significant_digits):
+        self.assertLessEqual(abs(value - reference), reference * 10 ** -significant_digits)
+
+    def test_percentile(self):
+        values = np.random.RandomState(0).lognormal(1.5, 0.5, 20000)
+        for significant_digits in (2, 3, 4):
+            histogram = create_histogram(values, significant_digits)
+            for percent in LatencyHistogram.PERCENTILES:
+                self.assert_within_precision(histogram.percentile(percent),
+                                             np.percentile(values, percent), significant_digits)
+            self.assertEqual(histogram.percentile(100), values.max())
+            self.assertEqual(histogram.count, len(values))
+            self.assertAlmostEqual(histogram.mean, values.mean())
+
+    def test_percentile_is_clamped_to_recorded_values(self):
+        histogram = create_histogram([5.] * 10)
+        for percent in (1, 50, 99.9):
+            self.assertEqual(histogram.percentile(percent), 5.)
+
+    def test_merge(self):
+        values = np.random.RandomState(1).lognormal(2., 1., 10000)
+        histogram = create_histogram(values[:3000])
+        histogram.merge(create_histogram(values[3000:]))
+        reference = create_histogram(values)
+
+        self.assertEqual(dict(histogram.buckets), dict(reference.buckets))
+        self.assertEqual((histogram.count, histogram.min, histogram.max),
+                         (reference.count, reference.min, reference.max))
+        self.assertAlmostEqual(histogram.total, reference.total)
+        for percent in LatencyHistogram.PERCENTILES:
+            self.assertEqual(histogram.percentile(percent), reference.percentile(percent))
+            self.assert_within_precision(histogram.percentile(percent), np.percentile(values, percent), 3)
+
+    def test_merge_empty(self):
+        histogram = create_histogram([1., 2.])
+        histogram.merge(LatencyHistogram())
+        self.assertEqual((histogram.count, histogram.min, histogram.max), (2, 1., 2.))
+
+        empty = LatencyHistogram()
+        empty.merge(create_histogram([1., 2.]))
+        self.assertEqual((empty.count, empty.min, empty.max), (2, 1., 2.))
+
+    def test_zero_bucket(self):
+        values = np.concatenate([np.zeros(3000), np.random.RandomState(2).lognormal(0., 0.3, 7000)])
+        histogram = create_histogram(values)
+
+        self.assertEqual(histogram.zero_count, 3000)
+        self.assertEqual(sum(histogram.buckets.values()), 7000)
+        self.assertEqual(histogram.min, 0.)
+        self.assertEqual(histogram.percentile(10), 0.)
+        self.assertEqual(histogram.percentile(30), 0.)
+        for percent in LatencyHistogram.PERCENTILES:
+            self.assert_within_precision(histogram.percentile(percent), np.percentile(values, percent), 3)
+
+    def test_summary(self):
+        values = np.random.RandomState(3).lognormal(1., 0.5, 5000)
+        summary = create_histogram(values).summary()
+
+        self.assertEqual(list(summary), ['p50', 'p90', 'p99', 'p99.9', 'max'])
+        self.assertEqual(summary['max'], values.max())
+        for percent in LatencyHistogram.PERCENTILES:
+            self.assert_within_precision(summary[f'p{percent:g}'], np.percentile(values, percent), 3)
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+        self.assertEqual(histogram.summary(), {'p50': 0., 'p90': 0., 'p99': 0., 'p99.9': 0., 'max': 0.})
+        self.assertEqual(histogram.mean, 0.)
+
+    def test_invalid_significant_digits(self):
+        for significant_digits in (0, 6):
+            with self.assertRaises(Exception):
+                LatencyHistogram(significant_digits)
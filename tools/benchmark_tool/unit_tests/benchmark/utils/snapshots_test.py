@@ -0,0 +1,106 @@
+# Copyright (C) 2018-2023 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import re
+import tempfile
+import unittest
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+from openvino.tools.benchmark.benchmark import Benchmark
+from openvino.tools.benchmark.utils.snapshots import SnapshotReporter
+
+PROMETHEUS_SAMPLE = re.compile(r'^[a-z_]+(\{quantile="[0-9.]+"\})? -?[0-9.e+-]+$')
+
+
+def create_benchmark():
+    # Core is not used by the snapshot reporter
+    return Benchmark('CPU', 4, None, 1, latency_interval=0, core=object())
+
+
+class TestSnapshotReporter(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'snapshots.jsonl')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_take_snapshot(self):
+        benchmark = create_benchmark()
+        reporter = SnapshotReporter(benchmark, 3600, frames_per_request=2, path=self.path)
+        reporter.start()
+        for latency in (1., 2., 3., 4.):
+            benchmark.record_latency(latency)
+        snapshot = reporter.take_snapshot()
+        benchmark.record_latency(5.)
+        reporter.stop()
+
+        self.assertEqual((snapshot['requests'], snapshot['total_requests']), (4, 4))
+        self.assertGreater(snapshot['fps'], 0)
+        self.assertEqual(snapshot['latency_ms']['avg'], 2.5)
+        self.assertEqual(snapshot['latency_ms']['max'], 4.)
+        # Percentiles are rounded to microseconds
+        self.assertAlmostEqual(snapshot['latency_ms']['p50'], 2., delta=0.005)
+        self.assertGreaterEqual(snapshot['infer_request_utilization'], 0)
+        self.assertLessEqual(snapshot['infer_request_utilization'], 1)
+        # Latencies are not recorded for snapshots after the last one
+        self.assertIsNone(benchmark.snapshot_histogram)
+
+        with open(self.path) as snapshots_file:
+            snapshots = [json.loads(line) for line in snapshots_file]
+        self.assertEqual(len(snapshots), 2)
+        self.assertEqual(snapshots[0]['requests'], 4)
+        self.assertEqual((snapshots[1]['requests'], snapshots[1]['total_requests']), (1, 5))
+        self.assertEqual(reporter.snapshot, snapshots[1])
+
+    def test_to_prometheus(self):
+        benchmark = create_benchmark()
+        reporter = SnapshotReporter(benchmark, 3600)
+        self.assertEqual(reporter.to_prometheus(), '')
+
+        reporter.start()
+        for latency in (1., 2., 3.):
+            benchmark.record_latency(latency)
+        reporter.stop()
+        text = reporter.to_prometheus()
+
+        self.assertTrue(text.endswith('\n'))
+        lines = text.splitlines()
+        metric_types = {}
+        for line in lines:
+            if line.startswith('#'):
+                _, keyword, name, metric_type = line.split()
+                self.assertEqual(keyword, 'TYPE')
+                metric_types[name] = metric_type
+                continue
+            self.assertRegex(line, PROMETHEUS_SAMPLE)
+            # Every sample is preceded by the type of its metric family
+            name = line.split('{')[0].split()[0]
+            family = next(family for family in metric_types if name.startswith(family))
+            self.assertIn(metric_types[family], ('gauge', 'counter'))
+
+        self.assertIn('benchmark_app_requests_total 3', lines)
+        self.assertEqual(metric_types['benchmark_app_requests_total'], 'counter')
+        quantiles = [re.search(r'quantile="([0-9.]+)"', line).group(1) for line in lines if 'quantile=' in line]
+        self.assertEqual(quantiles, ['0.5', '0.9', '0.99', '0.999'])
+        self.assertIn('benchmark_app_latency_ms_max 3.0', lines)
+
+    def test_metrics_endpoint(self):
+        benchmark = create_benchmark()
+        reporter = SnapshotReporter(benchmark, 3600, port=0)
+        reporter.start()
+        try:
+            benchmark.record_latency(1.)
+            reporter.take_snapshot()
+            url = f'http://127.0.0.1:{reporter._server.server_address[1]}'
+            with urlopen(f'{url}/metrics') as response:
+                self.assertTrue(response.headers['Content-Type'].startswith('text/plain; version=0.0.4'))
+                self.assertEqual(response.read().decode('utf-8'), reporter.to_prometheus())
+            with self.assertRaises(HTTPError) as error:
+                urlopen(f'{url}/other')
+            self.assertEqual(error.exception.code, 404)
+        finally:
+            reporter.stop()
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import hashlib
+import io
 
 import defusedxml.ElementTree as ET
 from defusedxml import defuse_stdlib
@@ -24,7 +25,7 @@ tostring = ET_defused.tostring
 elements_to_skip_during_serializing = ['inputs_list']
 
 
-def serialize_constants(graph: Graph, bin_file_name: str, data_type=np.float32):
+def serialize_constants(graph: Graph, bin_file_name: [str, io.BytesIO], data_type=np.float32):
     """
     Found all data constants that has output edges with 'bin' attribute.
     Serialize content for such constants to a binary file with name bin_file_name in
@@ -33,15 +34,26 @@ def serialize_constants(graph: Graph, bin_file_name: str, data_type=np.float32):
 
     Args:
         @graph: input graph with op and data nodes
-        @bin_file_name: path to file to write blobs to
+        @bin_file_name: path to file to write blobs to or in-memory stream
         @data_type: numpy data type to convert all blob elements to
 
     """
     bin_hashes = {}
+    if isinstance(bin_file_name, io.BytesIO):
+        serialize_constants_recursively(graph, bin_file_name, data_type, bin_hashes)
+        return
     with open(bin_file_name, 'wb') as bin_file:
         serialize_constants_recursively(graph, bin_file, data_type, bin_hashes)
 
 
+def write_blob(bin_file, blob: np.ndarray):
+    if isinstance(bin_file, io.BytesIO):
+        # ndarray.tofile works with real files only
+        bin_file.write(np.ascontiguousarray(blob).reshape(-1).view(np.uint8))
+    else:
+        blob.tofile(bin_file)
+
+
 def update_offset_size_in_const_node(node: Node):
     assert node.kind == 'data'
     for consumer in node.out_nodes():
@@ -74,7 +86,7 @@ def serialize_constants_recursively(graph: Graph, bin_file, data_type, bin_hashe
                 update_offset_size_in_const_node(node)
             else:
                 start = bin_file.tell()
-                blob.tofile(bin_file)
+                write_blob(bin_file, blob)
                 end = bin_file.tell()
 
                 graph.node[node.node]['offset'] = start
@@ -574,7 +586,7 @@ def serialize_network(graph, net_element, unsupported):
         serialize_node(graph, node[0], layers, edges, unsupported)
 
 
-def generate_ie_ir(graph: Graph, file_name: str, input_names: tuple = (), mean_offset: tuple = (),
+def generate_ie_ir(graph: Graph, file_name: [str, io.BytesIO], input_names: tuple = (), mean_offset: tuple = (),
                    mean_size: tuple = (), meta_info: dict = dict()):
     """
     Extracts IE/IR attributes from kind='op' nodes in three ways:
@@ -584,7 +596,7 @@ def generate_ie_ir(graph: Graph, file_name: str, input_names: tuple = (), mean_o
 
     Args:
         graph: nx graph with FW-independent model
-        file_name: name of the resulting IR
+        file_name: name of the resulting IR or in-memory stream to write it to
         input_names: names of input layers of the topology to add mean file to
         input_name: name of the layer which is referenced from pre-processing block if any
         mean_values: tuple of mean values for channels in RGB order
@@ -623,6 +635,9 @@ def generate_ie_ir(graph: Graph, file_name: str, input_names: tuple = (), mean_o
         unsupported.report(log.error, "List of operations that cannot be converted to Inference Engine IR:")
         raise Error('Part of the nodes was not converted to IR. Stopped. ' +
                     refer_to_faq_msg(24))
+    if isinstance(file_name, io.BytesIO):
+        file_name.write(bytes(pretty_xml_as_string, "UTF-8"))
+        return
     with open(file_name, 'wb') as file:
         file.write(bytes(pretty_xml_as_string, "UTF-8"))
 
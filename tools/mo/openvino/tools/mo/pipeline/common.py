@@ -210,7 +210,7 @@ def set_default_tensor_names_for_parameters_results(graph: Graph):
 
 def prepare_emit_ir(graph: Graph, data_type: str, output_dir: str, output_model_name: str,
                     mean_data: [list, None] = None, input_names: list = None, meta_info: dict = None,
-                    use_temporary_path=False, convert_types=False, rename_results=True):
+                    use_temporary_path=False, convert_types=False, rename_results=True, xml_stream=None, bin_stream=None):
     if input_names is None:
         input_names = []
     if meta_info is None:
@@ -248,6 +248,13 @@ def prepare_emit_ir(graph: Graph, data_type: str, output_dir: str, output_model_
 
     tensor_names.propagate_op_name_to_tensor(graph)
 
+    if xml_stream is not None and bin_stream is not None:
+        # IR is kept in memory, the mapping file is not needed in this case
+        assert not mean_data, 'Mean images are not supported when IR is serialized to memory'
+        serialize_constants(graph, bin_stream)
+        generate_ie_ir(graph=graph, file_name=xml_stream, input_names=input_names, meta_info=meta_info)
+        return
+
     ir_path_suffix = "_tmp" if use_temporary_path else ""
 
     bin_file = os.path.join(output_dir, '{}{}.bin'.format(output_model_name, ir_path_suffix))
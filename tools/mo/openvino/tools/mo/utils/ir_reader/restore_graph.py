@@ -42,13 +42,16 @@ def restore_graph_from_ir(path_to_xml: str, path_to_bin: str = None) -> (Graph,
     return new_graph, copy(ir.meta_data)
 
 
-def save_restored_graph(graph: Graph, path: str, meta_data, name=None, rename_results=True):
+def save_restored_graph(graph: Graph, path: str, meta_data, name=None, rename_results=True, xml_stream=None,
+                        bin_stream=None):
     """
     Function to apply all necessary transforms from back stage to prepare and save restored graph and metadata.
     :param graph: Graph to save
     :param path: Path to saved IR
     :param meta_data: Namespace with converting parameters restored from IR
     :param name: Name for saved IR
+    :param xml_stream: In-memory stream to write IR xml to instead of a file in path
+    :param bin_stream: In-memory stream to write IR weights to instead of a file in path
     :return:
     """
 
@@ -88,4 +91,5 @@ def save_restored_graph(graph: Graph, path: str, meta_data, name=None, rename_re
     for_graph_and_each_sub_graph_recursively(graph, RemoveConstOps().find_and_replace_pattern)
     for_graph_and_each_sub_graph_recursively(graph, CreateConstNodesReplacement().find_and_replace_pattern)
 
-    prepare_emit_ir(graph, data_type, path, name, meta_info=meta_data, rename_results=rename_results)
+    prepare_emit_ir(graph, data_type, path, name, meta_info=meta_data, rename_results=rename_results,
+                    xml_stream=xml_stream, bin_stream=bin_stream)
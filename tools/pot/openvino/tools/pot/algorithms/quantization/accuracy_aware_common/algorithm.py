@@ -3,7 +3,9 @@
 
 import os
 import random
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from copy import deepcopy
+from queue import Queue
 from sys import maxsize
 
 import numpy as np
@@ -45,7 +47,8 @@ class AccuracyAwareCommon(Algorithm):
             'annotation_free': False,
             'tune_hyperparams': False,
             'annotation_conf_threshold': 0.6,
-            'convert_to_mixed_preset': False
+            'convert_to_mixed_preset': False,
+            'ranking_parallelism': 1
         }
 
         for setting in default_config:
@@ -95,6 +98,7 @@ class AccuracyAwareCommon(Algorithm):
         self._need_to_change_scope = True
         self._change_conditions = None
         self._exclude_bad_nodes = False
+        self._ranking_engines = None
 
     @property
     def change_original_model(self):
@@ -407,6 +411,8 @@ class AccuracyAwareCommon(Algorithm):
     def _calculate_node_importance_scores(self, model, ranking_subset, metric_name, excluded_nodes=None):
         """Cuts out FQ layers one after another and measures metric value on ranking subset.
         The higher the value, the more important the node.
+        Models with cut out layers are prepared one by one, and if ranking_parallelism is greater than 1,
+        they are scored concurrently by clones of the engine.
         :param model: graph from which to cut nodes
         :param ranking_subset: subset on which the scores will be calculated
         :param metric_name: metric to take into account
@@ -414,8 +420,23 @@ class AccuracyAwareCommon(Algorithm):
         """
         change_fqs = []
         node_importance_score = {}
-        eu.select_evaluation_dataset(self._engine)
-
+        ranking_engines = self._get_ranking_engines()
+        for engine in [self._engine] + ranking_engines:
+            eu.select_evaluation_dataset(engine)
+
+        free_engines = Queue()
+        for engine in ranking_engines:
+            free_engines.put(engine)
+
+        def get_score(modified_model):
+            engine = free_engines.get()
+            try:
+                return self._get_score(modified_model, list(ranking_subset), metric_name, engine)
+            finally:
+                free_engines.put(engine)
+
+        executor = ThreadPoolExecutor(len(ranking_engines)) if ranking_engines else None
+        pending_scores = set()
         fake_quantize_nodes = get_nodes_by_type(model, ['FakeQuantize'])
         for node in fake_quantize_nodes:
             if excluded_nodes and node.fullname in excluded_nodes:
@@ -428,20 +449,45 @@ class AccuracyAwareCommon(Algorithm):
                              modified_fq_layers)
                 change_fqs += modified_fq_layers
                 logger.update_progress(self._config.ranking_subset_size)
-                node_importance_score[node.fullname] = self._get_score(modified_model,
-                                                                       list(ranking_subset),
-                                                                       metric_name)
+                if executor is None:
+                    node_importance_score[node.fullname] = self._get_score(modified_model,
+                                                                           list(ranking_subset),
+                                                                           metric_name)
+                    continue
+                # limits the number of modified models kept in memory
+                if len(pending_scores) >= 2 * len(ranking_engines):
+                    _, pending_scores = wait(pending_scores, return_when=FIRST_COMPLETED)
+                node_importance_score[node.fullname] = executor.submit(get_score, modified_model)
+                pending_scores.add(node_importance_score[node.fullname])
+
+        if executor is not None:
+            executor.shutdown()
+            node_importance_score = {name: score.result() for name, score in node_importance_score.items()}
 
-        eu.reset_dataset_to_default(self._engine)
+        for engine in [self._engine] + ranking_engines:
+            eu.reset_dataset_to_default(engine)
 
         return node_importance_score
 
-    def _get_score(self, model, ranking_subset, metric_name):
-        self._engine.set_model(model)
-        self._engine.allow_pairwise_subset = True
-        index_sampler = create_sampler(self._engine, samples=list(ranking_subset))
-        metrics, *_ = self._engine.predict(sampler=index_sampler)
-        self._engine.allow_pairwise_subset = False
+    def _get_ranking_engines(self):
+        """ Returns clones of the engine used to calculate node importance scores in parallel """
+        parallelism = self._config.get('ranking_parallelism', 1)
+        if parallelism > 1 and self._ranking_engines is None:
+            if self._engine.supports_cloning:
+                self._ranking_engines = [self._engine.clone() for _ in range(parallelism)]
+            else:
+                logger.warning('Node importance scores are calculated sequentially: '
+                               '%s does not support cloning', type(self._engine).__name__)
+                self._ranking_engines = []
+        return self._ranking_engines or []
+
+    def _get_score(self, model, ranking_subset, metric_name, engine=None):
+        engine = self._engine if engine is None else engine
+        engine.set_model(model)
+        engine.allow_pairwise_subset = True
+        index_sampler = create_sampler(engine, samples=list(ranking_subset))
+        metrics, *_ = engine.predict(sampler=index_sampler)
+        engine.allow_pairwise_subset = False
         ranking_metric = self._metrics_config[metric_name].ranking
         score = ranking_metric.comparator(metrics[ranking_metric.name])
         return score
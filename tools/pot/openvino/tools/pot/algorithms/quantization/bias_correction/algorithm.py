@@ -68,7 +68,8 @@ class BiasCorrection(Algorithm):
         :return: model with corrected biases for layers with bias
         '''
         self._fp32_statistics = self._stats_collector.get_statistics_for_algorithm(self.name)
-        self._launcher = IELauncher()
+        # Keeps compiled subgraphs of the current node for every shape of the feed dicts
+        self._launcher = IELauncher(cache_size=4)
 
         stat_inputs = deepcopy(self._collected_stat_inputs)
 
@@ -76,12 +77,10 @@ class BiasCorrection(Algorithm):
 
         for node_name in self._subgraphs_data:
             node = mu.get_node_by_name(model, node_name)
-            model_copy = deepcopy(model)
+            model_copy = self._copy_model_for_node(model, node)
             node_copy = mu.get_node_by_name(model_copy, node_name)
             node_copy_bias_add = self._get_add_node_for_bias(node_copy)
 
-            self._remove_fq_from_inputs(model_copy)
-
             model_copy, params = self._prepare_model_and_params(model_copy, node_copy, node_copy_bias_add)
 
             bias_shift_value = self._compute_bias_shift(model_copy, **params)
@@ -146,6 +145,17 @@ class BiasCorrection(Algorithm):
         del model_copy
         return subgraphs_data
 
+    def _copy_model_for_node(self, model, node):
+        if model.is_cascade:
+            model_copy = deepcopy(model)
+            self._remove_fq_from_inputs(model_copy)
+            return model_copy
+
+        subgraph_data = self._subgraphs_data[node.fullname]
+        output_names = subgraph_data['stats_nodes'] + subgraph_data['output_nodes'] + \
+            [self._get_add_node_for_bias(node).fullname]
+        return mu.extract_subgraph(model, subgraph_data['input_nodes'], output_names)
+
     def _remove_fq_from_inputs(self, model):
         fq_nodes = mu.get_nodes_by_type(model, ['FakeQuantize'])
         fq_names_to_cut = []
@@ -248,7 +258,9 @@ class BiasCorrection(Algorithm):
             remaining_outputs = list(set(output_nodes) - set(stats_nodes))
             self._create_results_after_nodes(remaining_outputs)
 
+            # Producers of the input nodes are removed from the subgraph before FakeQuantize nodes
             model.clean_up()
+            self._remove_fq_from_inputs(model)
 
             self._update_split_subgraphs(model)
             params['feed_dicts'] = self._create_feed_dicts(params['parameters_data_dict'])
@@ -333,11 +345,15 @@ class BiasCorrection(Algorithm):
             feed_dicts.append(feed_dict)
         return feed_dicts
 
+    @staticmethod
+    def _get_feed_shapes(feed_dict):
+        return {input_name: tuple(feed_dict[input_name].shape) for input_name in feed_dict}
+
     def _reshape_model_by_feed_dict(self, feed_dict, model_copy):
         current_inputs = self._launcher.model.inputs
         current_shapes = {input_const.get_node().friendly_name: tuple(input_const.partial_shape) for input_const in
                           current_inputs}
-        feed_shapes = {input_name: tuple(feed_dict[input_name].shape) for input_name in feed_dict}
+        feed_shapes = self._get_feed_shapes(feed_dict)
         if feed_shapes != current_shapes:
             self._launcher.set_model(model_copy, md_shapes=feed_shapes)
 
@@ -353,7 +369,7 @@ class BiasCorrection(Algorithm):
             _, q_outputs = self._engine.predict(ref_stats_layout, self._sampler)
             q_output = agf.mean(q_outputs[add_name]['mean_per_channel'])
         else:
-            self._launcher.set_model(model_copy)
+            self._launcher.set_model(model_copy, md_shapes=self._get_feed_shapes(params['feed_dicts'][0]))
             q_outputs = []
             for feed_dict in params['feed_dicts']:
                 self._reshape_model_by_feed_dict(feed_dict, model_copy)
@@ -375,7 +391,7 @@ class BiasCorrection(Algorithm):
             if not bias_is_updated:
                 fq_nodes = mu.get_nodes_by_type(model_copy, ['FakeQuantize'])
                 self._graph_transformer.remove_fq_nodes(model_copy, fq_nodes)
-            self._launcher.set_model(model_copy)
+            self._launcher.set_model(model_copy, md_shapes=self._get_feed_shapes(params['feed_dicts'][0]))
             for feed_dict in params['feed_dicts']:
                 self._reshape_model_by_feed_dict(feed_dict, model_copy)
                 q_output = self._launcher.infer(feed_dict)
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from copy import deepcopy
+from functools import partial
 
 import os
 import numpy as np
@@ -15,7 +16,7 @@ from ....graph import model_utils as mu
 from ....graph import node_utils as nu
 from ....graph.special_operations import TRANSPOSED_OPERATIONS
 from ....samplers.creator import create_sampler
-from ....statistics.function_selector import get_aggregation_function
+from ....statistics.functions.aggregation import aggregate_statistics
 
 
 # pylint: disable=R0912
@@ -75,17 +76,23 @@ class MinMaxQuantization(Algorithm):
         """
         fake_quantize_config = fqut.compute_stats_layouts(self._config, model)
 
-        activations_stats_layout = self.create_stats_layout(fake_quantize_config, model,
-                                                            for_weights=False,
-                                                            inplace_statistics=self._config['inplace_statistics'])
+        activations_stats_layout = self.create_stats_layout(
+            fake_quantize_config, model, for_weights=False,
+            inplace_statistics=self._config['inplace_statistics'],
+            streaming_statistics=self._config.get('streaming_statistics', False),
+            sketch_accuracy=self._config.get('statistics_sketch_accuracy', 0.01))
         return activations_stats_layout
 
     @staticmethod
-    def create_stats_layout(fake_quantize_config, model, for_weights=True, inplace_statistics=True):
+    def create_stats_layout(fake_quantize_config, model, for_weights=True, inplace_statistics=True,
+                            streaming_statistics=False, sketch_accuracy=0.):
         """ Creates weights layout based on model and config dictionary
         :param fake_quantize_config: dictionary with fake quantize names as a key and its settings as values
         :param model: CompressedModel instance
         :param for_weights: whether statistic layout is calculated for weights or for activations.
+        :param streaming_statistics: whether activations statistics are aggregated on the fly
+        :param sketch_accuracy: relative accuracy of sketches used for approximate aggregators in streaming mode,
+         per-sample values are kept for such aggregators if it is zero
         :return weights or activations statistics layout. Layout is a dictionary with layer name as
          key and dictionary with statistics {stats_name: stats_fn} as values
         """
@@ -109,14 +116,16 @@ class MinMaxQuantization(Algorithm):
                 fq_input_key = nu.get_quantized_input_key(fq)
                 ts_args['inplace_statistics'] = inplace_statistics
                 statistics_layout[fq_input_key] = get_tensor_statistics(layer_config['range_estimator'],
-                                                                        for_weights=False, **ts_args)
+                                                                        for_weights=False,
+                                                                        streaming_statistics=streaming_statistics,
+                                                                        sketch_accuracy=sketch_accuracy, **ts_args)
         return statistics_layout
 
     @staticmethod
     def fill_fq_range(model, weights_stats, inputs_stats, fake_quantize_config, config):
         def get_aggregator(estimator_config):
-            min_aggregator = get_aggregation_function(estimator_config['min']['aggregator'])
-            max_aggregator = get_aggregation_function(estimator_config['max']['aggregator'])
+            min_aggregator = partial(aggregate_statistics, estimator_config['min']['aggregator'])
+            max_aggregator = partial(aggregate_statistics, estimator_config['max']['aggregator'])
             return min_aggregator, max_aggregator
 
         batch_inputs_stats = dict()
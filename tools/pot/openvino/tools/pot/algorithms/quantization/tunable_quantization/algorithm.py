@@ -50,7 +50,10 @@ class TunableQuantization(MinMaxQuantization):
         """
         fake_quantize_config = fqut.compute_stats_layouts(self._config, model, qscheme=qscheme)
 
-        activations_stats_layout = self.create_stats_layout(fake_quantize_config, model, for_weights=False)
+        activations_stats_layout = self.create_stats_layout(
+            fake_quantize_config, model, for_weights=False,
+            streaming_statistics=self._config.get('streaming_statistics', False),
+            sketch_accuracy=self._config.get('statistics_sketch_accuracy', 0.01))
 
         return activations_stats_layout
 
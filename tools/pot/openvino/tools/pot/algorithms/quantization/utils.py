@@ -10,7 +10,8 @@ from .range_estimator import get_range_estimator_config
 from ...api.engine import Engine
 from ...configs.hardware_config import HardwareConfig
 from ...engines.ac_engine import ACEngine
-from ...statistics.function_selector import ACTIVATIONS, WEIGHTS, get_stats_function, AGGREGATION_FN
+from ...statistics.function_selector import ACTIVATIONS, WEIGHTS, get_stats_function, AGGREGATION_FN, \
+    AGGREGATION_ACCUMULATORS, get_aggregation_accumulator
 from ...statistics.statistics import TensorStatistic
 
 __HARDWARE_CONFIG_DIR = Path(__file__).parent.parent.parent.absolute() / 'configs' / 'hardware'
@@ -248,7 +249,8 @@ def get_quantize_op_config(op, config, opt_conf=None):
     return qconfig
 
 
-def get_tensor_statistics(range_estimator_config, for_weights, **kwargs):
+def get_tensor_statistics(range_estimator_config, for_weights, streaming_statistics=False, sketch_accuracy=0.,
+                          **kwargs):
     stats = {}
     for stats_name in ['min', 'max']:
         if stats_name not in range_estimator_config:
@@ -274,6 +276,13 @@ def get_tensor_statistics(range_estimator_config, for_weights, **kwargs):
             if stats_name == 'max':
                 q_value = 1 - q_value
             ts_args.update({'q': q_value})
+        aggregator = range_estimator_config[stats_name].get('aggregator')
+        if streaming_statistics and not for_weights and aggregator in AGGREGATION_ACCUMULATORS.registry_dict:
+            accumulator = get_aggregation_accumulator(aggregator)
+            if not accumulator.approximate:
+                ts_args['aggregator'] = aggregator
+            elif sketch_accuracy:
+                ts_args.update({'aggregator': aggregator, 'sketch_accuracy': sketch_accuracy})
         stats[stat_mod_name] = TensorStatistic(fn, **ts_args)
     return stats
 
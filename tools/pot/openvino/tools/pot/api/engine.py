@@ -24,6 +24,8 @@ class Engine(ABC):
         self._statistic_graph_builder = StatisticGraphBuilder()
         self._stat_requests_number = self.config.get('stat_requests_number', None)
         self._eval_requests_number = self.config.get('eval_requests_number', None)
+        # ActivationCache instance if the engine can read model outputs from the on-disk cache
+        self.activation_cache = None
 
     def set_model(self, model):
         """ Set/reset model to instance of engine class
@@ -61,6 +63,18 @@ class Engine(ABC):
                   a dictionary of collected statistics {node_name: {stat_name: [statistics]}}
         """
 
+    @property
+    def supports_cloning(self):
+        """Whether clone() creates engines which can run inference in parallel with this one"""
+        return False
+
+    def clone(self):
+        """ Creates an engine of the same type which can run inference in parallel with this one.
+        It uses the same config and data loader, and a separate copy of the metric
+        :return: Engine instance or None if the engine does not support cloning
+        """
+        return None
+
     def get_metrics_attributes(self):
         """Returns a dictionary of metrics attributes {metric_name: {attribute_name: value}}"""
         return self._metric.get_attributes()
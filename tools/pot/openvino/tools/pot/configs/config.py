@@ -365,6 +365,10 @@ class Config(Dict):
                 'dump_intermediate_model', False)
             algo['params']['inplace_statistics'] = self['compression'].get(
                 'inplace_statistics', True)
+            algo['params']['streaming_statistics'] = self['compression'].get(
+                'streaming_statistics', False)
+            algo['params']['statistics_sketch_accuracy'] = self['compression'].get(
+                'statistics_sketch_accuracy', 0.01)
 
     def _configure_logger_params(self):
         """ Creates a log directory name based on model and algo configurations
@@ -1,23 +1,27 @@
 # Copyright (C) 2020-2022 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 import multiprocessing
+import os
 from math import ceil
 from time import time
 
 import copy
 import numpy as np
-from openvino.runtime import Core, AsyncInferQueue, Shape   # pylint: disable=E0611,E0401
+from openvino.runtime import Core, AsyncInferQueue, Shape, Tensor   # pylint: disable=E0611,E0401
 
 from .utils import append_stats, process_accumulated_stats, \
     restore_original_node_names, align_stat_names_with_results, \
     add_tensor_names, cast_friendly_names, collect_model_outputs, \
     process_raw_output, get_clean_name
 from ..api.engine import Engine
-from ..graph.model_utils import save_model
+from ..graph.model_utils import serialize_model
 from ..samplers.batch_sampler import BatchSampler
+from ..statistics.activation_cache import ActivationCache
+from ..statistics.statistics import Statistic
 from ..utils.logger import get_logger
-from ..utils.utils import create_tmp_dir, convert_output_key
+from ..utils.utils import convert_output_key
 
 logger = get_logger(__name__)
 
@@ -34,8 +38,22 @@ class IEEngine(Engine):
         self._output_layers = None
         self._accumulated_layer_stats = dict()
         self._per_sample_metrics = []
-        self._tmp_dir = create_tmp_dir()
         self._device = self.config.device
+        self._model_fingerprint = None
+        self._stat_output_signatures = {}
+        if self.config.get('activation_cache_dir'):
+            self.activation_cache = ActivationCache(self.config.activation_cache_dir,
+                                                    self.config.get('activation_cache_size', 1024))
+
+    @property
+    def supports_cloning(self):
+        return True
+
+    def clone(self):
+        """ Creates an engine with the same config, data loader and Core, and a copy of the metric """
+        engine = type(self)(self.config, self._data_loader, copy.deepcopy(self._metric))
+        engine._ie = self._ie  # pylint: disable=W0212
+        return engine
 
     def set_model(self, model):
         """ Loads NetworkX model into InferenceEngine and stores it in Engine class
@@ -44,7 +62,7 @@ class IEEngine(Engine):
         if model.is_cascade:
             raise Exception('Cascade models are not supported in current engine')
 
-        # save NetworkX graph to IR and use it to initialize IE Network
+        # serialize NetworkX graph to IR in memory and use it to initialize IE Network
         self._model = self._set_model(model)[0]['model']
         self._output_layers = [get_clean_name(output.get_node().friendly_name) for output in self._model.outputs]
 
@@ -60,12 +78,16 @@ class IEEngine(Engine):
                 ]
         """
         self._nx_model = model
-        paths = save_model(model, self._tmp_dir.name, 'tmp_model', for_stat_collection=True)
+        serialized_models = serialize_model(model, for_stat_collection=True)
         ie_networks = []
-        for path_dict in paths:
-            ie_net = {'model': self._ie.read_model(model=path_dict['model'], weights=path_dict['weights'])}
-            if 'name' in path_dict:
-                ie_net.update(name=path_dict['name'])
+        if self.activation_cache is not None:
+            buffers = [buffer for model_dict in serialized_models
+                       for buffer in (model_dict['model'], model_dict['weights'])]
+            self._model_fingerprint = ActivationCache.fingerprint(*buffers, self._get_dataset_identity())
+        for model_dict in serialized_models:
+            ie_net = {'model': self._ie.read_model(model=model_dict['model'], weights=Tensor(model_dict['weights']))}
+            if 'name' in model_dict:
+                ie_net.update(name=model_dict['name'])
             ie_networks.append(ie_net)
         return ie_networks
 
@@ -98,7 +120,11 @@ class IEEngine(Engine):
             model_with_stat_op, nodes_names_map, node_to_result_names = self._statistic_graph_builder.\
                 insert_statistic(copy.deepcopy(self._nx_model),
                                  stats_layout, stat_aliases)
+            fingerprint = self._model_fingerprint
             self.set_model(model_with_stat_op)
+            # Cached activations are keyed by the model without statistic outputs,
+            # so passes with different statistics layouts share them
+            self._model_fingerprint = fingerprint
             nodes_names_map = nodes_names_map[self._model.friendly_name]
             nodes_name = list(nodes_names_map.keys())
             cast_friendly_names(self._model.outputs)
@@ -116,6 +142,7 @@ class IEEngine(Engine):
 
             # Creating statistics layout with IE-like names
             stats_layout, stat_names_aliases = self._convert_stats_names(stats_layout)
+            self._stat_output_signatures = self._get_stat_output_signatures(stats_layout)
 
         self._predict(stats_layout=stats_layout,
                       sampler=sampler,
@@ -365,8 +392,11 @@ class IEEngine(Engine):
         """
 
         def completion_callback(request, user_data):
-            start_time, batch_id, batch_annotations, batch_meta = user_data
+            start_time, batch_id, batch_annotations, batch_meta, sample_indices, infer_start_time = user_data
             predictions = request.results
+            if sample_indices is not None:
+                self._cache_outputs(predictions, sample_indices, time() - infer_start_time,
+                                    batch_annotations, batch_meta)
             self._process_infer_output(stats_layout, predictions,
                                        batch_annotations, batch_meta,
                                        need_metrics_per_sample)
@@ -389,13 +419,17 @@ class IEEngine(Engine):
 
         progress_log_fn('Start inference of %d images', len(sampler))
 
-        sampler_iter = iter(enumerate(sampler))
+        batches = self._get_batches(stats_layout, sampler, compiled_model)
         # Start inference
         start_time = time()
         infer_queue.set_callback(completion_callback)
-        for batch_id, data_batch in sampler_iter:
-            batch_annotations, image_batch, batch_meta = self._process_batch(data_batch)
-            user_data = (start_time, batch_id, batch_annotations, batch_meta)
+        for batch_id, (sample_indices, outputs, batch) in enumerate(batches):
+            batch_annotations, image_batch, batch_meta = batch
+            if outputs is not None:
+                self._process_infer_output(stats_layout, outputs, batch_annotations, batch_meta,
+                                           need_metrics_per_sample)
+                continue
+            user_data = (start_time, batch_id, batch_annotations, batch_meta, sample_indices, time())
             infer_queue.start_async(self._fill_input(compiled_model, image_batch), user_data)
         infer_queue.wait_all()
         progress_log_fn('Inference finished')
@@ -418,14 +452,20 @@ class IEEngine(Engine):
 
         progress_log_fn('Start inference of %d images', len(sampler))
 
+        batches = self._get_batches(stats_layout, sampler, compiled_model)
         # Start inference
         start_time = time()
-        for batch_id, batch in iter(enumerate(sampler)):
-            batch_annotations, image_batch, batch_meta = self._process_batch(batch)
-
-            # Infer batch of images
-            predictions = infer_request.infer(self._fill_input(compiled_model, image_batch))
-            outputs = predictions
+        for batch_id, (sample_indices, outputs, batch) in enumerate(batches):
+            batch_annotations, image_batch, batch_meta = batch
+
+            if outputs is None:
+                # Infer batch of images
+                infer_start_time = time()
+                predictions = infer_request.infer(self._fill_input(compiled_model, image_batch))
+                outputs = predictions
+                if sample_indices is not None:
+                    self._cache_outputs(predictions, sample_indices, time() - infer_start_time,
+                                        batch_annotations, batch_meta)
 
             self._process_infer_output(stats_layout, outputs,
                                        batch_annotations, batch_meta,
@@ -439,6 +479,84 @@ class IEEngine(Engine):
 
         progress_log_fn('Inference finished')
 
+    def _get_batches(self, stats_layout, sampler, compiled_model):
+        """ Yields (sample indices, cached outputs, processed batch) for every batch of the sampler.
+        If outputs of the batch are read from the activation cache, the batch is not loaded
+        and has no input data. Otherwise cached outputs are None, and sample indices are None
+        if outputs of the model are not cached """
+        if self.activation_cache is None or self._model_fingerprint is None or not stats_layout \
+                or not isinstance(sampler, BatchSampler):
+            for batch in sampler:
+                yield None, None, self._process_batch(batch)
+            return
+
+        output_names = [self._get_output_names(output) for output in compiled_model.outputs]
+        output_names = [(names, cache_names) for names, cache_names in output_names if names]
+        for sample_indices in sampler.batch_indices():
+            cached = self.activation_cache.get(self._model_fingerprint,
+                                               [cache_names for _, cache_names in output_names],
+                                               sample_indices)
+            if cached is None:
+                yield sample_indices, None, self._process_batch(sampler.load_batch(sample_indices))
+                continue
+            outputs, (batch_annotations, batch_meta) = cached
+            outputs = {name: outputs[cache_names[0]] for names, cache_names in output_names for name in names}
+            yield sample_indices, outputs, (batch_annotations, None, batch_meta)
+
+    def _get_output_names(self, output):
+        """ Returns POT-friendly names of the model output and names it can be cached under,
+        the output is stored under the first of them. Outputs of inserted statistic operations
+        are named after the layer and the statistic type only, so they are cached under a name
+        with the whole signature of the statistic and are shared only by the same statistics """
+        names = sorted(get_clean_name(name) for name in output.get_tensor().get_names())
+        for name in names:
+            if name in self._stat_output_signatures:
+                return names, ['{}|{}'.format(name, self._stat_output_signatures[name])]
+        return names, names
+
+    @staticmethod
+    def _get_stat_output_signatures(stats_layout):
+        """ Returns signatures of the statistics computed by operations inserted into the model
+        {output name: signature}, a signature has type, granularity, axes and other parameters of the statistic """
+        signatures = {}
+        for stats in stats_layout.values():
+            for stat in stats:
+                if not isinstance(stat, Statistic) or not stat.kwargs.get('inplace_statistics', False) \
+                        or 'layer_stat_name' not in stat.kwargs:
+                    continue
+                params = sorted((key, repr(value)) for key, value in stat.kwargs.items() if key != 'layer_stat_name')
+                signatures.setdefault(stat.kwargs['layer_stat_name'], set()).add(repr(params))
+        return {name: '|'.join(sorted(signature)) for name, signature in signatures.items()}
+
+    def _get_dataset_identity(self):
+        """ Returns identity of the dataset the model is inferred on: type, size and config of the data loader,
+        which includes the data source and preprocessing parameters, and paths, sizes and modification times
+        of the files in the data source """
+        if self._data_loader is None:
+            return b''
+        config = getattr(self._data_loader, 'config', None) or {}
+        identity = [type(self._data_loader).__name__, len(self._data_loader),
+                    json.dumps(config, sort_keys=True, default=repr)]
+        data_source = config.get('data_source') if isinstance(config, dict) else None
+        if data_source is not None and os.path.exists(str(data_source)):
+            paths = [str(data_source)]
+            if os.path.isdir(paths[0]):
+                paths = sorted(os.path.join(root, file_name)
+                               for root, _, file_names in os.walk(paths[0]) for file_name in file_names)
+            for path in paths:
+                file_stat = os.stat(path)
+                identity.append((path, file_stat.st_size, file_stat.st_mtime_ns))
+        return repr(identity).encode('utf-8')
+
+    def _cache_outputs(self, predictions, sample_indices, infer_time, batch_annotations, batch_meta):
+        outputs = {}
+        for output, value in predictions.items():
+            names, cache_names = self._get_output_names(output)
+            if names:
+                outputs[cache_names[0]] = value
+        self.activation_cache.put(self._model_fingerprint, outputs, sample_indices, infer_time,
+                                  (batch_annotations, batch_meta))
+
     @staticmethod
     def _process_batch(batch):
         """ Processes batch data and returns lists of annotations, images and batch meta data
@@ -2,16 +2,21 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from collections import defaultdict
+from threading import Lock
 import re
 import numpy as np
 
 from ..statistics.statistics import compute_statistic, Statistic, TensorStatistic
 from ..statistics.function_selector import get_stats_function, ACTIVATIONS
+from ..statistics.functions.aggregation import StatisticAccumulator
 from ..utils.logger import get_logger
 from ..utils.utils import convert_output_key
 
 logger = get_logger(__name__)
 
+# statistics may be appended from callbacks of several infer requests at the same time
+_accumulated_stats_lock = Lock()
+
 
 def append_stats(accumulated_layer_stats, stats_layout, value, dataset_index):
     inplace_stats_mapping = get_inplace_stats_mapping(stats_layout)
@@ -20,13 +25,27 @@ def append_stats(accumulated_layer_stats, stats_layout, value, dataset_index):
     else:
         value = process_raw_output(value)
     for layer, stats in stats_layout.items():
-        if layer not in accumulated_layer_stats:
-            accumulated_layer_stats[layer] = {stat_name: [] for stat_name in stats_layout[layer]}
+        with _accumulated_stats_lock:
+            if layer not in accumulated_layer_stats:
+                accumulated_layer_stats[layer] = {stat_name: create_stat_accumulator(stat_fn)
+                                                  for stat_name, stat_fn in stats_layout[layer].items()}
         for stat_name, stat_fn in stats.items():
             layer_stat_name = inplace_stats_mapping[layer][stat_name]
             if layer_stat_name in value:
-                accumulated_layer_stats[layer][stat_name].append(
-                    (dataset_index, compute_statistic(stat_fn, value, layer_stat_name)))
+                stat_value = compute_statistic(stat_fn, value, layer_stat_name)
+                accumulated_stat = accumulated_layer_stats[layer][stat_name]
+                if isinstance(accumulated_stat, StatisticAccumulator):
+                    with _accumulated_stats_lock:
+                        accumulated_stat.update(stat_value)
+                else:
+                    accumulated_stat.append((dataset_index, stat_value))
+
+
+def create_stat_accumulator(stat_fn):
+    """ Returns accumulator aggregating the statistic on the fly if it is requested
+    by the statistic, otherwise a list for per-sample values """
+    accumulator = stat_fn.create_accumulator() if isinstance(stat_fn, Statistic) else None
+    return [] if accumulator is None else accumulator
 
 
 def parse_sequential_stats(value_sequential, stats_layout):
@@ -56,6 +75,8 @@ def parse_sequential_stats(value_sequential, stats_layout):
 def process_accumulated_stats(accumulated_stats, stat_names_aliases=None):
     for layer in accumulated_stats:
         for stat in accumulated_stats[layer]:
+            if isinstance(accumulated_stats[layer][stat], StatisticAccumulator):
+                continue
             accumulated_stats[layer][stat].sort(key=lambda el: el[0])
             accumulated_stats[layer][stat] = [el[1] for el in accumulated_stats[layer][stat]]
 
@@ -102,7 +123,9 @@ def get_sequential_activations(activations, layer, activation_seq, stats_layout,
             layer].kwargs.get('type', None)
         fn = get_stats_function(ACTIVATIONS, fn_type, granularity, 'compute_statistic')
         stats_layout[old_names_mapping[layer]].pop(stat_names_by_layer[layer])
-        stats_layout[old_names_mapping[layer]][stat_names_by_layer[layer]] = TensorStatistic(fn)
+        stats_layout[old_names_mapping[layer]][stat_names_by_layer[layer]] = \
+            TensorStatistic(fn, aggregator=stat_names_by_layer[layer].aggregator,
+                            sketch_accuracy=stat_names_by_layer[layer].sketch_accuracy)
         activation_seq[layer].append(activations)
     elif old_names_mapping.get(layer, None) in stats_layout and hasattr(stat_names_by_layer[layer], 'kwargs') \
             and not stat_names_by_layer[layer].kwargs.get('inplace_statistics', False):
@@ -151,6 +174,10 @@ def process_raw_output(raw_output):
     """ Process raw output into the POT friendly format """
     result = {}
     for result_node, result_data in raw_output.items():
+        # Outputs read from the activation cache are already processed
+        if isinstance(result_node, str):
+            result[result_node] = result_data
+            continue
         for name in result_node.get_tensor().get_names():
             result_name = get_clean_name(name)
             result[result_name] = result_data
@@ -3,6 +3,7 @@
 
 from copy import deepcopy
 
+import numpy as np
 from openvino.tools.mo.graph.graph import Graph
 
 from openvino.tools.pot.graph.node_utils import get_node_data_type, get_node_input, get_node_inputs
@@ -44,6 +45,62 @@ def build_graph(graph_attrs, meta_data, nodes, edges):
     return graph
 
 
+def copy_subgraph(graph: Graph, input_nodes, output_nodes):
+    """ Copy the part of the Graph between input and output nodes.
+     Copied are the nodes from which output nodes are reachable without passing through input nodes
+     and the direct producers of input nodes, so that data types of their inputs are known.
+     Constant values are not copied, the subgraph shares them with the source graph as read-only arrays.
+     :param graph: source graph
+     :param input_nodes: list of nodes where the subgraph starts
+     :param output_nodes: list of nodes where the subgraph ends
+     :return: generated graph.
+    """
+    input_ids = {node.id for node in input_nodes}
+    node_ids = set()
+    to_see = [node.id for node in output_nodes]
+    while to_see:
+        node_id = to_see.pop()
+        if node_id in node_ids:
+            continue
+        node_ids.add(node_id)
+        if node_id not in input_ids:
+            to_see.extend(graph.predecessors(node_id))
+
+    for input_id in input_ids:
+        node_ids.add(input_id)
+        node_ids.update(graph.successors(input_id))
+        for data_id in graph.predecessors(input_id):
+            node_ids.add(data_id)
+            node_ids.update(graph.predecessors(data_id))
+    for node in output_nodes:
+        node_ids.update(graph.successors(node.id))
+
+    # Nodes keep the order of the source graph, so the subgraph is serialized deterministically
+    node_ids = [node_id for node_id in graph.nodes() if node_id in node_ids]
+    subgraph = Graph()
+    # References to the source graph (e.g. from nodes of inner bodies) are redirected to the subgraph
+    memo = {id(graph): subgraph}
+    for node_id in node_ids:
+        value = graph.nodes[node_id].get('value')
+        if type(value) is np.ndarray and id(value) not in memo:  # pylint: disable=C0123
+            shared_value = value.view()
+            shared_value.flags.writeable = False
+            memo[id(value)] = shared_value
+
+    subgraph.graph = deepcopy(graph.graph, memo)
+    subgraph.stage = graph.stage
+    subgraph.strict_mode = graph.strict_mode
+    if hasattr(graph, 'meta_data'):
+        subgraph.meta_data = deepcopy(graph.meta_data, memo)
+    subgraph.add_nodes_from((node_id, deepcopy(graph.nodes[node_id], memo)) for node_id in node_ids)
+    node_ids = set(node_ids)
+    subgraph.add_edges_from((src, dst, key, deepcopy(attrs, memo))
+                            for dst in subgraph.nodes()
+                            for src, _, key, attrs in graph.in_edges(dst, keys=True, data=True)
+                            if src in node_ids)
+    return subgraph
+
+
 def make_copy_fake_quantize(nodes, edges, fq):
     weights, input_low, input_height, output_low, output_height = get_node_inputs(fq)
 
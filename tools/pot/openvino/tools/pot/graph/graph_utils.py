@@ -1,9 +1,11 @@
 # Copyright (C) 2020-2022 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
+import io
 import os
 import tempfile
 from copy import deepcopy
+import numpy as np
 from openvino.tools.mo.graph.graph import Graph
 from openvino.tools.mo.middle.pattern_match import for_graph_and_each_sub_graph_recursively
 from openvino.tools.mo.utils.ir_reader.restore_graph import restore_graph_from_ir, save_restored_graph
@@ -88,6 +90,21 @@ def save_graph(graph: Graph, save_path, model_name=None):
                         name=model_name)
 
 
+def serialize_graph(graph: Graph, model_name=None):
+    """ Serialize model as IR into memory
+    :param graph: NetworkX model to serialize
+    :param model_name: name of the serialized model
+    :return tuple of IR xml as bytes and weights as uint8 numpy array
+     """
+    graph_copy = deepcopy(graph)
+    add_removed_converts(graph_copy)
+    xml_stream, bin_stream = io.BytesIO(), io.BytesIO()
+    save_restored_graph(graph=graph_copy, path=None, meta_data=graph.meta_data, name=model_name,
+                        xml_stream=xml_stream, bin_stream=bin_stream)
+    # Weights are not copied, the array keeps the stream buffer alive
+    return xml_stream.getvalue(), np.frombuffer(bin_stream.getbuffer(), dtype=np.uint8)
+
+
 def model_preprocessing(model):
     ModelPreprocessor().find_and_replace_pattern(model)
     model.clean_up()
@@ -35,6 +35,19 @@ def save_model(model: CompressedModel, save_path, model_name=None, for_stat_coll
     return model_paths
 
 
+def serialize_model(model: CompressedModel, for_stat_collection=False):
+    """ Serialize model as IR into memory without writing files
+    :param model: CompressedModel instance to serialize
+    :param for_stat_collection: whether model is serialized to be used
+    for statistic collection or for normal inference (affects only cascaded models)
+    :return models: list of dictionaries:
+    'name': model name (for cascade models only)
+    'model': IR xml as bytes
+    'weights': IR weights as uint8 numpy array
+    """
+    return model.serialize(for_stat_collection=for_stat_collection)
+
+
 def add_outputs(models, node_names):
     """ Applies add_outputs to each model in models
     param models: list of dictionaries
@@ -121,6 +134,22 @@ def build_model_for_node(nx_model, input_name, input_shape, node, remove_bias=Fa
     return CompressedModel(graph=op_graph, target_device=target_device)
 
 
+def extract_subgraph(model: CompressedModel, input_names, output_names):
+    """ Extract the part of CompressedModel between input and output nodes.
+    Only nodes of the subgraph are copied, constant values are shared with the source model.
+    :param model: CompressedModel model, cascade models are not supported
+    :param input_names: names of the nodes where the subgraph starts
+    :param output_names: names of the nodes where the subgraph ends
+    :return: generated CompressedModel instance.
+    """
+    if model.is_cascade:
+        raise RuntimeError('Subgraph extraction is not supported for cascade models')
+    input_nodes = [get_node_by_name(model, name) for name in input_names]
+    output_nodes = [get_node_by_name(model, name) for name in output_names]
+    graph = gb.copy_subgraph(model.models[0]['model'], input_nodes, output_nodes)
+    return CompressedModel(graph=graph)
+
+
 def models_union(first_model, second_model):
     """ Return the union of CompressedModel models
     :return CompressedModel instance - union of first_model and second_model
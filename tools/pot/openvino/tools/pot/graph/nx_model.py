@@ -7,7 +7,7 @@ from addict import Dict
 import networkx as nx
 from openvino.tools.mo.graph.graph import rename_node
 
-from openvino.tools.pot.graph.graph_utils import load_graph, save_graph
+from openvino.tools.pot.graph.graph_utils import load_graph, save_graph, serialize_graph
 from openvino.tools.pot.graph import editor as ge
 from openvino.tools.pot.graph.utils import is_ignored, preprocess_ignored_params
 from openvino.tools.pot.utils.logger import get_logger, stdout_redirect
@@ -119,6 +119,29 @@ class CompressedModel:
 
         return model_paths
 
+    def serialize(self, for_stat_collection=False):
+        """ Serialize model as IR into memory, see save() for the meaning of parameters
+        :return models: list of dictionaries:
+        'name': model name (for cascade models only)
+        'model': IR xml as bytes
+        'weights': IR weights as uint8 numpy array
+         """
+        if not for_stat_collection:
+            self._remove_models_prefix()
+        models = []
+        for model_dict in self._models:
+            model = {}
+            if self._is_cascade:
+                model['name'] = model_dict['name']
+            model['model'], model['weights'] = stdout_redirect(serialize_graph, model_dict['model'],
+                                                                model_dict['model'].name)
+            models.append(model)
+
+        if not for_stat_collection:
+            self._restore_models_prefix()
+
+        return models
+
     def pseudo_topological_sort(self):
         return [node for model_dict in self._models
                 for node in model_dict['model'].pseudo_topological_sort()]
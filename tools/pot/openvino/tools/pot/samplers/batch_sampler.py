@@ -14,6 +14,16 @@ class BatchSampler(Sampler):
     def __len__(self):
         return self.num_samples
 
+    def batch_indices(self):
+        """ Yields dataset indices of the samples of every batch in the order of iteration """
+        indices = list(self._subset_indices)
+        for start in range(0, len(indices), self.batch_size):
+            yield tuple(indices[start:start + self.batch_size])
+
+    def load_batch(self, indices):
+        """ Returns data of the samples with the dataset indices """
+        return [self._data_loader[idx] for idx in indices]
+
     def __iter__(self):
         batch = []
         for idx in self._subset_indices:
@@ -0,0 +1,183 @@
+# Copyright (C) 2020-2022 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import pickle
+import shutil
+import threading
+from hashlib import sha256
+from time import time
+
+import numpy as np
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+INFER_TIME_FILE = 'infer_time.npy'
+BATCH_FILE = 'batch.pkl'
+
+
+class ActivationCache:
+    """ On-disk cache of model outputs computed during statistics collection.
+    Every output is stored as a .npy file keyed by (model fingerprint, output name, sample indices)
+    and is read back memory-mapped. The fingerprint is taken from the model without statistic outputs,
+    so passes collecting different statistics of the same model share outputs of the same layers.
+    Outputs of operations inserted to compute statistics are stored under names with the signature
+    of the statistic, so they are shared only by the same statistics,
+    and a batch is not inferred if all the outputs it needs are cached. Annotations and meta data
+    of the batch are stored along with the outputs, so that the batch is not loaded from the dataset either.
+    When the total size of the cache exceeds the budget, least recently used entries are removed.
+    The fingerprint also includes identity of the dataset, so entries computed on other data or with
+    other preprocessing are not read.
+    """
+
+    def __init__(self, cache_dir, max_size_mb=1024):
+        """ Constructor
+        :param cache_dir: directory to store activations in
+        :param max_size_mb: size budget of the cache in megabytes
+        """
+        self.cache_dir = cache_dir
+        self.max_size = int(max_size_mb * 1024 ** 2)
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._entries = self._scan()
+        self.reset_counters()
+
+    def reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+        self.time_saved = 0.
+
+    @staticmethod
+    def fingerprint(*buffers):
+        """ Returns fingerprint of the model from its serialized representation """
+        model_hash = sha256()
+        for buffer in buffers:
+            model_hash.update(buffer)
+        return model_hash.hexdigest()
+
+    def get(self, fingerprint, output_names, sample_indices):
+        """ Reads outputs of the model and data of the batch for the samples
+        :param fingerprint: model fingerprint
+        :param output_names: list of names of every output to read [[output_name]],
+        an output is read from the entry stored under any of its names
+        :param sample_indices: dataset indices of the samples in the batch
+        :return tuple of dictionary of memory-mapped outputs {first output name: value}
+        and batch data passed to put(), or None if some of the outputs are not cached
+        """
+        entry_dir = self._entry_dir(fingerprint, sample_indices)
+        start_time = time()
+        try:
+            outputs = {names[0]: self._load_output(entry_dir, names) for names in output_names}
+            with open(os.path.join(entry_dir, BATCH_FILE), 'rb') as file:
+                batch = pickle.load(file)
+            infer_time = float(np.load(os.path.join(entry_dir, INFER_TIME_FILE)))
+            os.utime(entry_dir)
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+            self.time_saved += max(infer_time - (time() - start_time), 0.)
+            if entry_dir in self._entries:
+                self._entries[entry_dir][0] = time()
+        return outputs, batch
+
+    def put(self, fingerprint, outputs, sample_indices, infer_time, batch=None):
+        """ Stores outputs of the model for the samples, outputs which are already stored are kept
+        :param fingerprint: model fingerprint
+        :param outputs: dictionary of outputs {output_name: value}
+        :param sample_indices: dataset indices of the samples in the batch
+        :param infer_time: time of the inference which produced the outputs
+        :param batch: data of the batch returned by get() along with the outputs,
+        the batch is not cached if the data cannot be pickled
+        """
+        entry_dir = self._entry_dir(fingerprint, sample_indices)
+        size = 0
+        try:
+            os.makedirs(entry_dir, exist_ok=True)
+            # The batch data is stored first, so nothing is left in the entry if it cannot be pickled
+            size += self._save(os.path.join(entry_dir, BATCH_FILE), batch,
+                               lambda file, value: pickle.dump(value, file))
+            for name, value in outputs.items():
+                size += self._save(os.path.join(entry_dir, self._file_name(name)), value, np.save)
+            size += self._save(os.path.join(entry_dir, INFER_TIME_FILE), np.array(infer_time), np.save)
+        except Exception as error:  # pylint: disable=broad-except
+            # put() is called from completion callbacks of infer requests, so errors are not raised
+            logger.warning('Activations cannot be stored in cache directory %s: %s', self.cache_dir, error)
+            return
+
+        with self._lock:
+            entry = self._entries.setdefault(entry_dir, [time(), 0])
+            entry[0] = time()
+            entry[1] += size
+            self._evict()
+
+    def summary(self):
+        """ Returns a string with hit rate of the cache and inference time saved by it """
+        lookups = self.hits + self.misses
+        hit_rate = 100. * self.hits / lookups if lookups else 0.
+        return 'Activation cache: {} hits of {} lookups ({:.1f}%), about {:.2f}s of inference saved'.format(
+            self.hits, lookups, hit_rate, self.time_saved)
+
+    @staticmethod
+    def _save(path, value, dump):
+        """ Saves the value with dump(file, value) unless it is already stored, returns the number of bytes written """
+        if os.path.exists(path):
+            return 0
+        # The file is written under a temporary name and renamed, so readers never see partial files
+        tmp_path = '{}.{}.{}.tmp'.format(path, os.getpid(), threading.get_ident())
+        try:
+            with open(tmp_path, 'wb') as file:
+                dump(file, value)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, path)
+        return os.path.getsize(path)
+
+    def _load_output(self, entry_dir, names):
+        for name in names:
+            path = os.path.join(entry_dir, self._file_name(name))
+            if os.path.exists(path):
+                return np.load(path, mmap_mode='r')
+        raise FileNotFoundError('Output {} is not cached in {}'.format(names[0], entry_dir))
+
+    def _evict(self):
+        total_size = sum(size for _, size in self._entries.values())
+        if total_size <= self.max_size:
+            return
+        # The most recently used entry is always kept
+        for entry_dir, (_, size) in sorted(self._entries.items(), key=lambda item: item[1][0])[:-1]:
+            if total_size <= self.max_size:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            del self._entries[entry_dir]
+            total_size -= size
+
+    def _scan(self):
+        entries = {}
+        for fingerprint in os.listdir(self.cache_dir):
+            fingerprint_dir = os.path.join(self.cache_dir, fingerprint)
+            if not os.path.isdir(fingerprint_dir):
+                continue
+            for sample_key in os.listdir(fingerprint_dir):
+                entry_dir = os.path.join(fingerprint_dir, sample_key)
+                if not os.path.isdir(entry_dir):
+                    continue
+                files = [os.path.join(entry_dir, name) for name in os.listdir(entry_dir)]
+                entries[entry_dir] = [os.path.getmtime(entry_dir),
+                                      sum(os.path.getsize(path) for path in files if not path.endswith('.tmp'))]
+        return entries
+
+    def _entry_dir(self, fingerprint, sample_indices):
+        sample_key = sha256(repr(tuple(int(idx) for idx in sample_indices)).encode('utf-8')).hexdigest()[:32]
+        return os.path.join(self.cache_dir, fingerprint, sample_key)
+
+    @staticmethod
+    def _file_name(output_name):
+        return sha256(output_name.encode('utf-8')).hexdigest()[:32] + '.npy'
@@ -3,6 +3,7 @@
 
 from copy import copy
 
+from .functions.aggregation import StatisticAccumulator
 from .utils import merge_algos_by_samplers, merge_stats_by_algo_names
 from ..samplers.sampler import Sampler
 from ..utils.logger import get_logger
@@ -58,6 +59,10 @@ class StatisticsCollector:
             return
 
         self._engine.set_model(model)
+        # Engines which do not call Engine.__init__ have no activation cache
+        activation_cache = getattr(self._engine, 'activation_cache', None)
+        if activation_cache is not None:
+            activation_cache.reset_counters()
 
         predict_iterations = merge_algos_by_samplers(self._samplers)
 
@@ -80,6 +85,9 @@ class StatisticsCollector:
 
             logger.update_progress(len(sampler))
 
+        if activation_cache is not None:
+            logger.info(activation_cache.summary())
+
     def get_statistics_for_algorithm(self, algo_name):
         """
         Return dict with statistics accordingly with statistics_layout for defined algorithm
@@ -113,7 +121,10 @@ class StatisticsCollector:
             if node_name in accumulated_stats:
                 for stats_name, value in stats[node_name].items():
                     if stats_name in accumulated_stats[node_name]:
-                        accumulated_stats[layer_name][stats_name].extend(value)
+                        if isinstance(value, StatisticAccumulator):
+                            accumulated_stats[layer_name][stats_name].merge(value)
+                        else:
+                            accumulated_stats[layer_name][stats_name].extend(value)
                     else:
                         accumulated_stats[layer_name][stats_name] = value
             else:
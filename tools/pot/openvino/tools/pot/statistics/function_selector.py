@@ -11,6 +11,7 @@ PERCHANNEL = 'perchannel'
 PERTENSOR = 'pertensor'
 
 AGGREGATION_FN = Registry('AggregationFunctions')
+AGGREGATION_ACCUMULATORS = Registry('AggregationAccumulators')
 
 ACTIVATIONS_STATS_FN = Dict(
     {'compute_statistic': {
@@ -29,6 +30,10 @@ def get_aggregation_function(name):
     return AGGREGATION_FN.get(name)
 
 
+def get_aggregation_accumulator(name):
+    return AGGREGATION_ACCUMULATORS.get(name)
+
+
 def get_stats_function_for_activations(name, granularity, inplace_statistics):
     return ACTIVATIONS_STATS_FN[inplace_statistics][granularity].get(name)
 
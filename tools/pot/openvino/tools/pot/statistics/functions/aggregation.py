@@ -4,6 +4,8 @@
 import numpy as np
 
 from ..function_selector import AGGREGATION_FN as aggregator
+from ..function_selector import AGGREGATION_ACCUMULATORS as accumulator
+from ..function_selector import get_aggregation_function
 
 @aggregator.register()
 def batch_mean(x):
@@ -42,23 +44,92 @@ def median_no_outliers(x):
 
 @aggregator.register('hl_estimator')
 def hodges_lehmann_mean(x):
-    """ Outlier-robust mean estimator
+    """ Outlier-robust mean estimator: a half of the median of pairwise sums
+    of distinct samples, computed per channel for 3D input
     """
-
-    def hl_functor(x):
-        m = np.add.outer(x, x)
-        ind = np.tril_indices(len(x), -1)
-        return 0.5 * np.median(m[ind])
-
     x = np.array(x)
     if len(x.shape) == 3:
-        result = np.zeros(x.shape[2], x.dtype)
-        for i in range(x.shape[2]):
-            x_ch = x[:, :, i].flatten()
-            result[i] = hl_functor(x_ch)
-    else:
-        result = hl_functor(x.flatten())
-    return result
+        channels = np.moveaxis(x, 2, 0).reshape(x.shape[2], -1)
+        return (0.5 * median_of_pairwise_sums(channels)).astype(x.dtype)
+    result = 0.5 * median_of_pairwise_sums(x.reshape(1, -1))[0]
+    return x.dtype.type(result) if np.issubdtype(x.dtype, np.floating) else result
+
+
+def median_of_pairwise_sums(x, weights=None):
+    """ Calculates median of x_i + x_j, i < j, for every row of x without building all the sums.
+    The lower middle sum is found by bisection over values, every step counts the sums not greater
+    than a value in O(n log n) for all rows at once. The search stops when the interval is below
+    float64 resolution at the scale of the largest sum and the result is snapped to the largest sum
+    within the interval, so it is exact unless the sums differ by less than this resolution
+    :param x: 2D array with samples of one channel in every row
+    :param weights: number of occurrences of every sample, rows of x should be sorted if it is set
+    and can be padded with inf samples of zero weight
+    :return array with median of pairwise sums for every row
+    """
+    if weights is None:
+        x = np.sort(x.astype(np.float64), axis=1)
+        weights = np.ones(x.shape, np.int64)
+    num_samples = np.sum(weights, axis=1)
+    num_sums = num_samples * (num_samples - 1) // 2
+    if np.any(num_sums == 0):
+        return np.full(x.shape[0], np.nan)
+
+    k = (num_sums - 1) // 2
+    # a sample is paired with itself if it occurs more than once
+    last = np.sum(weights > 0, axis=1, keepdims=True) - 1
+    first_pair = np.where(weights[:, 0] > 1, x[:, 0], x[:, min(1, x.shape[1] - 1)])
+    last_pair = np.where(np.take_along_axis(weights, last, axis=1) > 1, np.take_along_axis(x, last, axis=1),
+                         np.take_along_axis(x, np.maximum(last - 1, 0), axis=1))[:, 0]
+    low, high = x[:, 0] + first_pair, np.take_along_axis(x, last, axis=1)[:, 0] + last_pair
+    resolution = np.finfo(np.float64).eps * np.maximum(np.abs(low), np.abs(high))
+    for _ in range(100):
+        if np.all(high - low <= resolution):
+            break
+        middle = 0.5 * (low + high)
+        enough = _pairwise_sums_around(x, middle, weights)[0] > k
+        high = np.where(enough, middle, high)
+        low = np.where(enough, low, middle)
+
+    num_not_greater, lower_median, next_sum = _pairwise_sums_around(x, high, weights)
+    upper_median = np.where(num_not_greater > k + 1, lower_median, next_sum)
+    return np.where(num_sums % 2, lower_median, 0.5 * (lower_median + upper_median))
+
+
+def _pairwise_sums_around(x, value, weights):
+    """ For every row of sorted x returns the number of sums x_i + x_j, i < j, not greater than value,
+    the largest of these sums and the smallest sum greater than value
+    """
+    positions = np.arange(x.shape[1])
+    # number and total weight of samples not greater than value - x_i, queries are passed in ascending order
+    queries = value[:, None] - x[:, ::-1]
+    counts = _count_not_greater(x, queries)[:, ::-1]
+    weighted_counts = _count_not_greater(x, queries, weights)[:, ::-1]
+    num_sums = (np.sum(weights * weighted_counts, axis=1) -
+                np.sum(np.where(2 * x <= value[:, None], weights, 0), axis=1)) // 2
+
+    # x_i is paired with the closest x_j on either side of value - x_i, j != i unless x_i occurs more than once
+    single = weights == 1
+    lower_index = np.where((counts - 1 == positions) & single, counts - 2, counts - 1)
+    upper_index = np.where((counts == positions) & single, counts + 1, counts)
+    lower_sums = x + np.take_along_axis(x, np.clip(lower_index, 0, x.shape[1] - 1), axis=1)
+    upper_sums = x + np.take_along_axis(x, np.clip(upper_index, 0, x.shape[1] - 1), axis=1)
+    largest = np.max(np.where((lower_index >= 0) & (weights > 0), lower_sums, -np.inf), axis=1)
+    smallest = np.min(np.where(upper_index < x.shape[1], upper_sums, np.inf), axis=1)
+    return num_sums, largest, smallest
+
+
+def _count_not_greater(x, queries, weights=None):
+    """ For every query returns the number (or the total weight) of elements not greater than it
+    in the same row of x. Both x and queries should be sorted in every row,
+    then their stable merge gives the counts
+    """
+    order = np.argsort(np.concatenate([x, queries], axis=1), axis=1, kind='stable')
+    is_query = order >= x.shape[1]
+    if weights is None:
+        return np.cumsum(~is_query, axis=1)[is_query].reshape(queries.shape)
+    merged_weights = np.take_along_axis(np.concatenate([weights, np.zeros(queries.shape, weights.dtype)], axis=1),
+                                        order, axis=1)
+    return np.cumsum(merged_weights, axis=1)[is_query].reshape(queries.shape)
 
 
 def no_outliers_estimator(base_estimator, x, alpha=0.01):
@@ -77,3 +148,238 @@ def no_outliers_estimator(base_estimator, x, alpha=0.01):
         x_ch = x_ch[(x_ch >= low_value[i]) & (x_ch <= high_value[i])]
         result[i] = base_estimator(x_ch)
     return result
+
+
+def _float_dtype(value):
+    return value.dtype if np.issubdtype(value.dtype, np.floating) else np.float64
+
+
+def aggregate_statistics(name, x):
+    """ Applies aggregation function to the collected statistics
+    :param name: name of the aggregation function
+    :param x: list of per-sample statistics or StatisticAccumulator instance
+    """
+    if isinstance(x, StatisticAccumulator):
+        return x.result(name)
+    return get_aggregation_function(name)(x)
+
+
+class StatisticAccumulator:
+    """ Streaming counterpart of an aggregation function. Per-sample statistics
+    are reduced as they arrive, so memory does not depend on the number of samples
+    """
+
+    # whether the result is estimated instead of being equal to the aggregation function one
+    approximate = False
+
+    def __init__(self, name, **_):
+        self.name = name
+
+    def update(self, value):
+        """ Accumulates statistic of one sample
+        :param value: statistic with batch as the first dimension
+        """
+        raise NotImplementedError
+
+    def merge(self, other):
+        """ Adds values accumulated by another accumulator of the same type """
+        raise NotImplementedError
+
+    def result(self, name=None):
+        """ Returns value of the aggregation function
+        :param name: name of the aggregation function, the one accumulator is created for by default
+        """
+        name = self.name if name is None else name
+        if name not in self.supported_aggregators():
+            raise RuntimeError('Statistics accumulated for {} aggregator cannot be aggregated by {}'
+                               .format(self.name, name))
+        return self._result(name)
+
+    def supported_aggregators(self):
+        return [self.name]
+
+    def _result(self, name):
+        raise NotImplementedError
+
+
+@accumulator.register('max')
+@accumulator.register('min')
+class ExtremumAccumulator(StatisticAccumulator):
+    def __init__(self, name, **kwargs):
+        super().__init__(name, **kwargs)
+        self._reduce = np.max if name == 'max' else np.min
+        self.value = None
+
+    def update(self, value):
+        value = self._reduce(value, axis=0)
+        self.value = value if self.value is None else self._reduce([self.value, value], axis=0)
+
+    def merge(self, other):
+        if other.value is not None:
+            self.update(np.expand_dims(other.value, 0))
+
+    def _result(self, name):
+        return self.value
+
+
+@accumulator.register('batch_mean')
+@accumulator.register('mean')
+class MeanAccumulator(StatisticAccumulator):
+    """ Keeps a float64 sum of per-sample values for batch_mean
+    and of per-sample means over batch for mean
+    """
+
+    def __init__(self, name, **kwargs):
+        super().__init__(name, **kwargs)
+        self.sum = None
+        self.count = 0
+        self.dtype = None
+
+    def update(self, value):
+        value = np.asarray(value)
+        self.dtype = _float_dtype(value)
+        value = np.mean(value, axis=0, dtype=np.float64) if self.name == 'mean' else value.astype(np.float64)
+        self.sum = value if self.sum is None else self.sum + value
+        self.count += 1
+
+    def merge(self, other):
+        if other.sum is not None:
+            self.sum = other.sum if self.sum is None else self.sum + other.sum
+            self.count += other.count
+            self.dtype = other.dtype
+
+    def _result(self, name):
+        value = (self.sum / self.count).astype(self.dtype)
+        return np.expand_dims(value, 0) if name == 'batch_mean' else value
+
+
+@accumulator.register('hl_estimator')
+@accumulator.register('median_no_outliers')
+@accumulator.register('mean_no_outliers')
+@accumulator.register('median')
+class QuantileSketch(StatisticAccumulator):
+    """ Mergeable per-channel sketch of the value distribution. Values are counted
+    in logarithmic buckets (gamma^(k-1), gamma^k] of both signs, which bounds the relative
+    error of the estimated quantiles by accuracy. Counts are kept only for the buckets hit
+    in every channel, so their number is bounded by both the dynamic range of a channel
+    and the number of its per-sample values
+    """
+
+    approximate = True
+
+    # separates indices of positive and negative buckets from the bucket of zeros
+    _INDEX_OFFSET = 1 << 20
+    # a (channel, bucket) pair is stored as channel * _CHANNEL_STRIDE + bucket index + _CHANNEL_STRIDE // 2
+    _CHANNEL_STRIDE = 1 << 32
+
+    def __init__(self, name, accuracy=0.01, **kwargs):
+        super().__init__(name, **kwargs)
+        self.accuracy = accuracy
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.cells = np.zeros(0, np.int64)
+        self.counts = np.zeros(0, np.int64)
+        self.count = 0
+        self.min = None
+        self.max = None
+        self.channel_shape = None
+        self.dtype = None
+
+    def supported_aggregators(self):
+        return ['median', 'mean_no_outliers', 'median_no_outliers', 'hl_estimator']
+
+    def update(self, value):
+        value = np.atleast_1d(value)
+        self.channel_shape = value.shape[1:]
+        self.dtype = _float_dtype(value)
+        value = value.reshape(value.shape[0], -1).astype(np.float64)
+        magnitude = np.abs(value)
+        index = np.zeros(value.shape, np.int64)
+        nonzero = magnitude > 0
+        index[nonzero] = np.ceil(np.log(magnitude[nonzero]) / np.log(self.gamma)) + self._INDEX_OFFSET
+        index[value < 0] *= -1
+
+        channels = np.arange(value.shape[1], dtype=np.int64)
+        cells, counts = np.unique(channels * self._CHANNEL_STRIDE + self._CHANNEL_STRIDE // 2 + index,
+                                  return_counts=True)
+        self._add_counts(cells, counts, value.shape[0], np.min(value, axis=0), np.max(value, axis=0))
+
+    def merge(self, other):
+        if other.count:
+            if self.gamma != other.gamma:
+                raise RuntimeError('Sketches with different accuracy cannot be merged')
+            self.channel_shape, self.dtype = other.channel_shape, other.dtype
+            self._add_counts(other.cells, other.counts, other.count, other.min, other.max)
+
+    def _add_counts(self, cells, counts, count, min_value, max_value):
+        self.cells, inverse = np.unique(np.concatenate([self.cells, cells]), return_inverse=True)
+        self.counts = np.bincount(inverse, weights=np.concatenate([self.counts, counts])).astype(np.int64)
+        self.count += count
+        self.min = min_value if self.min is None else np.minimum(self.min, min_value)
+        self.max = max_value if self.max is None else np.maximum(self.max, max_value)
+
+    def _bucket_values(self):
+        """ Returns representative values of buckets sorted along the first axis
+        and their counts per channel, values are clipped to the observed range of a channel.
+        Channels with fewer buckets are padded with inf values of zero count
+        """
+        channels = self.cells // self._CHANNEL_STRIDE
+        keys = self.cells % self._CHANNEL_STRIDE - self._CHANNEL_STRIDE // 2
+        exponent = np.abs(keys) - self._INDEX_OFFSET
+        values = np.sign(keys) * 2 * self.gamma ** exponent.astype(np.float64) / (self.gamma + 1)
+        values = np.clip(values, self.min[channels], self.max[channels])
+
+        # cells are sorted by channel, then by value
+        num_buckets = np.bincount(channels, minlength=len(self.min))
+        positions = np.arange(len(self.cells)) - np.repeat(np.cumsum(num_buckets) - num_buckets, num_buckets)
+        padded_values = np.full((np.max(num_buckets), len(self.min)), np.inf)
+        padded_counts = np.zeros(padded_values.shape, np.int64)
+        padded_values[positions, channels] = values
+        padded_counts[positions, channels] = self.counts
+        return padded_values, padded_counts
+
+    def _result(self, name):
+        values, counts = self._bucket_values()
+        if name == 'median':
+            result = _weighted_quantile(values, counts, 0.5)
+        elif name == 'hl_estimator':
+            result = 0.5 * median_of_pairwise_sums(values.T, counts.T)
+        else:
+            result = self._no_outliers(values, counts, np.mean if name == 'mean_no_outliers' else np.median)
+
+        if name == 'mean_no_outliers' or name == 'median_no_outliers':
+            shape = self.channel_shape if self.channel_shape else (1,)
+        else:
+            shape = self.channel_shape
+        return result.reshape(shape).astype(self.dtype)
+
+    @staticmethod
+    def _no_outliers(values, counts, base_estimator, alpha=0.01):
+        """ Sketch version of no_outliers_estimator """
+        low_value = _weighted_quantile(values, counts, alpha)
+        high_value = _weighted_quantile(values, counts, 1 - alpha)
+        inliers = (values >= low_value) & (values <= high_value)
+        inliers_counts = np.where(inliers, counts, 0)
+        if base_estimator is np.mean:
+            total = np.sum(inliers_counts, axis=0)
+            return np.sum(np.where(inliers, values, 0.) * inliers_counts, axis=0) / np.maximum(total, 1)
+        return _weighted_quantile(values, inliers_counts, 0.5)
+
+
+def _weighted_quantile(values, counts, q):
+    """ Quantile of values repeated counts times with the same interpolation as np.quantile
+    :param values: values sorted along the first axis, one column per channel
+    :param counts: number of occurrences of values
+    :param q: quantile to compute
+    :return quantile per channel
+    """
+    cumulative = np.cumsum(counts, axis=0)
+    rank = q * np.maximum(cumulative[-1] - 1, 0)
+
+    def value_at(position):
+        index = np.minimum(np.sum(cumulative <= position, axis=0), len(values) - 1)
+        return np.take_along_axis(values, index[None], axis=0)[0]
+
+    lower = np.floor(rank)
+    fraction = rank - lower
+    return value_at(lower) * (1 - fraction) + value_at(np.ceil(rank)) * fraction
+
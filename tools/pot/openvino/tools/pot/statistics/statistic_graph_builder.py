@@ -72,7 +72,9 @@ class StatisticGraphBuilder:
                                                    inplace_statistics=False,
                                                    granularity=stat.kwargs.get('granularity'),
                                                    type=type_stat,
-                                                   layer_stat_name=op_name)
+                                                   layer_stat_name=op_name,
+                                                   aggregator=stat.aggregator,
+                                                   sketch_accuracy=stat.sketch_accuracy)
                     else:
                         new_stat = deepcopy(stat)
                         new_stat.kwargs['layer_stat_name'] = op_name
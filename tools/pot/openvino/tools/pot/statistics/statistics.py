@@ -3,14 +3,27 @@
 
 from functools import partial
 
+from .function_selector import get_aggregation_accumulator
 from .functions import activations as asf
 
 
 class Statistic:
-    def __init__(self, func, *argv, **kwargs):
+    def __init__(self, func, *argv, aggregator=None, sketch_accuracy=None, **kwargs):
+        """
+        :param aggregator: name of the aggregation function to apply to the statistic on the fly.
+         Per-sample values are kept if it is not set
+        :param sketch_accuracy: relative accuracy of the sketch used by approximate aggregators
+        """
         self.func = func
         self.argv = argv
         self.kwargs = kwargs
+        self.aggregator = aggregator
+        self.sketch_accuracy = sketch_accuracy
+
+    def create_accumulator(self):
+        if self.aggregator is None:
+            return None
+        return get_aggregation_accumulator(self.aggregator)(self.aggregator, accuracy=self.sketch_accuracy)
 
     def compute(self, *input_tensor, **kwargs):
         pass
@@ -18,7 +31,8 @@ class Statistic:
     def __eq__(self, other):
         if isinstance(other, Statistic):
             return self.func == other.func and self.argv == other.argv \
-                   and self.kwargs == other.kwargs
+                   and self.kwargs == other.kwargs and self.aggregator == other.aggregator \
+                   and self.sketch_accuracy == other.sketch_accuracy
         return False
 
     def __ne__(self, other):
@@ -28,7 +42,7 @@ class Statistic:
         return self.compute(*argv, **kwargs)
 
     def __hash__(self):
-        data = (self.func, frozenset(self.argv), frozenset(self.kwargs))
+        data = (self.func, frozenset(self.argv), frozenset(self.kwargs), self.aggregator, self.sketch_accuracy)
         if isinstance(self.func, partial):
             data = (*data, frozenset(self.func.keywords))
         return hash(data)
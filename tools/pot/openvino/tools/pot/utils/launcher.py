@@ -1,10 +1,12 @@
 # Copyright (C) 2020-2022 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 
-from openvino.runtime import Core, PartialShape  # pylint: disable=E0611,E0401
+from collections import OrderedDict
+from hashlib import sha256
 
-from ..utils.utils import create_tmp_dir
-from ..graph.model_utils import save_model
+from openvino.runtime import Core, PartialShape, Tensor  # pylint: disable=E0611,E0401
+
+from ..graph.model_utils import serialize_model
 from ..graph.node_utils import convert_to_outputs_name
 from ..engines.utils import cast_friendly_names, process_raw_output
 
@@ -12,15 +14,20 @@ from ..engines.utils import cast_friendly_names, process_raw_output
 class IELauncher:
     """ Inference Engine Launcher for model inference """
 
-    def __init__(self, device='CPU'):
+    def __init__(self, device='CPU', cache_size=0):
         """ Constructor
          :param device: specify the target device to infer on; CPU, GPU or HETERO: is acceptable
          :param extension: path to the extension library with custom layers
+         :param cache_size: number of compiled models kept to be reused when a model with
+         the same topology, weights and input shapes is set again; 0 disables the cache
         """
-        self._tmp_dir = create_tmp_dir()
         self.device = device
         self.model = None
         self.infer_request = None
+        self.cache_hits = 0
+
+        self._cache_size = cache_size
+        self._compiled_models = OrderedDict()
 
         self._ie = Core()
         self._ie.set_property({"ENABLE_MMAP": "NO"})
@@ -32,10 +39,18 @@ class IELauncher:
         if model.is_cascade:
             raise Exception('Cascade models are not supported in current launcher')
 
-        # save model in IR
-        path = save_model(model, self._tmp_dir.name, 'tmp_model')[0]
-        # load IR model
-        ir_model = self._load_model(path)
+        # serialize model to IR in memory and load it
+        model_dict = serialize_model(model)[0]
+        cache_key = None
+        if self._cache_size:
+            cache_key = self._get_cache_key(model_dict, output_names, md_shapes)
+            if cache_key in self._compiled_models:
+                self._compiled_models.move_to_end(cache_key)
+                self.model, self.infer_request = self._compiled_models[cache_key]
+                self.cache_hits += 1
+                return
+
+        ir_model = self._load_model(model_dict)
 
         cast_friendly_names(ir_model.inputs + ir_model.outputs)
 
@@ -53,6 +68,11 @@ class IELauncher:
 
         self.infer_request = self.model.create_infer_request()
 
+        if cache_key is not None:
+            self._compiled_models[cache_key] = (self.model, self.infer_request)
+            if len(self._compiled_models) > self._cache_size:
+                self._compiled_models.popitem(last=False)
+
     def infer(self, inputs):
         """ Inference model
          :param inputs: dictionary of inputs {node_name, value}
@@ -61,11 +81,19 @@ class IELauncher:
         outputs = self.infer_request.infer(inputs=inputs)
         return process_raw_output(outputs)
 
-    def _load_model(self, path):
-        """ Loads IT model from disk
-        :param path: dictionary:
-        'model': path to xml
-        'weights': path to bin
+    def _load_model(self, model_dict):
+        """ Loads IR model from memory
+        :param model_dict: dictionary:
+        'model': IR xml as bytes
+        'weights': IR weights as uint8 numpy array
         :return IE model instance
         """
-        return self._ie.read_model(model=path['model'], weights=path['weights'])
+        return self._ie.read_model(model=model_dict['model'], weights=Tensor(model_dict['weights']))
+
+    @staticmethod
+    def _get_cache_key(model_dict, output_names, md_shapes):
+        """ Returns key of the compiled model: hash of IR xml and weights, added outputs and input shapes """
+        ir_hash = sha256(model_dict['model'])
+        ir_hash.update(model_dict['weights'])
+        shapes = tuple(sorted(md_shapes.items())) if md_shapes is not None else None
+        return ir_hash.hexdigest(), repr(output_names), repr(shapes)
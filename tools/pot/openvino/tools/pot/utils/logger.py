@@ -3,6 +3,7 @@
 
 import logging
 import sys
+import threading
 from contextlib import redirect_stdout, redirect_stderr
 from io import StringIO
 
@@ -16,6 +17,8 @@ _is_logging_initialized = False
 _progress_bar = None
 _stream_output = False
 _bar_format = '{desc}{percentage:1.0f}%|{bar}|{elapsed}'
+# redirection of stdout and stderr is process-wide, so only one thread may hold it at a time
+_redirect_lock = threading.RLock()
 
 
 class RegularLogger(logging.Logger):
@@ -116,7 +119,7 @@ def get_logger(name):
 
 
 def stdout_redirect(fn, *args, **kwargs):
-    with StringIO() as log_str, redirect_stdout(log_str), redirect_stderr(log_str):
+    with _redirect_lock, StringIO() as log_str, redirect_stdout(log_str), redirect_stderr(log_str):
         res = fn(*args, **kwargs)
         if log_str.getvalue():
             get_logger('DEBUG').debug(log_str.getvalue())
@@ -0,0 +1,102 @@
+# Copyright (C) 2020-2022 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from addict import Dict
+
+from openvino.tools.pot.algorithms.quantization.accuracy_aware_common import algorithm as aa_algorithm
+from openvino.tools.pot.algorithms.quantization.accuracy_aware_common.algorithm import AccuracyAwareCommon
+from openvino.tools.pot.api.engine import Engine
+
+# pylint: disable=W0212
+
+FQ_NAMES = ['fq_{}'.format(i) for i in range(12)]
+
+
+class RankingEngine(Engine):
+    """ Engine which scores a model by the name of the removed FakeQuantize node.
+    Inference takes random time, so scores calculated in parallel finish out of order """
+
+    def __init__(self, cloneable=True):
+        super().__init__(Dict(), data_loader=list(range(10)))
+        self.cloneable = cloneable
+        self.clones = []
+        self.scored_models = []
+        self._model = None
+
+    @property
+    def supports_cloning(self):
+        return self.cloneable
+
+    def clone(self):
+        engine = RankingEngine(self.cloneable)
+        self.clones.append(engine)
+        return engine
+
+    def set_model(self, model):
+        self._model = model
+
+    def predict(self, stats_layout=None, sampler=None, stat_aliases=None,
+                metric_per_sample=False, print_progress=False):
+        time.sleep(random.uniform(0, 0.01))
+        self.scored_models.append(self._model['removed'])
+        return {'accuracy': (FQ_NAMES.index(self._model['removed']) * 7 % 5) / 10}, {}
+
+
+def create_algorithm(engine, ranking_parallelism):
+    # Only the attributes used for ranking are set
+    algorithm = AccuracyAwareCommon.__new__(AccuracyAwareCommon)
+    algorithm._engine = engine
+    algorithm._config = Dict({'ranking_parallelism': ranking_parallelism, 'ranking_subset_size': 3})
+    algorithm._ranking_engines = None
+    algorithm._metrics_config = {
+        'accuracy': Dict({'ranking': {'name': 'accuracy', 'comparator': lambda value: 1 - value}})}
+    algorithm._modify_model_in_scope = lambda model, nodes_names: (
+        {'removed': nodes_names[0]}, nodes_names, None)
+    return algorithm
+
+
+def calculate_scores(algorithm, excluded_nodes=None):
+    nodes = [SimpleNamespace(fullname=name) for name in FQ_NAMES]
+    with patch.object(aa_algorithm, 'get_nodes_by_type', return_value=nodes):
+        return algorithm._calculate_node_importance_scores({'removed': None}, [0, 1, 2], 'accuracy', excluded_nodes)
+
+
+@pytest.mark.parametrize('ranking_parallelism', [2, 4])
+def test_node_importance_scores_parallel(ranking_parallelism):
+    random.seed(0)
+    reference_engine = RankingEngine()
+    reference = calculate_scores(create_algorithm(reference_engine, 1))
+    assert not reference_engine.clones
+    assert reference_engine.scored_models == FQ_NAMES
+
+    engine = RankingEngine()
+    algorithm = create_algorithm(engine, ranking_parallelism)
+    scores = calculate_scores(algorithm)
+
+    assert list(scores.items()) == list(reference.items())
+    assert len(engine.clones) == ranking_parallelism
+    assert not engine.scored_models
+    assert sorted(name for clone in engine.clones for name in clone.scored_models) == sorted(FQ_NAMES)
+
+    # Clones are created once and reused by the next rankings
+    excluded_nodes = FQ_NAMES[:3]
+    scores = calculate_scores(algorithm, excluded_nodes)
+    assert len(engine.clones) == ranking_parallelism
+    assert list(scores.items()) == [(name, score) for name, score in reference.items() if name not in excluded_nodes]
+
+
+def test_node_importance_scores_not_cloneable_engine():
+    reference = calculate_scores(create_algorithm(RankingEngine(), 1))
+
+    engine = RankingEngine(cloneable=False)
+    scores = calculate_scores(create_algorithm(engine, 4))
+
+    assert list(scores.items()) == list(reference.items())
+    assert not engine.clones
+    assert engine.scored_models == FQ_NAMES
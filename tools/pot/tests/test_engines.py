@@ -5,10 +5,13 @@ from unittest.mock import Mock
 
 import numpy as np
 from addict import Dict
+from openvino.runtime import Core
 from openvino.tools.pot.engines.ac_engine import ACEngine
 from openvino.tools.pot.engines.ie_engine import IEEngine
-from openvino.tools.pot.engines.utils import append_stats
+from openvino.tools.pot.engines.utils import append_stats, process_accumulated_stats
+from openvino.tools.pot.graph import load_model, save_model
 from openvino.tools.pot.statistics.statistics import TensorStatistic
+from openvino.tools.pot.utils.launcher import IELauncher
 
 
 def test_ac_engine_append_stats():
@@ -22,6 +25,21 @@ def test_ie_engine_append_stats():
     run_append_stats_test(engine)
 
 
+def test_ie_engine_clone():
+    data_loader = [np.zeros((1, 3))]
+    metric = {'values': []}
+    engine = IEEngine(Dict({"device": "CPU"}), data_loader, metric)
+    assert engine.supports_cloning
+
+    clone = engine.clone()
+    # pylint: disable=W0212
+    assert clone is not engine
+    assert clone.config == engine.config
+    assert clone._data_loader is data_loader
+    assert clone._metric == metric and clone._metric is not metric
+    assert clone._ie is engine._ie
+
+
 def create_ng_mock(return_value=None):
     ng_const_out_mock = Mock()
     ng_tensor_desc_mock = Mock()
@@ -64,6 +82,20 @@ def run_append_stats_test(engine):
         )
 
 
+def test_ie_engine_append_stats_with_accumulator():
+    # pylint: disable=W0212
+    engine = IEEngine(Dict({"device": "CPU"}), None, None)
+    stat = TensorStatistic(lambda tensor: tensor, aggregator='max')
+    stats_layout = {'conv_layer': {stat: stat}}
+    conv_layer_mock = create_ng_mock(['conv_layer'])
+    samples = [np.random.uniform(0, 1, (2, 10)) for _ in range(3)]
+    for dataset_index, sample in enumerate(samples):
+        append_stats(engine._accumulated_layer_stats, stats_layout, {conv_layer_mock: sample}, dataset_index)
+
+    accumulated_stats = process_accumulated_stats(engine._accumulated_layer_stats)
+    assert np.array_equal(accumulated_stats['conv_layer'][stat].result(), np.max(samples, axis=(0, 1)))
+
+
 def _get_accuracy_checker_config():
     return Dict(
         {
@@ -75,3 +107,46 @@ def _get_accuracy_checker_config():
             ]
         }
     )
+
+
+def test_ie_engine_set_model_in_memory(tmp_path, models):
+    model_config = models.get('mobilenetv2_example', 'pytorch', tmp_path)
+    model = load_model(model_config.model_params)
+    engine = IEEngine(Dict({"device": "CPU"}), None, None)
+    engine.set_model(model)
+
+    paths = save_model(model, tmp_path.as_posix(), 'saved_model', for_stat_collection=True)[0]
+    saved_model = Core().read_model(model=paths['model'], weights=paths['weights'])
+    # pylint: disable=W0212
+    in_memory_ops = [(op.get_type_name(), op.friendly_name) for op in engine._model.get_ordered_ops()]
+    saved_ops = [(op.get_type_name(), op.friendly_name) for op in saved_model.get_ordered_ops()]
+    assert in_memory_ops == saved_ops
+
+    launcher = IELauncher()
+    launcher.set_model(model)
+    compiled_saved_model = Core().compile_model(saved_model, 'CPU')
+    input_shape = list(compiled_saved_model.inputs[0].shape)
+    data = np.random.uniform(0, 1, input_shape).astype(np.float32)
+    in_memory_result = list(launcher.infer({launcher.model.inputs[0]: data}).values())[0]
+    saved_result = compiled_saved_model([data])[compiled_saved_model.outputs[0]]
+    assert np.allclose(in_memory_result, saved_result)
+
+
+def test_ie_launcher_compiled_model_cache(tmp_path, models):
+    model_config = models.get('mobilenetv2_example', 'pytorch', tmp_path)
+    model = load_model(model_config.model_params)
+    launcher = IELauncher(cache_size=1)
+    launcher.set_model(model)
+    compiled_model = launcher.model
+    launcher.set_model(model)
+    assert launcher.model is compiled_model
+    assert launcher.cache_hits == 1
+
+    input_name = launcher.model.inputs[0].get_node().friendly_name
+    input_shape = list(launcher.model.inputs[0].shape)
+    input_shape[0] = 2
+    launcher.set_model(model, md_shapes={input_name: tuple(input_shape)})
+    assert list(launcher.model.inputs[0].shape) == input_shape
+    launcher.set_model(model)
+    assert launcher.model is not compiled_model
+    assert launcher.cache_hits == 1
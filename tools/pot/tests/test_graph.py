@@ -3,13 +3,14 @@
 
 from addict import Dict
 
+import numpy as np
 import pytest
 
 import openvino.tools.pot.graph.node_utils as nu
 from openvino.tools.pot.graph import load_model
 from openvino.tools.pot.configs.hardware_config import HardwareConfig
 from openvino.tools.pot.graph.transformer import GraphTransformer
-from openvino.tools.pot.graph.model_utils import get_nodes_by_type, get_node_by_name
+from openvino.tools.pot.graph.model_utils import get_nodes_by_type, get_node_by_name, extract_subgraph
 from openvino.tools.pot.graph.node_utils import get_node_inputs, get_first_convolutions
 from tests.utils.path import HARDWARE_CONFIG_PATH
 from tests.utils.check_graph import check_model
@@ -331,3 +332,21 @@ def test_first_convolutions_search(tmp_path, models, model_name, model_framework
     first_convs = get_first_convolutions(input_nodes)
     first_convs_names = [n.name for n in first_convs]
     assert sorted(first_convs_names) == sorted(first_convs_ref)
+
+
+def test_extract_subgraph(tmp_path, models):
+    model = models.get('mobilenetv2_example', 'pytorch', tmp_path)
+    model = load_model(model.model_params)
+    convolutions = [node for node in model.pseudo_topological_sort() if node.type == 'Convolution']
+    input_node, inner_node, output_node, next_node = convolutions[:4]
+
+    subgraph = extract_subgraph(model, [input_node.fullname], [output_node.fullname])
+    assert subgraph.number_of_nodes() < model.number_of_nodes()
+    for node in [input_node, inner_node, output_node]:
+        assert get_node_by_name(subgraph, node.fullname) is not None
+    assert get_node_by_name(subgraph, next_node.fullname) is None
+
+    weights = nu.get_weights_for_node(output_node)
+    weights_copy = nu.get_weights_for_node(get_node_by_name(subgraph, output_node.fullname))
+    assert np.shares_memory(nu.get_node_value(weights), nu.get_node_value(weights_copy))
+    assert not nu.get_node_value(weights_copy).flags.writeable
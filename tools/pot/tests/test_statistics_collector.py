@@ -12,7 +12,10 @@ from addict import Dict
 from openvino.tools.pot.graph import load_model
 from openvino.tools.pot.data_loaders.creator import create_data_loader
 from openvino.tools.pot.engines.creator import create_engine
+from openvino.tools.pot.engines.ie_engine import IEEngine
+from openvino.tools.pot.statistics.activation_cache import ActivationCache
 from openvino.tools.pot.statistics.collector import StatisticsCollector
+from openvino.tools.pot.statistics.statistics import TensorStatistic
 from openvino.tools.pot.algorithms.quantization.minmax.algorithm import MinMaxQuantization
 from openvino.tools.pot.algorithms.quantization.bias_correction.algorithm import BiasCorrection
 from .utils.config import PATHS2DATASETS_CONFIG
@@ -86,3 +89,129 @@ def test_statistics_collector_subsets(tmp_path, models, model_name, model_framew
                 ref_stats_vals = refs[algo_name][node_name][stats_name]
                 for ref_vals, vals in zip(ref_stats_vals, stats_val):
                     assert np.max(np.abs(np.array(ref_vals) - vals)) < eps
+
+
+def test_statistics_collector_activation_cache(tmp_path, models):
+    with open(PATHS2DATASETS_CONFIG.as_posix()) as f:
+        data_source = Dict(json.load(f))['ImageNet2012'].pop('source_dir')
+
+    engine_config = Dict({'type': 'simplified',
+                          'data_source': '{}/{}'.format(data_source, 'ILSVRC2012_val*'),
+                          'device': 'CPU',
+                          'activation_cache_dir': (tmp_path / 'activation_cache').as_posix()})
+    minmax_config = Dict({
+        'target_device': 'CPU',
+        'preset': 'performance',
+        'stat_subset_size': 2,
+        'ignored': []
+    })
+
+    model = models.get('mobilenet-v2-pytorch', 'pytorch', tmp_path)
+    model = load_model(model.model_params)
+    data_loader = create_data_loader(engine_config, model)
+    statistics = []
+    for _ in range(2):
+        engine = create_engine(engine_config, data_loader=data_loader, metric=None)
+        collector = StatisticsCollector(engine)
+        MinMaxQuantization(minmax_config, engine).register_statistics(model, collector)
+        collector.compute_statistics(model)
+        statistics.append(collector.get_statistics_for_algorithm('MinMaxQuantization'))
+
+    assert engine.activation_cache.misses == 0
+    assert engine.activation_cache.hits == 2
+    for node_name, node_stats in statistics[0].items():
+        for stat_name, stat_values in node_stats.items():
+            for value, cached_value in zip(stat_values, statistics[1][node_name][stat_name]):
+                assert np.array_equal(value, cached_value)
+
+
+def test_statistics_collector_activation_cache_layouts(tmp_path, models):
+    with open(PATHS2DATASETS_CONFIG.as_posix()) as f:
+        data_source = Dict(json.load(f))['ImageNet2012'].pop('source_dir')
+
+    engine_config = Dict({'type': 'simplified',
+                          'data_source': '{}/{}'.format(data_source, 'ILSVRC2012_val*'),
+                          'device': 'CPU',
+                          'activation_cache_dir': (tmp_path / 'activation_cache').as_posix()})
+    algo_config = Dict({
+        'target_device': 'CPU',
+        'preset': 'performance',
+        'stat_subset_size': 2,
+        'ignored': []
+    })
+
+    model = models.get('mobilenet-v2-pytorch', 'pytorch', tmp_path)
+    model = load_model(model.model_params)
+    data_loader = create_data_loader(engine_config, model)
+    engine = create_engine(engine_config, data_loader=data_loader, metric=None)
+    collector = StatisticsCollector(engine)
+    MinMaxQuantization(algo_config, engine).register_statistics(model, collector)
+    BiasCorrection(algo_config, engine).register_statistics(model, collector)
+    collector.compute_statistics(model)
+    reference = collector.get_statistics_for_algorithm('MinMaxQuantization')
+
+    # Statistics of a subset of the layers are read from the cache
+    engine = create_engine(engine_config, data_loader=data_loader, metric=None)
+    collector = StatisticsCollector(engine)
+    MinMaxQuantization(algo_config, engine).register_statistics(model, collector)
+    collector.compute_statistics(model)
+
+    assert engine.activation_cache.misses == 0
+    assert engine.activation_cache.hits == 2
+    for node_name, node_stats in collector.get_statistics_for_algorithm('MinMaxQuantization').items():
+        for stat_name, stat_values in node_stats.items():
+            for value, reference_value in zip(stat_values, reference[node_name][stat_name]):
+                assert np.array_equal(value, reference_value)
+
+
+def test_activation_cache_size_budget(tmp_path):
+    value = np.ones((256, 256), dtype=np.float32)
+    cache = ActivationCache(tmp_path.as_posix(), max_size_mb=0.3)
+    cache.put('model', {'output': value}, (0,), 1.)
+    cache.put('model', {'output': value * 2}, (1,), 1.)
+    assert cache.get('model', [['output']], (0,)) is None
+    assert np.array_equal(cache.get('model', [['output']], (1,))[0]['output'], value * 2)
+    assert cache.get('other_model', [['output']], (1,)) is None
+    assert cache.get('model', [['other_output']], (1,)) is None
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert cache.time_saved > 0
+
+    cache = ActivationCache(tmp_path.as_posix(), max_size_mb=0.3)
+    assert cache.get('model', [['output']], (1,)) is not None
+
+
+def test_activation_cache_shared_outputs(tmp_path):
+    cache = ActivationCache(tmp_path.as_posix())
+    batch = ([(0, 'label')], [{'shape': (1, 3)}])
+    cache.put('model', {'conv': np.zeros(4), 'min_conv': np.ones(1)}, (0,), 1., batch)
+    cache.put('model', {'conv': np.full(4, 5.), 'relu': np.full(2, 2.)}, (0,), 1., batch)
+
+    # Stored outputs are kept, outputs are found by any of their names
+    outputs, cached_batch = cache.get('model', [['conv'], ['other_name', 'relu']], (0,))
+    assert np.array_equal(outputs['conv'], np.zeros(4))
+    assert np.array_equal(outputs['other_name'], np.full(2, 2.))
+    assert cached_batch == batch
+    assert cache.get('model', [['conv'], ['max_conv']], (0,)) is None
+
+
+def test_activation_cache_unpicklable_batch(tmp_path):
+    cache = ActivationCache(tmp_path.as_posix())
+    cache.put('model', {'conv': np.zeros(4)}, (0,), 1., ([(0, 'label')], [{'fn': lambda: None}]))
+
+    assert cache.get('model', [['conv']], (0,)) is None
+    assert not [name for _, _, names in os.walk(tmp_path.as_posix()) for name in names]
+
+
+def test_activation_cache_stat_output_signatures():
+    def inplace_min(granularity, channel):
+        return TensorStatistic(np.min, inplace_statistics=True, type='min', granularity=granularity,
+                               channel=channel, layer_stat_name='min_conv')
+
+    signatures = [IEEngine._get_stat_output_signatures({'conv': {stat: stat}})['min_conv']
+                  for stat in (inplace_min('pertensor', {}), inplace_min('perchannel', {'out': 1}),
+                               inplace_min('perchannel', {'out': 0}), inplace_min('pertensor', {}))]
+    assert len(set(signatures[:3])) == 3
+    assert signatures[0] == signatures[3]
+
+    raw_stat = TensorStatistic(np.min, type='min', granularity='pertensor')
+    assert IEEngine._get_stat_output_signatures({'conv': {raw_stat: raw_stat}}) == {}
@@ -5,8 +5,10 @@ import numpy as np
 import pytest
 
 from openvino.tools.pot.statistics.function_selector import AGGREGATION_FN, ACTIVATIONS_STATS_FN, WEIGHTS_STATS_FN, \
-    get_aggregation_function, get_stats_function_for_activations, get_stats_function_for_weights, PERCHANNEL, PERTENSOR
+    AGGREGATION_ACCUMULATORS, get_aggregation_function, get_aggregation_accumulator, \
+    get_stats_function_for_activations, get_stats_function_for_weights, PERCHANNEL, PERTENSOR
 
+from openvino.tools.pot.statistics.functions.aggregation import hodges_lehmann_mean
 from openvino.tools.pot.algorithms.quantization.fake_quantize import get_num_levels
 
 INPUT_SHAPES = [(2, 2, 1), (2, 2, 2)]
@@ -51,6 +53,75 @@ def test_aggregation_function(name):
         np.testing.assert_almost_equal(result, expected)
 
 
+HL_ESTIMATOR_INPUTS = [
+    np.random.RandomState(0).normal(size=(50, 3, 7)).astype(np.float32),
+    np.random.RandomState(1).randint(0, 5, (40, 2, 4)).astype(np.float32),
+    np.random.RandomState(2).standard_cauchy((61, 1, 5)),
+    np.random.RandomState(3).normal(size=(31, 1)).astype(np.float32),
+]
+
+
+@pytest.mark.parametrize('input_tensor', HL_ESTIMATOR_INPUTS, ids=['normal', 'ties', 'cauchy', 'pertensor'])
+def test_hodges_lehmann_mean(input_tensor):
+    def reference(x):
+        sums = np.add.outer(x, x)[np.tril_indices(len(x), -1)]
+        return 0.5 * np.median(sums)
+
+    if len(input_tensor.shape) == 3:
+        expected = [reference(input_tensor[:, :, i].flatten()) for i in range(input_tensor.shape[2])]
+    else:
+        expected = reference(input_tensor.flatten())
+    result = hodges_lehmann_mean(input_tensor)
+    assert result.dtype == input_tensor.dtype
+    np.testing.assert_array_equal(result, np.array(expected, dtype=input_tensor.dtype))
+
+
+@pytest.mark.parametrize(
+    'name', AGGREGATION_ACCUMULATORS.registry_dict.keys(),
+    ids=list(AGGREGATION_ACCUMULATORS.registry_dict.keys()))
+def test_aggregation_accumulator(name):
+    for i, input_tensor in enumerate(AGG_INPUTS):
+        accumulator = get_aggregation_accumulator(name)(name, accuracy=1e-3)
+        for value in input_tensor:
+            accumulator.update(value)
+        expected = GOLD_VALUES_AGGREGATION_FUNCTIONS[i][name]
+        np.testing.assert_almost_equal(accumulator.result(), expected, decimal=2)
+
+
+@pytest.mark.parametrize(
+    'name', AGGREGATION_ACCUMULATORS.registry_dict.keys(),
+    ids=list(AGGREGATION_ACCUMULATORS.registry_dict.keys()))
+def test_aggregation_accumulator_merge(name):
+    samples = np.random.RandomState(0).normal(1, 3, (200, 4, 8)).astype(np.float32)
+    accumulator_cls = get_aggregation_accumulator(name)
+    accumulator, other = accumulator_cls(name, accuracy=1e-3), accumulator_cls(name, accuracy=1e-3)
+    for value in samples[:120]:
+        accumulator.update(value)
+    for value in samples[120:]:
+        other.update(value)
+    accumulator.merge(other)
+
+    result = accumulator.result()
+    expected = get_aggregation_function(name)(samples)
+    assert result.shape == expected.shape
+    assert result.dtype == expected.dtype
+    tolerance = 1e-2 if accumulator_cls.approximate else 1e-5
+    np.testing.assert_allclose(result, expected, atol=tolerance)
+
+
+
+def test_quantile_sketch_sparse_counts():
+    # channels span different decades, so a dense count vector per bucket would hold mostly zeros
+    samples = np.random.RandomState(0).lognormal(0, 1, (300, 1, 16)) * np.logspace(-4, 4, 16)
+    accumulator = get_aggregation_accumulator('hl_estimator')('hl_estimator', accuracy=1e-2)
+    for value in samples:
+        accumulator.update(value)
+
+    num_buckets = np.ptp(np.log(samples), axis=(0, 1)) / np.log(accumulator.gamma) + 1
+    assert len(accumulator.counts) <= np.sum(np.minimum(num_buckets, len(samples)))
+    expected = get_aggregation_function('hl_estimator')(samples)
+    np.testing.assert_allclose(accumulator.result(), expected, rtol=2e-2)
+
 INPUT_SHAPE = (2, 2, 2, 2)
 INPUT = np.reshape(np.array(range(np.prod(INPUT_SHAPE)), dtype=np.float32), INPUT_SHAPE)
 